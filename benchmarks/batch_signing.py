@@ -0,0 +1,78 @@
+"""Batch payment signing throughput per EVM signer backend.
+
+Signs exact-scheme payments through :class:`~x402_openai.wallets.BatchSigner`
+in batches of 1, 16 and 256 and reports payments signed per second on one
+core, next to the one-at-a-time path an x402 client takes
+(``create_payment_payload``).  Runs offline with a throwaway key.
+
+Usage: python benchmarks/batch_signing.py [--seconds 2] [--sizes 1,16,256]
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import os
+import time
+
+from eth_account import Account
+from x402.schemas import PaymentRequirements
+
+from x402_openai.wallets import BatchSigner, EvmWallet
+
+_USDC_BASE = "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913"
+
+_REQUIREMENTS = PaymentRequirements(
+    scheme="exact",
+    network="eip155:8453",
+    asset=_USDC_BASE,
+    amount="10000",
+    pay_to="0x" + os.urandom(20).hex(),
+    max_timeout_seconds=300,
+    extra={"name": "USD Coin", "version": "2"},
+)
+
+
+def bench(backend: str, size: int, seconds: float) -> float:
+    """Return payments signed per second in batches of *size* (``0``: one by one)."""
+    signer = BatchSigner(
+        [EvmWallet(private_key=Account.create().key.hex(), signer_backend=backend)]
+    )
+    scheme = signer.schemes["eip155:*"]["exact"]
+
+    count = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+    while time.perf_counter() < deadline:
+        if size:
+            count += len(signer.sign(_REQUIREMENTS, size))
+        else:
+            scheme.create_payment_payload(_REQUIREMENTS)
+            count += 1
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=2.0, help="duration per measurement")
+    parser.add_argument("--sizes", default="1,16,256", help="comma-separated batch sizes")
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    backends = ["eth_account"]
+    if importlib.util.find_spec("coincurve") is not None:
+        backends.append("coincurve")
+
+    for backend in backends:
+        single = bench(backend, 0, args.seconds)
+        print(f"{backend:<12} single     {single:>10,.0f} payments/s/core")
+        for size in sizes:
+            rate = bench(backend, size, args.seconds)
+            label = f"batch {size}"
+            print(
+                f"{backend:<12} {label:<10} {rate:>10,.0f} payments/s/core  ({rate / single:.2f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""EVM payment signing throughput per signer backend.
+
+Signs EIP-3009 ``TransferWithAuthorization`` payloads the way the exact
+scheme does and reports payments signed per second on one core, then the
+per-payment EIP-712 hashing cost with and without the memoised domain
+separator and type hash.  Runs offline with a throwaway key.
+
+Usage: python benchmarks/evm_signing.py [--seconds 2]
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import os
+import time
+from typing import Any
+
+from eth_account import Account
+from x402.mechanisms.evm.eip712 import build_typed_data_for_signing
+from x402.mechanisms.evm.types import ExactEIP3009Authorization, TypedDataField
+
+from x402_openai.wallets import _eip712
+from x402_openai.wallets._evm_signers import create_signer
+
+_USDC_BASE = "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913"
+
+
+def _typed_data(address: str) -> tuple[Any, ...]:
+    authorization = ExactEIP3009Authorization(
+        from_address=address,
+        to="0x" + os.urandom(20).hex(),
+        value="10000",
+        valid_after="0",
+        valid_before=str(int(time.time()) + 600),
+        nonce="0x" + os.urandom(32).hex(),
+    )
+    domain, types, primary, message = build_typed_data_for_signing(
+        authorization, 8453, _USDC_BASE, "USD Coin", "2"
+    )
+    fields = {
+        k: [TypedDataField(name=f["name"], type=f["type"]) for f in v] for k, v in types.items()
+    }
+    return domain, fields, primary, message
+
+
+def bench(backend: str, seconds: float) -> float:
+    """Return payments signed per second with *backend*."""
+    account = Account.create()
+    signer = create_signer(account, backend)
+    payloads = [_typed_data(account.address) for _ in range(256)]
+
+    count = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+    while time.perf_counter() < deadline:
+        signer.sign_typed_data(*payloads[count % len(payloads)])
+        count += 1
+    return count / (time.perf_counter() - start)
+
+
+def bench_hashing(seconds: float, *, cached: bool) -> float:
+    """Return microseconds per payment spent on EIP-712 hashing."""
+    domain, types, primary, message = _typed_data(Account.create().address)
+    fields = tuple((f.name, f.type) for f in types[primary])
+    values = (domain.name, domain.version, domain.chain_id, domain.verifying_contract)
+
+    count = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+    while time.perf_counter() < deadline:
+        if not cached:
+            _eip712.type_hash.cache_clear()
+            _eip712.domain_separator.cache_clear()
+        separator = _eip712.domain_separator(*values)
+        _eip712.signing_digest(separator, _eip712.struct_hash(primary, fields, message))
+        count += 1
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=2.0, help="duration per backend")
+    args = parser.parse_args()
+
+    backends = ["eth_account"]
+    if importlib.util.find_spec("coincurve") is not None:
+        backends.append("coincurve")
+
+    baseline = None
+    for backend in backends:
+        rate = bench(backend, args.seconds)
+        baseline = baseline or rate
+        print(f"{backend:<12} {rate:>10,.0f} payments/s/core  ({rate / baseline:.1f}x)")
+
+    uncached = bench_hashing(args.seconds, cached=False)
+    cached = bench_hashing(args.seconds, cached=True)
+    print(f"eip712 hash  {uncached:>10.1f} us/payment uncached")
+    print(f"eip712 hash  {cached:>10.1f} us/payment cached  ({uncached / cached:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Throughput and latency through the paying proxy versus in-process payment.
+
+Starts the stand-in gateway and a paying proxy (``python -m x402_openai``
+with a throwaway EVM key) in child processes, then drives paid chat
+completions at a fixed concurrency either directly with ``AsyncX402OpenAI``
+or with a plain ``openai.AsyncOpenAI`` pointed at the proxy.  Streaming runs
+report the time to the first SSE event.
+
+Usage: python benchmarks/paying_proxy.py [--concurrency 16] [--seconds 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import httpx
+import openai
+from eth_account import Account
+
+from x402_openai import AsyncX402OpenAI
+from x402_openai._standin import StandInGateway
+from x402_openai.wallets import EvmWallet
+
+
+async def bench(
+    client: openai.AsyncOpenAI, concurrency: int, seconds: float, *, stream: bool
+) -> tuple[float, list[float]]:
+    """Return requests per second and per-request latencies (to the first event)."""
+    latencies: list[float] = []
+    stop = time.perf_counter() + seconds
+
+    async def worker() -> None:
+        while time.perf_counter() < stop:
+            began = time.perf_counter()
+            if stream:
+                events = await client.chat.completions.create(
+                    model="stand-in", messages=[{"role": "user", "content": "hi"}], stream=True
+                )
+                first = None
+                async for _ in events:
+                    first = first or time.perf_counter()
+                latencies.append((first or time.perf_counter()) - began)
+            else:
+                await client.chat.completions.create(
+                    model="stand-in", messages=[{"role": "user", "content": "hi"}]
+                )
+                latencies.append(time.perf_counter() - began)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return len(latencies) / (time.perf_counter() - start), latencies
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+def _start_proxy(upstream: str, key: str) -> tuple[subprocess.Popen[bytes], str]:
+    port = _free_port()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "x402_openai", "--port", str(port), "--upstream", upstream],
+        env={**os.environ, "EVM_PRIVATE_KEY": key},
+        stderr=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{port}/v1"
+    for _ in range(100):
+        try:
+            httpx.get(url + "/models", timeout=1.0)
+            return process, url
+        except httpx.TransportError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("paying proxy did not start")
+
+
+def _report(label: str, rate: float, latencies: list[float]) -> None:
+    ordered = sorted(latencies) or [0.0]
+    p50 = ordered[len(ordered) // 2]
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(f"{label:<22} {rate:>8,.0f} req/s  p50 {p50 * 1e3:6.1f} ms  p99 {p99 * 1e3:6.1f} ms")
+
+
+async def run(base_url: str, proxy_url: str, key: str, args: argparse.Namespace) -> None:
+    direct = AsyncX402OpenAI(wallet=EvmWallet(private_key=key), base_url=base_url, max_retries=0)
+    proxied = openai.AsyncOpenAI(api_key="x402", base_url=proxy_url, max_retries=0)
+    for stream in (False, True):
+        for label, client in (("in-process", direct), ("via proxy", proxied)):
+            await bench(client, args.concurrency, 0.5, stream=stream)  # warm up
+            rate, latencies = await bench(client, args.concurrency, args.seconds, stream=stream)
+            _report(f"{label} {'stream' if stream else 'json'}", rate, latencies)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--seconds", type=float, default=3.0, help="duration per run")
+    args = parser.parse_args()
+
+    key = Account.create().key.hex()
+    with StandInGateway() as base_url:
+        process, proxy_url = _start_proxy(base_url, key)
+        try:
+            asyncio.run(run(base_url, proxy_url, key, args))
+        finally:
+            process.terminate()
+            process.wait()
+
+
+if __name__ == "__main__":
+    main()
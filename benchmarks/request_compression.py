@@ -0,0 +1,98 @@
+"""Bytes on the wire and latency of large paid requests, with and without compression.
+
+Sends chat completions with a large prompt through ``X402Transport`` to the
+local stand-in gateway (child process), once uncompressed and once per
+available encoding.  Each request makes the unpaid attempt and the paid
+retry; the paid retry reuses the compressed body.  Loopback has no
+bandwidth limit, so the latency column mostly shows the compression cost;
+divide the byte savings by your uplink bandwidth for the network gain.
+
+Usage: python benchmarks/request_compression.py [--prompt-kib 256] [--requests 50]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import time
+
+import httpx
+from eth_account import Account
+
+from x402_openai import RequestCompressor, X402Transport
+from x402_openai._standin import StandInGateway
+from x402_openai._wallet import create_x402_http_client
+from x402_openai.wallets import EvmWallet
+
+
+class _WireCounter(httpx.BaseTransport):
+    """Count request body bytes handed to the network."""
+
+    def __init__(self) -> None:
+        self.inner = httpx.HTTPTransport()
+        self.bytes = 0
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self.bytes += len(request.content)
+        return self.inner.handle_request(request)
+
+
+def _prompt(kib: int) -> str:
+    """Return roughly *kib* KiB of chat-like text (repetitive, like real transcripts)."""
+    words = [os.urandom(3).hex() for _ in range(400)]
+    text = []
+    size = 0
+    i = 0
+    while size < kib * 1024:
+        sentence = " ".join(words[(i * 7 + j) % len(words)] for j in range(12)) + ". "
+        text.append(sentence)
+        size += len(sentence)
+        i += 1
+    return "".join(text)
+
+
+def bench(
+    base_url: str, compressor: RequestCompressor | None, body: dict[str, object], n: int
+) -> tuple[float, float]:
+    """Return (KiB on the wire per request, ms per request)."""
+    wire = _WireCounter()
+    x402 = create_x402_http_client(wallet=EvmWallet(private_key=Account.create().key.hex()))
+    transport = X402Transport(x402, inner=wire, compressor=compressor)
+    with httpx.Client(transport=transport, timeout=60) as client:
+        client.post(base_url + "/chat/completions", json=body)  # warm up
+        wire.bytes = 0
+        start = time.perf_counter()
+        for _ in range(n):
+            client.post(base_url + "/chat/completions", json=body).raise_for_status()
+        elapsed = time.perf_counter() - start
+    return wire.bytes / n / 1024, elapsed / n * 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--prompt-kib", type=int, default=256)
+    parser.add_argument("--requests", type=int, default=50)
+    args = parser.parse_args()
+
+    body: dict[str, object] = {
+        "model": "stand-in",
+        "messages": [{"role": "user", "content": _prompt(args.prompt_kib)}],
+    }
+    print(f"request body {len(json.dumps(body)) / 1024:,.0f} KiB, unpaid attempt + paid retry")
+
+    configs: list[tuple[str, RequestCompressor | None]] = [("none", None)]
+    for encoding in ("gzip", "zstd"):
+        try:
+            configs.append((encoding, RequestCompressor(encoding=encoding)))
+        except ImportError:
+            print(f"{encoding:<5} not available")
+
+    with StandInGateway() as base_url:
+        for name, compressor in configs:
+            kib, ms = bench(base_url, compressor, body, args.requests)
+            print(f"{name:<5} {kib:>9,.1f} KiB/request on the wire  {ms:>7.1f} ms/request")
+
+
+if __name__ == "__main__":
+    main()
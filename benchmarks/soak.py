@@ -0,0 +1,215 @@
+"""Long-running soak test with memory and handle-leak detection.
+
+Drives a mix of paid and free, streaming and non-streaming (and abandoned
+streaming) requests through one ``AsyncX402OpenAI`` against the stand-in
+gateway in a child process, and samples the process over time:
+
+- resident set size;
+- ``tracemalloc`` traced memory (with a top-allocations diff on failure);
+- open file descriptors and sockets;
+- asyncio task count.
+
+After a warm-up, the first sample is the baseline; the run fails (exit
+status 1) if the last sample grew past any threshold.  Leaks such as
+unclosed ``402`` responses, stream wrappers that never release, or request
+bodies retained by the paid-retry path show up as steady growth.
+
+Usage: python benchmarks/soak.py [--requests 1000000] [--concurrency 32]
+           [--interval 10] [--samples soak.jsonl] [--max-rss-growth-mib 32]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import gc
+import json
+import os
+import resource
+import sys
+import time
+import tracemalloc
+from typing import IO, Any
+
+from eth_account import Account
+
+from x402_openai import AsyncX402OpenAI
+from x402_openai._standin import StandInGateway
+from x402_openai.wallets import EvmWallet
+
+# Request mix, cycled through by every worker.
+_MIX = ("paid", "paid-stream", "free", "paid", "abandoned-stream", "free")
+
+
+def _rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        # Peak, not current, RSS — still catches monotonic growth.
+        scale = 1 if sys.platform == "darwin" else 1024
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+def _descriptors() -> tuple[int, int]:
+    """Return the number of open file descriptors and, of those, sockets."""
+    fd_dir = "/proc/self/fd" if os.path.isdir("/proc/self/fd") else "/dev/fd"
+    fds = sockets = 0
+    for name in os.listdir(fd_dir):
+        fds += 1
+        with contextlib.suppress(OSError):
+            sockets += os.readlink(os.path.join(fd_dir, name)).startswith("socket:")
+    return fds, sockets
+
+
+def sample(done: int) -> dict[str, Any]:
+    """Return one measurement of the current process."""
+    gc.collect()
+    fds, sockets = _descriptors()
+    # tracemalloc's own bookkeeping grows with the traced heap; leave it out.
+    overhead = tracemalloc.get_tracemalloc_memory() if tracemalloc.is_tracing() else 0
+    return {
+        "t": time.monotonic(),
+        "requests": done,
+        "rss": _rss_bytes() - overhead,
+        "heap": tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0,
+        "fds": fds,
+        "sockets": sockets,
+        "tasks": len(asyncio.all_tasks()),
+    }
+
+
+async def _one(client: AsyncX402OpenAI, kind: str) -> None:
+    messages: Any = [{"role": "user", "content": "hi"}]
+    if kind == "free":
+        await client.models.list()
+    elif kind == "paid":
+        await client.chat.completions.create(model="stand-in", messages=messages)
+    else:
+        stream = await client.chat.completions.create(
+            model="stand-in", messages=messages, stream=True
+        )
+        async with stream:
+            async for _ in stream:
+                if kind == "abandoned-stream":
+                    break  # Closing early must release the connection and slot.
+
+
+class Soak:
+    """Run the request mix and collect samples."""
+
+    def __init__(self, client: AsyncX402OpenAI, args: argparse.Namespace) -> None:
+        self.client = client
+        self.args = args
+        self.done = 0
+        self.errors = 0
+        self.samples: list[dict[str, Any]] = []
+
+    async def run(self, total: int, out: IO[str] | None) -> None:
+        remaining = iter(range(total))
+
+        async def worker(offset: int) -> None:
+            for i in remaining:
+                try:
+                    await _one(self.client, _MIX[(i + offset) % len(_MIX)])
+                except Exception as exc:
+                    self.errors += 1
+                    if self.errors <= 5:
+                        print(f"request failed: {exc!r}", file=sys.stderr)
+                self.done += 1
+
+        async def sampler() -> None:
+            while True:
+                await asyncio.sleep(self.args.interval)
+                self.record(out)
+
+        monitor = asyncio.create_task(sampler())
+        await asyncio.gather(*(worker(n) for n in range(self.args.concurrency)))
+        monitor.cancel()
+        self.record(out)
+
+    def record(self, out: IO[str] | None) -> None:
+        point = sample(self.done)
+        self.samples.append(point)
+        if out is not None:
+            out.write(json.dumps(point) + "\n")
+            out.flush()
+        print(
+            f"{self.done:>10,} req  rss {point['rss'] / 2**20:7.1f} MiB  "
+            f"heap {point['heap'] / 2**20:7.1f} MiB  fds {point['fds']:>4}  "
+            f"sockets {point['sockets']:>4}  tasks {point['tasks']:>3}  errors {self.errors}"
+        )
+
+
+def check(baseline: dict[str, Any], last: dict[str, Any], args: argparse.Namespace) -> list[str]:
+    """Return the thresholds *last* exceeds relative to *baseline*."""
+    limits = {
+        "rss": args.max_rss_growth_mib * 2**20,
+        "heap": args.max_heap_growth_mib * 2**20,
+        "fds": args.max_fd_growth,
+        "sockets": args.max_fd_growth,
+        "tasks": args.max_task_growth,
+    }
+    return [
+        f"{name} grew by {last[name] - baseline[name]:,} (limit {limit:,})"
+        for name, limit in limits.items()
+        if last[name] - baseline[name] > limit
+    ]
+
+
+async def soak(base_url: str, args: argparse.Namespace, out: IO[str] | None) -> list[str]:
+    wallet = EvmWallet(private_key=Account.create().key.hex())
+    async with AsyncX402OpenAI(wallet=wallet, base_url=base_url, max_retries=0) as client:
+        runner = Soak(client, args)
+        await runner.run(args.warmup, None)
+        # Snapshot first: it holds a copy of every trace, which counts in RSS.
+        snapshot = tracemalloc.take_snapshot() if tracemalloc.is_tracing() else None
+        print(f"baseline after {args.warmup:,} warm-up requests:")
+        runner.record(None)
+        baseline = runner.samples.pop()
+
+        await runner.run(args.requests, out)
+        failures = check(baseline, runner.samples[-1], args)
+        if runner.errors:
+            failures.append(f"{runner.errors:,} requests failed")
+        if failures and snapshot is not None:
+            print("top allocation growth:")
+            for stat in tracemalloc.take_snapshot().compare_to(snapshot, "lineno")[:10]:
+                print(f"  {stat}")
+        return failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=1_000_000)
+    parser.add_argument("--warmup", type=int, default=2_000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--interval", type=float, default=10.0, help="seconds between samples")
+    parser.add_argument("--samples", help="append samples as JSON lines to this file")
+    parser.add_argument("--no-tracemalloc", action="store_true", help="faster, no heap data")
+    parser.add_argument("--max-rss-growth-mib", type=float, default=32.0)
+    parser.add_argument("--max-heap-growth-mib", type=float, default=8.0)
+    parser.add_argument("--max-fd-growth", type=int, default=8)
+    parser.add_argument("--max-task-growth", type=int, default=4)
+    args = parser.parse_args()
+
+    if not args.no_tracemalloc:
+        tracemalloc.start()
+    with StandInGateway() as base_url:
+        out = open(args.samples, "a", encoding="utf-8") if args.samples else None  # noqa: SIM115
+        try:
+            failures = asyncio.run(soak(base_url, args, out))
+        finally:
+            if out is not None:
+                out.close()
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if failures:
+        sys.exit(1)
+    print("OK: no growth beyond thresholds")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Paid-request throughput of the sync client from 1 to N threads.
+
+Every thread shares one ``X402OpenAI`` (one transport, one x402 client,
+one wallet) and sends non-streaming chat completions to a local stand-in
+gateway running in a child process; each request goes through the full
+402 → sign → paid retry flow with a throwaway EVM key.  Run it on a regular
+and on a free-threaded (``python3.13t``) interpreter to compare scaling.
+
+Usage: python benchmarks/thread_scaling.py [--max-threads 16] [--seconds 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import threading
+import time
+
+from eth_account import Account
+
+from x402_openai import X402OpenAI
+from x402_openai._standin import StandInGateway
+from x402_openai.wallets import EvmWallet
+
+
+def bench(client: X402OpenAI, threads: int, seconds: float) -> float:
+    """Return paid requests per second with *threads* concurrent callers."""
+    counts = [0] * threads
+    stop = threading.Event()
+
+    def worker(index: int) -> None:
+        while not stop.is_set():
+            client.chat.completions.create(
+                model="stand-in", messages=[{"role": "user", "content": "hi"}]
+            )
+            counts[index] += 1
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    start = time.perf_counter()
+    for w in workers:
+        w.start()
+    time.sleep(seconds)
+    stop.set()
+    for w in workers:
+        w.join()
+    return sum(counts) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-threads", type=int, default=16)
+    parser.add_argument("--seconds", type=float, default=3.0, help="duration per step")
+    args = parser.parse_args()
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"python {sys.version.split()[0]}  GIL {'enabled' if gil else 'disabled'}")
+
+    wallet = EvmWallet(private_key=Account.create().key.hex())
+    with StandInGateway() as base_url:
+        client = X402OpenAI(wallet=wallet, base_url=base_url, max_retries=0)
+        bench(client, 1, 0.5)  # warm up connections and caches
+
+        baseline = None
+        threads = 1
+        while threads <= args.max_threads:
+            rate = bench(client, threads, args.seconds)
+            baseline = baseline or rate
+            print(f"{threads:>3} threads {rate:>9,.0f} paid req/s  ({rate / baseline:.1f}x)")
+            threads *= 2
+
+
+if __name__ == "__main__":
+    main()
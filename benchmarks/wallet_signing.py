@@ -0,0 +1,238 @@
+"""Payment construction cost per wallet adapter, independent of HTTP.
+
+Registers each wallet adapter on a fresh ``x402ClientSync`` and builds
+payments for synthetic exact-scheme requirements through
+``create_payment_payload``, exactly as the transport does.  Reports, per
+adapter:
+
+- ``register_us`` — median cost of ``Wallet.register()`` (key derivation,
+  signer and scheme setup);
+- ``p50_us`` / ``p99_us`` — per-payment latency;
+- ``payments_per_s`` — single-threaded throughput;
+- ``peak_bytes`` / ``retained_bytes`` — memory allocated at the peak of
+  one payment and left allocated after it (``tracemalloc``).
+
+Uses fixed, well-known test keys and runs offline: Solana RPC reads (mint
+account, recent blockhash) are answered from memory.  Results are JSON, so
+runs on different Python versions or releases can be compared with
+``--baseline``.
+
+Usage: python benchmarks/wallet_signing.py [--seconds 2] [--output out.json]
+                                           [--baseline previous.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import importlib.metadata
+import importlib.util
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, cast
+
+from x402 import x402ClientSync
+from x402.schemas import PaymentRequired, PaymentRequirements
+
+from x402_openai.wallets import EvmWallet, SvmWallet
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from x402_openai.wallets import Wallet
+
+# Well-known development credentials (Hardhat / Anvil account 0) — never funded.
+_EVM_KEY = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+_MNEMONIC = "test test test test test test test test test test test junk"
+_SVM_SEED = bytes(range(32))
+
+_USDC_BASE = "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913"
+_USDC_SOLANA = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+_TOKEN_PROGRAM = "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"
+
+
+class _OfflineSolanaRpc:
+    """Answers the two RPC reads an SVM payment makes from memory."""
+
+    def __init__(self) -> None:
+        from solders.hash import Hash
+        from solders.pubkey import Pubkey
+
+        mint = bytearray(82)
+        mint[44] = 6  # decimals
+        mint[45] = 1  # initialised
+        self._mint = SimpleNamespace(
+            value=SimpleNamespace(owner=Pubkey.from_string(_TOKEN_PROGRAM), data=bytes(mint))
+        )
+        self._blockhash = SimpleNamespace(
+            value=SimpleNamespace(blockhash=Hash.new_unique(), last_valid_block_height=1000)
+        )
+
+    def get_account_info(self, pubkey: Any, *args: Any, **kwargs: Any) -> Any:
+        return self._mint
+
+    def get_latest_blockhash(self, *args: Any, **kwargs: Any) -> Any:
+        return self._blockhash
+
+
+class _OfflinePool:
+    """Stands in for :class:`~x402_openai.wallets.SolanaRpcPool`."""
+
+    def __init__(self) -> None:
+        self._rpc = _OfflineSolanaRpc()
+
+    def client(self, endpoint: str) -> Any:
+        return self._rpc
+
+
+def _evm_requirements() -> PaymentRequired:
+    return PaymentRequired(
+        accepts=[
+            PaymentRequirements(
+                scheme="exact",
+                network="eip155:8453",
+                asset=_USDC_BASE,
+                amount="10000",
+                pay_to="0x" + os.urandom(20).hex(),
+                max_timeout_seconds=300,
+                extra={"name": "USD Coin", "version": "2"},
+            )
+        ]
+    )
+
+
+def _svm_requirements() -> PaymentRequired:
+    from solders.keypair import Keypair
+
+    return PaymentRequired(
+        accepts=[
+            PaymentRequirements(
+                scheme="exact",
+                network="solana:5eykt4UsFv8P8NJdTREpY1vzqKqZKvdp",
+                asset=_USDC_SOLANA,
+                amount="10000",
+                pay_to=str(Keypair().pubkey()),
+                max_timeout_seconds=300,
+                extra={"feePayer": str(Keypair().pubkey())},
+            )
+        ]
+    )
+
+
+def _cases() -> dict[str, tuple[Callable[[], Wallet], Callable[[], PaymentRequired]]]:
+    cases: dict[str, tuple[Callable[[], Wallet], Callable[[], PaymentRequired]]] = {}
+    for backend in ("eth_account", "coincurve"):
+        if backend == "coincurve" and importlib.util.find_spec("coincurve") is None:
+            continue
+        cases[f"evm-key/{backend}"] = (
+            functools.partial(EvmWallet, private_key=_EVM_KEY, signer_backend=backend),
+            _evm_requirements,
+        )
+    cases["evm-mnemonic"] = (lambda: EvmWallet(mnemonic=_MNEMONIC), _evm_requirements)
+    if importlib.util.find_spec("solders") is not None:
+        from solders.keypair import Keypair
+
+        svm_key = str(Keypair.from_seed(_SVM_SEED))
+        pool = cast("Any", _OfflinePool())
+        cases["svm"] = (lambda: SvmWallet(private_key=svm_key, rpc_pool=pool), _svm_requirements)
+    return cases
+
+
+def measure(
+    make_wallet: Callable[[], Wallet],
+    make_requirements: Callable[[], PaymentRequired],
+    seconds: float,
+) -> dict[str, float]:
+    """Return the metrics of one adapter (see the module docstring)."""
+    register = []
+    for _ in range(5):
+        client = x402ClientSync()
+        wallet = make_wallet()
+        start = time.perf_counter()
+        wallet.register(client)
+        register.append(time.perf_counter() - start)
+
+    requirements = [make_requirements() for _ in range(64)]
+    client.create_payment_payload(requirements[0])  # warm up
+
+    latencies: list[float] = []
+    stop = time.perf_counter() + seconds
+    while time.perf_counter() < stop:
+        start = time.perf_counter()
+        client.create_payment_payload(requirements[len(latencies) % len(requirements)])
+        latencies.append(time.perf_counter() - start)
+
+    rounds = 50
+    peaks = 0
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    for i in range(rounds):
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        client.create_payment_payload(requirements[i % len(requirements)])
+        peaks += tracemalloc.get_traced_memory()[1] - current
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "register_us": statistics.median(register) * 1e6,
+        "p50_us": latencies[len(latencies) // 2] * 1e6,
+        "p99_us": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1e6,
+        "payments_per_s": len(latencies) / sum(latencies),
+        "peak_bytes": peaks / rounds,
+        "retained_bytes": (after - before) / rounds,
+    }
+
+
+def _environment() -> dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "gil": str(getattr(sys, "_is_gil_enabled", lambda: True)()),
+        "platform": platform.platform(),
+        "x402_openai": importlib.metadata.version("x402-openai"),
+        "x402": importlib.metadata.version("x402"),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=2.0, help="duration per adapter")
+    parser.add_argument("--output", help="write JSON results to this file")
+    parser.add_argument("--baseline", help="JSON results of an earlier run to compare with")
+    args = parser.parse_args()
+
+    results = {
+        name: measure(make_wallet, make_requirements, args.seconds)
+        for name, (make_wallet, make_requirements) in _cases().items()
+    }
+    report = {"environment": _environment(), "results": results}
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+    print(json.dumps(report["environment"]))
+    for name, metrics in results.items():
+        line = (
+            f"{name:<22} register {metrics['register_us']:>9.0f} us  "
+            f"p50 {metrics['p50_us']:>7.0f} us  p99 {metrics['p99_us']:>7.0f} us  "
+            f"{metrics['payments_per_s']:>7,.0f}/s  peak {metrics['peak_bytes'] / 1024:>6.1f} KiB"
+        )
+        if name in baseline:
+            line += f"  ({metrics['payments_per_s'] / baseline[name]['payments_per_s']:.2f}x)"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
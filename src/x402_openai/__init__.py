@@ -24,28 +24,61 @@ Public API:
 
 - :class:`X402OpenAI` / :class:`AsyncX402OpenAI` — recommended client classes.
 - :class:`X402Transport` / :class:`AsyncX402Transport` — low-level transports.
+- :class:`MemoryCache` / :class:`DiskCache` — opt-in paid-response caches.
+- :class:`RequestCompressor` — opt-in gzip/zstd request body compression.
+- :class:`AdaptiveLimiter` / :class:`AsyncAdaptiveLimiter` — AIMD concurrency limits.
+- :class:`EmbeddingBatcher` — opt-in cross-caller embedding micro-batching.
+- :class:`PaymentMetrics` — payment and transport metrics with Prometheus export.
+- :class:`RequirementsCache` — payment requirements shared by worker processes.
+- :class:`TrafficRecorder` — redacted traffic traces for :mod:`x402_openai.replay`.
+- :class:`WalletRegistry` / :class:`AsyncWalletRegistry` / :func:`use_wallet` —
+  per-request wallet routing for multi-tenant servers.
 - :func:`prefer_network` / :func:`prefer_scheme` / :func:`max_amount` — payment policies.
 - :mod:`x402_openai.wallets` — chain-specific wallet adapters.
 """
 
 from __future__ import annotations
 
+from x402_openai._batching import EmbeddingBatcher
+from x402_openai._cache import DiskCache, MemoryCache, ResponseCache
 from x402_openai._client import AsyncX402OpenAI, X402OpenAI
+from x402_openai._compression import RequestCompressor
+from x402_openai._concurrency import AdaptiveLimiter, AsyncAdaptiveLimiter
+from x402_openai._deadline import X402DeadlineExceeded
+from x402_openai._metrics import PaymentMetrics
+from x402_openai._recording import TrafficRecorder
+from x402_openai._requirements import RequirementsCache
+from x402_openai._routing import AsyncWalletRegistry, WalletRegistry, use_wallet
 from x402_openai._transport import AsyncX402Transport, X402Transport
 from x402_openai.wallets import EvmWallet, SvmWallet, Wallet
 
 __all__ = [
+    "AdaptiveLimiter",
+    "AsyncAdaptiveLimiter",
+    "AsyncWalletRegistry",
     "AsyncX402OpenAI",
     "AsyncX402Transport",
+    "DiskCache",
+    "EmbeddingBatcher",
     "EvmWallet",
+    "MemoryCache",
+    "PaymentMetrics",
+    "RequestCompressor",
+    "RequirementsCache",
+    "ResponseCache",
     "SvmWallet",
+    "TrafficRecorder",
     "Wallet",
+    "WalletRegistry",
+    "X402DeadlineExceeded",
     "X402OpenAI",
     "X402Transport",
     # Lazily re-exported from x402 SDK.
     "max_amount",
     "prefer_network",
     "prefer_scheme",
+    # Wallet routing.
+    "use_wallet",
 ]
 
 
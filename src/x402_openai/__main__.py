@@ -0,0 +1,10 @@
+"""Run the local paying proxy: ``python -m x402_openai`` (see :mod:`x402_openai.proxy`)."""
+
+from __future__ import annotations
+
+import contextlib
+
+from x402_openai.proxy import main
+
+with contextlib.suppress(KeyboardInterrupt):
+    main()
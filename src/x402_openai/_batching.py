@@ -0,0 +1,285 @@
+"""Cross-caller micro-batching of embedding requests.
+
+Many concurrent callers that each embed one or two inputs would otherwise
+pay one x402 round trip each.  :class:`EmbeddingBatcher` holds embedding
+requests for a short window, merges compatible ones (same URL, model,
+options, credentials and wallet) into a single upstream request, and splits the response back to
+every waiting caller.
+
+Only used by :class:`~x402_openai.AsyncX402Transport`; enable it through
+``AsyncX402OpenAI(embedding_batcher=EmbeddingBatcher(...))``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import httpx
+
+from x402_openai._deadline import DEADLINE_EXTENSION
+from x402_openai._routing import caller_identity
+from x402_openai._streams import replay_response
+
+logger = logging.getLogger(__name__)
+
+# Response headers that no longer describe a re-serialised, split body.
+_STALE_HEADERS = frozenset({"content-length", "content-encoding", "transfer-encoding"})
+
+SendFn = Callable[[httpx.Request], Awaitable[httpx.Response]]
+
+
+def _split_inputs(value: Any) -> tuple[str, list[Any]] | None:
+    """Normalise an embeddings ``input`` into ``(kind, items)``.
+
+    Returns ``None`` when the input shape cannot be batched safely.
+    """
+    if isinstance(value, str):
+        return "text", [value]
+    if not isinstance(value, list) or not value:
+        return None
+    if all(isinstance(v, str) for v in value):
+        return "text", list(value)
+    if all(isinstance(v, int) for v in value):
+        # A single pre-tokenised input.
+        return "tokens", [value]
+    if all(isinstance(v, list) and all(isinstance(t, int) for t in v) for v in value):
+        return "tokens", list(value)
+    return None
+
+
+class _Pending:
+    """One caller's share of a batch."""
+
+    __slots__ = ("future", "inputs")
+
+    def __init__(self, inputs: list[Any], future: asyncio.Future[httpx.Response]) -> None:
+        self.inputs = inputs
+        self.future = future
+
+
+class _Batch:
+    """Requests gathered under one compatibility key."""
+
+    __slots__ = ("items", "params", "request", "send", "size", "timer")
+
+    def __init__(self, request: httpx.Request, params: dict[str, Any], send: SendFn) -> None:
+        self.request = request
+        self.params = params
+        self.send = send
+        self.items: list[_Pending] = []
+        self.size = 0
+        self.timer: asyncio.TimerHandle | None = None
+
+
+class EmbeddingBatcher:
+    """Gather concurrent embedding calls into one paid upstream request.
+
+    A batch is flushed when it holds *max_batch_size* inputs or when
+    *max_wait* seconds have passed since its first request, whichever comes
+    first.  Requests whose body cannot be merged (unknown input shapes,
+    streaming bodies, non-JSON payloads) are sent through unchanged.
+
+    The ``usage`` block of each split response reports the usage of the
+    whole upstream batch.
+
+    Parameters
+    ----------
+    max_batch_size:
+        Maximum number of inputs per upstream request (default ``256``).
+    max_wait:
+        Maximum time in seconds a request waits for companions
+        (default ``0.005``).
+
+    Examples
+    --------
+    ::
+
+        from x402_openai import AsyncX402OpenAI, EmbeddingBatcher
+
+        client = AsyncX402OpenAI(
+            wallet=EvmWallet(private_key="0x…"),
+            embedding_batcher=EmbeddingBatcher(max_batch_size=128, max_wait=0.01),
+        )
+    """
+
+    __slots__ = ("_batches", "_max_batch_size", "_max_wait", "_tasks")
+
+    def __init__(self, *, max_batch_size: int = 256, max_wait: float = 0.005) -> None:
+        if max_batch_size < 1:
+            raise ValueError("'max_batch_size' must be at least 1.")
+        if max_wait < 0:
+            raise ValueError("'max_wait' must be non-negative.")
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait
+        self._batches: dict[str, _Batch] = {}
+        # Strong references to in-flight dispatches so they are not collected.
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    @staticmethod
+    def accepts(request: httpx.Request) -> bool:
+        """Return True if *request* targets the embeddings endpoint."""
+        return request.method == "POST" and request.url.path.rstrip("/").endswith("/embeddings")
+
+    async def submit(self, request: httpx.Request, send: SendFn) -> httpx.Response:
+        """Queue *request* for batching and return its share of the response.
+
+        *send* performs the actual (paid) upstream call for a merged request.
+        """
+        body = await request.aread()
+        try:
+            params = json.loads(body)
+        except ValueError:
+            return await send(request)
+        if not isinstance(params, dict):
+            return await send(request)
+
+        split = _split_inputs(params.get("input"))
+        if split is None:
+            return await send(request)
+        kind, inputs = split
+        if len(inputs) >= self._max_batch_size:
+            return await send(request)
+
+        rest = {k: v for k, v in params.items() if k != "input"}
+        # The merged request carries the first caller's headers and
+        # extensions, so only callers that would send the same ones may share it.
+        key = "\n".join(
+            (
+                str(request.url),
+                kind,
+                json.dumps(rest, sort_keys=True),
+                caller_identity(request),
+                repr(request.extensions.get(DEADLINE_EXTENSION)),
+            )
+        )
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[httpx.Response] = loop.create_future()
+
+        batch = self._batches.get(key)
+        if batch is not None and batch.size + len(inputs) > self._max_batch_size:
+            self._flush(key)
+            batch = None
+        if batch is None:
+            batch = _Batch(request, rest, send)
+            self._batches[key] = batch
+            batch.timer = loop.call_later(self._max_wait, self._flush, key)
+
+        batch.items.append(_Pending(inputs, future))
+        batch.size += len(inputs)
+        if batch.size >= self._max_batch_size:
+            self._flush(key)
+
+        return await future
+
+    def _flush(self, key: str) -> None:
+        """Detach the batch under *key* and dispatch it in the background."""
+        batch = self._batches.pop(key, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+        task = asyncio.get_running_loop().create_task(_dispatch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+
+async def _dispatch(batch: _Batch) -> None:
+    """Send one merged request and resolve every waiter."""
+    items = batch.items
+    try:
+        if len(items) == 1:
+            # Nothing to merge — forward the caller's request untouched.
+            response = await batch.send(batch.request)
+            _resolve(items[0].future, response)
+            return
+
+        merged = [inp for item in items for inp in item.inputs]
+        body = json.dumps({**batch.params, "input": merged}).encode()
+        headers = {k: v for k, v in batch.request.headers.items() if k.lower() != "content-length"}
+        upstream = httpx.Request(
+            batch.request.method,
+            batch.request.url,
+            headers=headers,
+            content=body,
+            extensions=dict(batch.request.extensions),
+        )
+        logger.debug("x402: embedding batch of %d inputs from %d callers", len(merged), len(items))
+        response = await batch.send(upstream)
+        try:
+            await response.aread()
+        finally:
+            await response.aclose()
+        _fan_out(items, response, upstream)
+    except asyncio.CancelledError:
+        for item in items:
+            item.future.cancel()
+        raise
+    except Exception as exc:
+        for item in items:
+            if not item.future.done():
+                item.future.set_exception(exc)
+
+
+def _fan_out(items: list[_Pending], response: httpx.Response, request: httpx.Request) -> None:
+    """Split a merged embeddings *response* across *items*."""
+    headers = [
+        (k, v) for k, v in response.headers.multi_items() if k.lower() not in _STALE_HEADERS
+    ]
+
+    payload: Any = None
+    if response.status_code == 200:
+        try:
+            payload = response.json()
+        except ValueError:
+            payload = None
+    data = payload.get("data") if isinstance(payload, dict) else None
+    if not isinstance(data, list):
+        # Errors (and anything unexpected) are replicated to every caller.
+        for item in items:
+            _resolve(item.future, replay_response(response.status_code, headers, response.content))
+        return
+
+    total = sum(len(item.inputs) for item in items)
+    if len(data) != total:
+        exc = httpx.DecodingError(
+            f"Embedding batch returned {len(data)} entries for {total} inputs.", request=request
+        )
+        for item in items:
+            _fail(item.future, exc)
+        return
+
+    by_index = {entry.get("index", i): entry for i, entry in enumerate(data)}
+    offset = 0
+    for item in items:
+        share = []
+        for local in range(len(item.inputs)):
+            entry = by_index.get(offset + local)
+            if entry is None:
+                break
+            share.append({**entry, "index": local})
+        offset += len(item.inputs)
+        if len(share) != len(item.inputs):
+            _fail(
+                item.future,
+                httpx.DecodingError(
+                    "Embedding batch response is missing an index.", request=request
+                ),
+            )
+            continue
+        content = json.dumps({**payload, "data": share}).encode()
+        _resolve(item.future, replay_response(200, headers, content))
+
+
+def _resolve(future: asyncio.Future[httpx.Response], response: httpx.Response) -> None:
+    if not future.done():
+        future.set_result(response)
+
+
+def _fail(future: asyncio.Future[httpx.Response], exc: Exception) -> None:
+    if not future.done():
+        future.set_exception(exc)
@@ -0,0 +1,368 @@
+"""Opt-in cache of paid responses for deterministic requests.
+
+Identical deterministic requests (embeddings, moderations, ``temperature=0``
+completions) return identical results, so paying for them again is pure
+waste.  A :class:`ResponseCache` stores successful responses keyed on a
+canonical hash of method, URL, body and caller identity (credential headers
+and the selected wallet, see :mod:`x402_openai._routing`); a hit is answered
+without touching the network or the wallet.
+
+Backends:
+
+- :class:`MemoryCache` — in-process LRU with TTL and size limits.
+- :class:`DiskCache` — on-disk store with TTL and size-based LRU eviction,
+  shareable between processes.
+
+Streamed (SSE) responses are captured as they are consumed and replayed as a
+single body on a hit; the ``openai`` SDK parses both identically.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import struct
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from x402_openai._routing import caller_identity
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+# Endpoints whose results depend only on the request body.
+_DETERMINISTIC_PATHS = ("/embeddings", "/moderations")
+
+# Text generation endpoints, deterministic only when sampling is disabled.
+_GENERATION_PATHS = ("/chat/completions", "/completions", "/responses")
+
+# Length prefix of the JSON metadata block in a disk cache entry.
+_META_LEN = struct.Struct(">I")
+
+
+def request_key(method: str, url: str, body: bytes, identity: str = "") -> str:
+    """Return a canonical hash of *method*, *url*, *body* and caller *identity*.
+
+    JSON bodies are canonicalised (sorted keys, compact separators) so that
+    key order and whitespace do not produce distinct keys.  *identity* is
+    typically :func:`~x402_openai._routing.caller_identity`.
+    """
+    try:
+        canonical = json.dumps(
+            json.loads(body), sort_keys=True, separators=(",", ":"), ensure_ascii=False
+        ).encode()
+    except ValueError:
+        canonical = body
+    digest = hashlib.sha256()
+    digest.update(method.upper().encode())
+    digest.update(b"\n")
+    digest.update(url.encode())
+    digest.update(b"\n")
+    digest.update(canonical)
+    digest.update(b"\n")
+    digest.update(identity.encode())
+    return digest.hexdigest()
+
+
+def is_deterministic(path: str, body: bytes) -> bool:
+    """Return True if a JSON POST of *body* to *path* is deterministic.
+
+    Only an allowlist of endpoints qualifies: embeddings and moderations
+    always, chat completions, completions and responses only with an
+    explicit ``temperature`` of ``0`` and a single choice.  Everything else
+    (including resource-creating endpoints such as ``/batches``) does not.
+    """
+    path = path.rstrip("/")
+    if path.endswith(_DETERMINISTIC_PATHS):
+        generation = False
+    elif path.endswith(_GENERATION_PATHS):
+        generation = True
+    else:
+        return False
+    try:
+        params = json.loads(body)
+    except ValueError:
+        return False
+    if not isinstance(params, dict):
+        return False
+    if generation:
+        return params.get("temperature") == 0 and params.get("n", 1) == 1
+    return True
+
+
+class CachedResponse:
+    """A stored response: status, raw headers and raw (encoded) body."""
+
+    __slots__ = ("content", "headers", "status_code", "stored_at")
+
+    def __init__(
+        self,
+        status_code: int,
+        headers: list[tuple[str, str]],
+        content: bytes,
+        stored_at: float | None = None,
+    ) -> None:
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.stored_at = time.time() if stored_at is None else stored_at
+
+
+class ResponseCache(ABC):
+    """Base class for response cache backends.
+
+    Subclasses implement :meth:`_load`, :meth:`_store` and :meth:`_delete`;
+    this class owns
+    key derivation, cacheability checks and hit/miss counters.
+
+    Parameters
+    ----------
+    ttl:
+        Entry lifetime in seconds.
+    cache_get:
+        Also cache ``GET`` requests.  Off by default because resources such
+        as ``GET /batches/{id}`` are polled for status changes.
+    """
+
+    def __init__(self, *, ttl: float, cache_get: bool = False) -> None:
+        if ttl <= 0:
+            raise ValueError("'ttl' must be positive.")
+        self._ttl = ttl
+        self._cache_get = cache_get
+        self._counter_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def key_for(self, request: httpx.Request) -> str | None:
+        """Return the cache key for *request*, or ``None`` if not cacheable.
+
+        The request body must already be read.
+        """
+        body = request.content
+        if request.method == "GET":
+            if not self._cache_get:
+                return None
+        elif request.method != "POST" or not is_deterministic(request.url.path, body):
+            return None
+        return request_key(request.method, str(request.url), body, caller_identity(request))
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Return the live entry under *key*, counting a hit or a miss.
+
+        Expired entries are deleted.
+        """
+        entry = self._load(key)
+        if entry is not None and time.time() - entry.stored_at > self._ttl:
+            self._delete(key)
+            entry = None
+        with self._counter_lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return entry
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        """Store *entry* under *key*."""
+        self._store(key, entry)
+
+    def stats(self) -> dict[str, int]:
+        """Return a snapshot of the hit/miss counters."""
+        with self._counter_lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+    @abstractmethod
+    def _load(self, key: str) -> CachedResponse | None:
+        """Return the entry stored under *key*, expired or not."""
+
+    @abstractmethod
+    def _store(self, key: str, entry: CachedResponse) -> None:
+        """Store *entry* under *key*, replacing any previous one."""
+
+    @abstractmethod
+    def _delete(self, key: str) -> None:
+        """Remove the entry under *key*, if any."""
+
+
+class MemoryCache(ResponseCache):
+    """In-process LRU response cache.
+
+    Parameters
+    ----------
+    max_entries:
+        Maximum number of stored responses (default ``1024``).
+    max_bytes:
+        Maximum total body size in bytes (default 64 MiB).
+    ttl:
+        Entry lifetime in seconds (default ``3600``).
+    cache_get:
+        Also cache ``GET`` requests (default ``False``).
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl: float = 3600.0,
+        cache_get: bool = False,
+    ) -> None:
+        super().__init__(ttl=ttl, cache_get=cache_get)
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _load(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def _store(self, key: str, entry: CachedResponse) -> None:
+        if len(entry.content) > self._max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old.content)
+            self._entries[key] = entry
+            self._size += len(entry.content)
+            while len(self._entries) > self._max_entries or self._size > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.content)
+
+    def _delete(self, key: str) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._size -= len(entry.content)
+
+
+class DiskCache(ResponseCache):
+    """On-disk response cache with size-based LRU eviction.
+
+    Each entry is one file; writes are atomic, so several processes may
+    share *directory*.  Recency is tracked through file modification times.
+
+    Parameters
+    ----------
+    directory:
+        Cache directory (created if missing).
+    max_bytes:
+        Maximum total size of stored entries (default 512 MiB).
+    ttl:
+        Entry lifetime in seconds (default ``86400``).
+    cache_get:
+        Also cache ``GET`` requests (default ``False``).
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        *,
+        max_bytes: int = 512 * 1024 * 1024,
+        ttl: float = 86400.0,
+        cache_get: bool = False,
+    ) -> None:
+        super().__init__(ttl=ttl, cache_get=cache_get)
+        self._dir = Path(directory)
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._size = sum(p.stat().st_size for p in self._dir.glob("*.entry"))
+
+    def _path(self, key: str) -> Path:
+        return self._dir / f"{key}.entry"
+
+    def _load(self, key: str) -> CachedResponse | None:
+        path = self._path(key)
+        try:
+            raw = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            return None
+        try:
+            (meta_len,) = _META_LEN.unpack_from(raw)
+            meta: dict[str, Any] = json.loads(raw[_META_LEN.size : _META_LEN.size + meta_len])
+            return CachedResponse(
+                int(meta["status_code"]),
+                [(str(k), str(v)) for k, v in meta["headers"]],
+                raw[_META_LEN.size + meta_len :],
+                stored_at=float(meta["stored_at"]),
+            )
+        except (struct.error, ValueError, KeyError, TypeError):
+            logger.debug("x402 cache: discarding corrupt entry %s", path)
+            self._delete(key)
+            return None
+
+    def _store(self, key: str, entry: CachedResponse) -> None:
+        meta = json.dumps(
+            {
+                "status_code": entry.status_code,
+                "headers": entry.headers,
+                "stored_at": entry.stored_at,
+            }
+        ).encode()
+        data = _META_LEN.pack(len(meta)) + meta + entry.content
+        if len(data) > self._max_bytes:
+            return
+        path = self._path(key)
+        fd, tmp = tempfile.mkstemp(dir=self._dir, suffix=".tmp")
+        with self._lock:
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                try:
+                    replaced = path.stat().st_size
+                except FileNotFoundError:
+                    replaced = 0
+                os.replace(tmp, path)
+            except OSError:
+                Path(tmp).unlink(missing_ok=True)
+                logger.warning("x402 cache: failed to write entry", exc_info=True)
+                return
+            self._size += len(data) - replaced
+            if self._size > self._max_bytes:
+                self._evict()
+
+    def _delete(self, key: str) -> None:
+        path = self._path(key)
+        with self._lock:
+            try:
+                size = path.stat().st_size
+                path.unlink()
+            except OSError:
+                return
+            self._size -= size
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until under the size limit."""
+        files = []
+        for p in self._dir.glob("*.entry"):
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            files.append((st.st_mtime, st.st_size, p))
+        files.sort()
+        self._size = sum(size for _, size, _ in files)
+        for _, size, p in files:
+            if self._size <= self._max_bytes:
+                break
+            p.unlink(missing_ok=True)
+            self._size -= size
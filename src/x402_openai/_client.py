@@ -23,15 +23,28 @@ Supports multiple blockchain backends via wallet adapters::
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import asyncio
+import functools
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Self
 
 import httpx
 import openai
 
 from x402_openai._transport import AsyncX402Transport, X402Transport
-from x402_openai._wallet import create_x402_http_client
+from x402_openai._wallet import acreate_x402_http_client, create_x402_http_client
 
 if TYPE_CHECKING:
+    from openai.resources.beta import AsyncBeta, Beta
+    from openai.resources.realtime import AsyncRealtime, Realtime
+
+    from x402_openai._batching import EmbeddingBatcher
+    from x402_openai._cache import ResponseCache
+    from x402_openai._compression import RequestCompressor
+    from x402_openai._concurrency import AdaptiveLimiter, AsyncAdaptiveLimiter
+    from x402_openai._metrics import PaymentMetrics
+    from x402_openai._recording import TrafficRecorder
+    from x402_openai._requirements import RequirementsCache
     from x402_openai.wallets._base import Wallet
 
 # Default x402 LLM gateway URL.
@@ -51,6 +64,34 @@ class X402OpenAI(openai.OpenAI):
     - ``wallets`` — a list of adapters for multi-chain support.
     - ``x402_client`` — pre-configured ``x402HTTPClientSync``.
 
+    Optional features:
+
+    - ``response_cache`` — a :class:`~x402_openai.ResponseCache`; identical
+      deterministic requests are served from it without paying again.
+    - ``coalesce_requests`` — share one paid upstream call between identical
+      non-streaming requests that are in flight at the same time.
+    - ``limiter`` — an :class:`~x402_openai.AdaptiveLimiter` (async client:
+      :class:`~x402_openai.AsyncAdaptiveLimiter`) that adapts concurrency
+      per gateway host to 429/503, ``Retry-After`` and timeout signals.
+    - ``paid_retries`` — how often a paid request that fails before
+      settlement is resent with the same payment (default ``2``).
+    - ``recorder`` — a :class:`~x402_openai.TrafficRecorder` writing a
+      redacted trace for offline replay (:mod:`x402_openai.replay`).
+    - ``request_compressor`` — a :class:`~x402_openai.RequestCompressor`;
+      large request bodies are compressed once, also for the paid retry.
+    - ``deadline`` — end-to-end budget in seconds for each call, shared by
+      the unpaid attempt, signing and the paid retry; expiry raises
+      :class:`~x402_openai.X402DeadlineExceeded` without paying.
+    - ``metrics`` — a :class:`~x402_openai.PaymentMetrics` registry of
+      request, signing and payment counters and latencies.
+    - ``requirements_cache`` — a :class:`~x402_openai.RequirementsCache`
+      shared by worker processes; endpoints with known payment requirements
+      are paid up front, without the unpaid ``402`` round trip.
+
+    Realtime sessions (``client.realtime.connect()`` and
+    ``client.beta.realtime.connect()``) are paid for too: on the WebSocket
+    upgrade and whenever the gateway asks to renew during the session.
+
     All remaining keyword arguments are forwarded to ``openai.OpenAI()``.
 
     Examples
@@ -82,6 +123,15 @@ class X402OpenAI(openai.OpenAI):
         policies: list[Any] | None = None,
         base_url: str | httpx.URL | None = None,
         api_key: str | None = "x402",
+        response_cache: ResponseCache | None = None,
+        coalesce_requests: bool = False,
+        limiter: AdaptiveLimiter | None = None,
+        paid_retries: int = 2,
+        recorder: TrafficRecorder | None = None,
+        request_compressor: RequestCompressor | None = None,
+        deadline: float | None = None,
+        metrics: PaymentMetrics | None = None,
+        requirements_cache: RequirementsCache | None = None,
         **kwargs: Any,
     ) -> None:
         x402_http = create_x402_http_client(
@@ -92,7 +142,18 @@ class X402OpenAI(openai.OpenAI):
             sync=True,
         )
         http_client = httpx.Client(
-            transport=X402Transport(x402_http),
+            transport=X402Transport(
+                x402_http,
+                cache=response_cache,
+                coalesce=coalesce_requests,
+                limiter=limiter,
+                paid_retries=paid_retries,
+                recorder=recorder,
+                compressor=request_compressor,
+                deadline=deadline,
+                metrics=metrics,
+                requirements=requirements_cache,
+            ),
             timeout=_DEFAULT_TIMEOUT,
         )
         super().__init__(
@@ -101,13 +162,31 @@ class X402OpenAI(openai.OpenAI):
             http_client=http_client,
             **kwargs,
         )
+        self._x402_http = x402_http
+
+    @cached_property
+    def realtime(self) -> Realtime:
+        """Realtime API; sessions are paid for with x402 (see :mod:`._realtime`)."""
+        from x402_openai._realtime import PaidRealtime
+
+        return PaidRealtime(self, self._x402_http)
+
+    @cached_property
+    def beta(self) -> Beta:
+        from x402_openai._realtime import PaidBeta
+
+        return PaidBeta(self, self._x402_http)
 
 
 class AsyncX402OpenAI(openai.AsyncOpenAI):
     """Asynchronous OpenAI client with transparent x402 payment.
 
     Same parameters as :class:`X402OpenAI` — the only difference is that
-    all methods are ``async``.
+    all methods are ``async``.  Additionally accepts ``embedding_batcher``,
+    an :class:`~x402_openai.EmbeddingBatcher` that merges concurrent
+    embedding calls into one paid upstream request.  Construct it with
+    ``await AsyncX402OpenAI.create(...)`` to keep wallet registration off
+    the event loop.
 
     Examples
     --------
@@ -135,6 +214,16 @@ class AsyncX402OpenAI(openai.AsyncOpenAI):
         policies: list[Any] | None = None,
         base_url: str | httpx.URL | None = None,
         api_key: str | None = "x402",
+        response_cache: ResponseCache | None = None,
+        coalesce_requests: bool = False,
+        limiter: AsyncAdaptiveLimiter | None = None,
+        paid_retries: int = 2,
+        recorder: TrafficRecorder | None = None,
+        request_compressor: RequestCompressor | None = None,
+        deadline: float | None = None,
+        metrics: PaymentMetrics | None = None,
+        requirements_cache: RequirementsCache | None = None,
+        embedding_batcher: EmbeddingBatcher | None = None,
         **kwargs: Any,
     ) -> None:
         x402_http = create_x402_http_client(
@@ -145,7 +234,19 @@ class AsyncX402OpenAI(openai.AsyncOpenAI):
             sync=False,
         )
         http_client = httpx.AsyncClient(
-            transport=AsyncX402Transport(x402_http),
+            transport=AsyncX402Transport(
+                x402_http,
+                cache=response_cache,
+                coalesce=coalesce_requests,
+                limiter=limiter,
+                paid_retries=paid_retries,
+                recorder=recorder,
+                compressor=request_compressor,
+                deadline=deadline,
+                metrics=metrics,
+                requirements=requirements_cache,
+                embedding_batcher=embedding_batcher,
+            ),
             timeout=_DEFAULT_TIMEOUT,
         )
         super().__init__(
@@ -154,3 +255,42 @@ class AsyncX402OpenAI(openai.AsyncOpenAI):
             http_client=http_client,
             **kwargs,
         )
+        self._x402_http = x402_http
+
+    @cached_property
+    def realtime(self) -> AsyncRealtime:
+        """Realtime API; sessions are paid for with x402 (see :mod:`._realtime`)."""
+        from x402_openai._realtime import PaidAsyncRealtime
+
+        return PaidAsyncRealtime(self, self._x402_http)
+
+    @cached_property
+    def beta(self) -> AsyncBeta:
+        from x402_openai._realtime import PaidAsyncBeta
+
+        return PaidAsyncBeta(self, self._x402_http)
+
+    @classmethod
+    async def create(
+        cls,
+        *,
+        wallet: Wallet | None = None,
+        wallets: list[Wallet] | None = None,
+        x402_client: Any = None,
+        policies: list[Any] | None = None,
+        **kwargs: Any,
+    ) -> Self:
+        """Build a client without blocking the event loop.
+
+        Takes the constructor's parameters.  Wallets register concurrently
+        in worker threads (see :func:`acreate_x402_http_client`), and the
+        client itself, with its ``httpx`` pool and TLS context, is
+        constructed off the loop too.  Use it where clients are created
+        while other tasks run, e.g. per tenant at request time::
+
+            client = await AsyncX402OpenAI.create(wallet=EvmWallet(mnemonic="…"))
+        """
+        x402_http = await acreate_x402_http_client(
+            wallet=wallet, wallets=wallets, x402_client=x402_client, policies=policies
+        )
+        return await asyncio.to_thread(functools.partial(cls, x402_client=x402_http, **kwargs))
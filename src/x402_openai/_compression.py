@@ -0,0 +1,141 @@
+"""Opt-in request body compression, shared by the unpaid attempt and the paid retry.
+
+A :class:`RequestCompressor` compresses request bodies above a size threshold
+once, before the unpaid attempt; the paid retry is cloned from the
+compressed request, so the (large) body is neither compressed nor uploaded
+uncompressed a second time.
+
+Gateways that reject compressed bodies with ``415 Unsupported Media Type``
+are remembered per host: the request is resent uncompressed and later
+requests to that host skip compression.
+
+Encodings:
+
+- ``"gzip"`` — standard library.
+- ``"zstd"`` — ``compression.zstd`` (Python 3.14+) or the ``zstandard``
+  package (``pip install x402-openai[zstd]``).
+- ``"auto"`` (default) — ``"zstd"`` when available, else ``"gzip"``.
+"""
+
+from __future__ import annotations
+
+import gzip
+import threading
+from typing import TYPE_CHECKING
+
+import httpx
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Per-encoding default compression levels (fast settings: the body is sent
+# right away, so compression time is on the request's critical path).
+_LEVELS = {"gzip": 6, "zstd": 3}
+
+
+def _zstd_compressor() -> Callable[[bytes, int], bytes] | None:
+    try:
+        from compression import zstd  # type: ignore[import-not-found,unused-ignore]
+
+        return lambda data, level: bytes(zstd.compress(data, level=level))
+    except ImportError:
+        pass
+    try:
+        import zstandard  # type: ignore[import-not-found,unused-ignore]
+    except ImportError:
+        return None
+    return lambda data, level: bytes(zstandard.ZstdCompressor(level=level).compress(data))
+
+
+def _gzip(data: bytes, level: int) -> bytes:
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+
+class RequestCompressor:
+    """Compress large request bodies, with per-host fallback on ``415``.
+
+    Parameters
+    ----------
+    encoding:
+        ``"auto"`` (default), ``"gzip"`` or ``"zstd"``.
+    min_size:
+        Bodies smaller than this many bytes are sent as-is (default 16 KiB).
+    level:
+        Compression level; defaults to a fast setting per encoding.
+
+    Examples
+    --------
+    ::
+
+        client = X402OpenAI(wallet=wallet, request_compressor=RequestCompressor())
+    """
+
+    __slots__ = ("_compress", "_disabled", "_level", "_lock", "_min_size", "encoding")
+
+    def __init__(
+        self,
+        *,
+        encoding: str = "auto",
+        min_size: int = 16 * 1024,
+        level: int | None = None,
+    ) -> None:
+        zstd = _zstd_compressor()
+        if encoding == "auto":
+            encoding = "zstd" if zstd is not None else "gzip"
+        if encoding == "gzip":
+            self._compress: Callable[[bytes, int], bytes] = _gzip
+        elif encoding == "zstd":
+            if zstd is None:
+                raise ImportError(
+                    "zstd request compression requires Python 3.14+ or zstandard. "
+                    "Install with: pip install x402-openai[zstd]"
+                )
+            self._compress = zstd
+        else:
+            raise ValueError(f"Unknown encoding {encoding!r}; use 'auto', 'gzip' or 'zstd'.")
+        if min_size < 0:
+            raise ValueError("'min_size' must not be negative.")
+        self.encoding = encoding
+        self._min_size = min_size
+        self._level = _LEVELS[encoding] if level is None else level
+        self._disabled: set[str] = set()
+        self._lock = threading.Lock()
+
+    def compress(self, request: httpx.Request) -> httpx.Request:
+        """Return a compressed copy of *request*, or *request* itself.
+
+        The body must already be read.
+        """
+        body = request.content
+        if (
+            len(body) < self._min_size
+            or "content-encoding" in request.headers
+            or request.url.host in self._disabled
+        ):
+            return request
+        compressed = self._compress(body, self._level)
+        if len(compressed) >= len(body):
+            return request
+        headers = request.headers.copy()
+        headers["content-encoding"] = self.encoding
+        headers["content-length"] = str(len(compressed))
+        return httpx.Request(
+            method=request.method,
+            url=request.url,
+            headers=headers,
+            content=compressed,
+            extensions=dict(request.extensions),
+        )
+
+    def rejected(
+        self, request: httpx.Request, sent: httpx.Request, response: httpx.Response
+    ) -> bool:
+        """Return True if the gateway rejected *sent*, a compressed copy of *request*.
+
+        The host is then no longer sent compressed bodies.
+        """
+        if sent is request or response.status_code != 415:
+            return False
+        with self._lock:
+            self._disabled.add(sent.url.host)
+        return True
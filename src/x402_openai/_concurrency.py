@@ -0,0 +1,210 @@
+"""Adaptive (AIMD) concurrency limits driven by gateway signals.
+
+Each gateway host gets its own limit on concurrent requests.  The limit
+grows additively (about ``increase`` per round trip) while requests
+succeed, and is cut multiplicatively when the gateway explicitly signals
+overload: ``429``/``503`` responses, a ``Retry-After`` header, or timeouts.
+
+Latency is deliberately *not* treated as an overload signal: one host
+serves short embedding calls and long completions whose duration depends
+on ``max_tokens``, so a single latency baseline would mistake every long
+completion for congestion.  The smoothed latency is only used to pace
+cuts, which are applied at most once per round trip so that a burst of
+rejections does not collapse the limit to the floor.
+
+- :class:`AdaptiveLimiter` — thread-based, for :class:`~x402_openai.X402Transport`.
+- :class:`AsyncAdaptiveLimiter` — for :class:`~x402_openai.AsyncX402Transport`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+# Status codes that indicate the gateway is over capacity.
+_OVERLOAD_STATUS = frozenset({429, 503})
+
+# Weight of a new latency sample in the smoothed baseline.
+_BASELINE_ALPHA = 0.1
+
+
+def is_overload(response: httpx.Response) -> bool:
+    """Return True if *response* signals that the gateway is over capacity."""
+    return response.status_code in _OVERLOAD_STATUS or "retry-after" in response.headers
+
+
+class _HostState:
+    """AIMD state for one gateway host."""
+
+    __slots__ = ("baseline", "in_flight", "last_cut", "limit", "waiters")
+
+    def __init__(self, limit: float) -> None:
+        self.limit = limit
+        self.in_flight = 0
+        self.baseline: float | None = None
+        self.last_cut = 0.0
+        # Only used by the async limiter.
+        self.waiters: deque[asyncio.Future[None]] = deque()
+
+
+class _AimdLimiter:
+    """AIMD policy shared by the sync and async limiters."""
+
+    def __init__(
+        self,
+        *,
+        initial_limit: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 256,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+    ) -> None:
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Require 1 <= min_limit <= initial_limit <= max_limit.")
+        if not 0 < decrease < 1:
+            raise ValueError("'decrease' must be between 0 and 1.")
+        self._initial = float(initial_limit)
+        self._min = float(min_limit)
+        self._max = float(max_limit)
+        self._increase = increase
+        self._decrease = decrease
+        self._hosts: dict[str, _HostState] = {}
+        # Only used by the sync limiter.
+        self._cond = threading.Condition()
+
+    def limit(self, host: str) -> int:
+        """Return the current concurrency limit for *host*."""
+        state = self._hosts.get(host)
+        return int(state.limit) if state is not None else int(self._initial)
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        """Return ``{host: {"limit", "in_flight", "baseline"}}`` for every known host."""
+        return {
+            host: {
+                "limit": int(s.limit),
+                "in_flight": s.in_flight,
+                "baseline": s.baseline or 0.0,
+            }
+            for host, s in list(self._hosts.items())
+        }
+
+    def _state(self, host: str) -> _HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts.setdefault(host, _HostState(self._initial))
+        return state
+
+    def _adjust(self, host: str, state: _HostState, latency: float | None, overload: bool) -> None:
+        """Apply one AIMD step.  Caller holds the state lock."""
+        now = time.monotonic()
+        if overload:
+            if now - state.last_cut >= (state.baseline or 0.0):
+                state.limit = max(self._min, state.limit * self._decrease)
+                state.last_cut = now
+                logger.debug("x402: concurrency for %s cut to %d", host, int(state.limit))
+        elif latency is not None:
+            state.limit = min(self._max, state.limit + self._increase / state.limit)
+
+        if latency is not None and not overload:
+            if state.baseline is None:
+                state.baseline = latency
+            else:
+                state.baseline += _BASELINE_ALPHA * (latency - state.baseline)
+
+
+class AdaptiveLimiter(_AimdLimiter):
+    """Per-host AIMD concurrency limiter for :class:`~x402_openai.X402Transport`.
+
+    Parameters
+    ----------
+    initial_limit:
+        Starting concurrency per host (default ``8``).
+    min_limit / max_limit:
+        Bounds for the limit (defaults ``1`` and ``256``).
+    increase:
+        Additive increase per round trip of successful requests (default ``1``).
+    decrease:
+        Multiplicative factor applied on overload (default ``0.5``).
+
+    Examples
+    --------
+    ::
+
+        from x402_openai import AdaptiveLimiter, X402OpenAI
+
+        client = X402OpenAI(
+            wallet=EvmWallet(private_key="0x…"),
+            limiter=AdaptiveLimiter(initial_limit=16, max_limit=512),
+        )
+    """
+
+    def acquire(self, host: str) -> None:
+        """Block until a slot for *host* is free and take it."""
+        with self._cond:
+            state = self._state(host)
+            while state.in_flight >= int(state.limit):
+                self._cond.wait()
+            state.in_flight += 1
+
+    def release(self, host: str, *, latency: float | None = None, overload: bool = False) -> None:
+        """Return a slot for *host* and feed the outcome into the AIMD policy.
+
+        *latency* is ``None`` when the request produced no usable sample
+        (errors, non-success responses).
+        """
+        with self._cond:
+            state = self._state(host)
+            state.in_flight -= 1
+            self._adjust(host, state, latency, overload)
+            self._cond.notify_all()
+
+
+class AsyncAdaptiveLimiter(_AimdLimiter):
+    """Per-host AIMD concurrency limiter for :class:`~x402_openai.AsyncX402Transport`.
+
+    Same parameters as :class:`AdaptiveLimiter`.  Must be used from a
+    single event loop.
+    """
+
+    async def acquire(self, host: str) -> None:
+        """Wait until a slot for *host* is free and take it."""
+        state = self._state(host)
+        if state.in_flight < int(state.limit) and not state.waiters:
+            state.in_flight += 1
+            return
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        state.waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just before cancellation.
+                state.in_flight -= 1
+                self._wake(state)
+            else:
+                state.waiters.remove(waiter)
+            raise
+
+    def release(self, host: str, *, latency: float | None = None, overload: bool = False) -> None:
+        """Return a slot for *host* and feed the outcome into the AIMD policy."""
+        state = self._state(host)
+        state.in_flight -= 1
+        self._adjust(host, state, latency, overload)
+        self._wake(state)
+
+    @staticmethod
+    def _wake(state: _HostState) -> None:
+        while state.waiters and state.in_flight < int(state.limit):
+            waiter = state.waiters.popleft()
+            if not waiter.done():
+                state.in_flight += 1
+                waiter.set_result(None)
@@ -0,0 +1,104 @@
+"""End-to-end deadlines for paid calls.
+
+httpx timeouts bound each network operation of each request separately, so
+a paid call (unpaid attempt, signing, paid retry) can take about twice the
+configured timeout, and signing is not bounded at all.
+
+A deadline is one budget in seconds per call, from the transport's
+``deadline`` argument or the ``"x402_deadline"`` request extension.  It is
+fixed when the transport first sees the request and shared by every phase:
+
+- each upstream attempt gets its httpx timeouts clamped to the time left
+  (the async transport additionally cancels the attempt when it runs out);
+- the payment is only signed, and only sent, if at least the duration of
+  the unpaid round trip is left — otherwise the call fails without paying;
+- paid-retry backoff never sleeps past the deadline.
+
+The deadline covers the call up to the response headers; body reads are
+bounded per read by the time left when the final attempt was sent.
+Expiry raises :class:`X402DeadlineExceeded`, an ``httpx.TimeoutException``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from typing import TYPE_CHECKING
+
+import httpx
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+DEADLINE_EXTENSION = "x402_deadline"
+
+# Absolute ``time.monotonic()`` expiry, set once per call.
+_EXPIRES_AT = "x402_deadline_at"
+
+_TIMEOUT_KEYS = ("connect", "read", "write", "pool")
+
+
+class X402DeadlineExceeded(httpx.TimeoutException):
+    """The end-to-end deadline of a call expired."""
+
+
+def start_deadline(request: httpx.Request, default: float | None) -> None:
+    """Fix the expiry of *request*'s call unless it already has one."""
+    if _EXPIRES_AT in request.extensions:
+        return
+    budget = request.extensions.get(DEADLINE_EXTENSION, default)
+    if budget is not None:
+        request.extensions[_EXPIRES_AT] = time.monotonic() + float(budget)
+
+
+def time_left(request: httpx.Request) -> float | None:
+    """Return the seconds left for *request*'s call, or ``None`` without deadline."""
+    expires_at = request.extensions.get(_EXPIRES_AT)
+    return None if expires_at is None else float(expires_at) - time.monotonic()
+
+
+def require_time(request: httpx.Request, needed: float, phase: str) -> None:
+    """Raise :class:`X402DeadlineExceeded` if less than *needed* seconds are left."""
+    left = time_left(request)
+    if left is not None and left <= needed:
+        raise X402DeadlineExceeded(
+            f"x402 deadline: {max(left, 0.0):.3f}s left, not enough for {phase}",
+            request=request,
+        )
+
+
+def bound_timeouts(request: httpx.Request, phase: str) -> None:
+    """Clamp *request*'s httpx timeouts to the time left, or raise if none is."""
+    left = time_left(request)
+    if left is None:
+        return
+    require_time(request, 0.0, phase)
+    timeouts = request.extensions.get("timeout") or {}
+    request.extensions["timeout"] = {
+        key: left if timeouts.get(key) is None else min(timeouts[key], left)
+        for key in _TIMEOUT_KEYS
+    }
+
+
+def sleep_allowed(request: httpx.Request, delay: float) -> bool:
+    """Return True if sleeping *delay* seconds still leaves time before the deadline."""
+    left = time_left(request)
+    return left is None or delay < left
+
+
+@contextlib.asynccontextmanager
+async def enforce_deadline(request: httpx.Request, phase: str) -> AsyncIterator[None]:
+    """Cancel the block when *request*'s deadline expires."""
+    left = time_left(request)
+    if left is None:
+        yield
+        return
+    require_time(request, 0.0, phase)
+    try:
+        async with asyncio.timeout(left):
+            yield
+    except TimeoutError:
+        raise X402DeadlineExceeded(
+            f"x402 deadline expired during {phase}", request=request
+        ) from None
@@ -0,0 +1,229 @@
+"""In-process payment and transport metrics with Prometheus text export.
+
+A :class:`PaymentMetrics` registry, passed to a transport (or client) as
+``metrics=``, records:
+
+- counters — upstream requests, ``402`` challenges, signings by outcome
+  and paid-request resends;
+- histograms — signing latency, ``402``-to-paid-response latency and the
+  amount paid per network and asset (atomic token units);
+- a gauge — payments in flight (signed or being signed, not yet answered).
+
+Updates take one short lock per registry and never await, so one registry
+can be shared by sync and async transports across threads.  Read it with
+:meth:`PaymentMetrics.snapshot` or :meth:`PaymentMetrics.prometheus`.
+"""
+
+from __future__ import annotations
+
+import bisect
+import contextlib
+import threading
+from collections.abc import Mapping
+from typing import Any
+
+# Latency bucket upper bounds in seconds.
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Amount bucket upper bounds in atomic units (1000 = 0.001 USDC).
+AMOUNT_BUCKETS = tuple(float(10**k) for k in range(10))
+
+_HELP = {
+    "x402_requests_total": ("counter", "Requests sent upstream."),
+    "x402_challenges_total": ("counter", "402 Payment Required responses received."),
+    "x402_signings_total": ("counter", "Payment signings by outcome."),
+    "x402_paid_retries_total": ("counter", "Paid requests resent with the same payment."),
+    "x402_payments_in_flight": ("gauge", "Payments signed or being signed, not yet answered."),
+    "x402_signing_seconds": ("histogram", "Time spent signing a payment."),
+    "x402_payment_seconds": ("histogram", "Time from a 402 to the paid response headers."),
+    "x402_amount_paid": ("histogram", "Amount of settled payments in atomic units."),
+}
+
+_Labels = tuple[tuple[str, str], ...]
+
+
+class _Histogram:
+    """Bucket counts (non-cumulative), sum and count of observations."""
+
+    __slots__ = ("bounds", "counts", "sum")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+    def as_dict(self) -> dict[str, Any]:
+        cumulative, total = {}, 0
+        for bound, count in zip((*self.bounds, float("inf")), self.counts, strict=True):
+            total += count
+            cumulative[bound] = total
+        return {"buckets": cumulative, "sum": self.sum, "count": total}
+
+
+class PaymentMetrics:
+    """Thread-safe registry of x402 payment and transport metrics.
+
+    Parameters
+    ----------
+    latency_buckets:
+        Upper bounds (seconds) of the latency histograms.
+    amount_buckets:
+        Upper bounds (atomic units) of the amount histogram.
+
+    Examples
+    --------
+    ::
+
+        metrics = PaymentMetrics()
+        client = X402OpenAI(wallet=wallet, metrics=metrics)
+        ...
+        print(metrics.prometheus())
+    """
+
+    __slots__ = (
+        "_amount_buckets",
+        "_counters",
+        "_gauges",
+        "_histograms",
+        "_latency_buckets",
+        "_lock",
+    )
+
+    def __init__(
+        self,
+        *,
+        latency_buckets: tuple[float, ...] = LATENCY_BUCKETS,
+        amount_buckets: tuple[float, ...] = AMOUNT_BUCKETS,
+    ) -> None:
+        self._latency_buckets = tuple(sorted(latency_buckets))
+        self._amount_buckets = tuple(sorted(amount_buckets))
+        self._counters: dict[tuple[str, _Labels], int] = {}
+        self._gauges: dict[tuple[str, _Labels], int] = {("x402_payments_in_flight", ()): 0}
+        self._histograms: dict[tuple[str, _Labels], _Histogram] = {}
+        self._lock = threading.Lock()
+
+    def request(self) -> None:
+        """Count one request sent upstream."""
+        self._count("x402_requests_total", ())
+
+    def challenge(self) -> None:
+        """Count one ``402`` challenge and mark a payment in flight."""
+        with self._lock:
+            self._inc("x402_challenges_total", ())
+            self._gauges[("x402_payments_in_flight", ())] += 1
+
+    def signed(self, seconds: float, *, ok: bool) -> None:
+        """Record one signing attempt."""
+        outcome = (("outcome", "ok" if ok else "error"),)
+        with self._lock:
+            self._inc("x402_signings_total", outcome)
+            self._observe("x402_signing_seconds", (), seconds, self._latency_buckets)
+
+    def paid_retry(self) -> None:
+        """Count one resend of a paid request."""
+        self._count("x402_paid_retries_total", ())
+
+    def payment_done(self, seconds: float | None) -> None:
+        """Mark a payment no longer in flight; *seconds* is ``402``-to-answer time.
+
+        *seconds* is ``None`` when no paid response came back (signing
+        failed or the paid request raised).
+        """
+        with self._lock:
+            self._gauges[("x402_payments_in_flight", ())] -= 1
+            if seconds is not None:
+                self._observe("x402_payment_seconds", (), seconds, self._latency_buckets)
+
+    def paid(self, payload: Any) -> None:
+        """Record the amount of a payment the server accepted.
+
+        *payload* is the signed x402 payload; its network, asset and amount
+        label the amount histogram.  Payloads that do not tell are skipped.
+        """
+        terms = payment_terms(payload)
+        if terms is None:
+            return
+        network, asset, amount = terms
+        labels = (("network", network), ("asset", asset))
+        with self._lock:
+            self._observe("x402_amount_paid", labels, amount, self._amount_buckets)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a consistent copy of every metric.
+
+        Keys are metric names; values map label tuples to numbers (counters,
+        gauges) or to ``{"buckets", "sum", "count"}`` dicts (histograms).
+        """
+        result: dict[str, Any] = {}
+        with self._lock:
+            for (name, labels), value in (*self._counters.items(), *self._gauges.items()):
+                result.setdefault(name, {})[labels] = value
+            for (name, labels), histogram in self._histograms.items():
+                result.setdefault(name, {})[labels] = histogram.as_dict()
+        return result
+
+    def prometheus(self) -> str:
+        """Return all metrics in the Prometheus text exposition format."""
+        lines: list[str] = []
+        for name, series in sorted(self.snapshot().items()):
+            kind, text = _HELP[name]
+            lines += [f"# HELP {name} {text}", f"# TYPE {name} {kind}"]
+            for labels, value in sorted(series.items()):
+                if kind != "histogram":
+                    lines.append(f"{name}{_format_labels(labels)} {value}")
+                    continue
+                for bound, count in value["buckets"].items():
+                    le = "+Inf" if bound == float("inf") else repr(float(bound))
+                    lines.append(f"{name}_bucket{_format_labels((*labels, ('le', le)))} {count}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {value['sum']!r}")
+                lines.append(f"{name}_count{_format_labels(labels)} {value['count']}")
+        return "\n".join(lines) + "\n"
+
+    def _count(self, name: str, labels: _Labels) -> None:
+        with self._lock:
+            self._inc(name, labels)
+
+    def _inc(self, name: str, labels: _Labels) -> None:
+        """Caller holds the lock."""
+        key = (name, labels)
+        self._counters[key] = self._counters.get(key, 0) + 1
+
+    def _observe(
+        self, name: str, labels: _Labels, value: float, bounds: tuple[float, ...]
+    ) -> None:
+        """Caller holds the lock."""
+        histogram = self._histograms.get((name, labels))
+        if histogram is None:
+            histogram = self._histograms[(name, labels)] = _Histogram(bounds)
+        histogram.observe(value)
+
+
+def payment_terms(payload: Any) -> tuple[str, str, int] | None:
+    """Return ``(network, asset, amount)`` of a signed payload, if it tells.
+
+    v2 payloads carry the accepted requirements; v1 EVM payloads only the
+    network and the authorization value.
+    """
+    accepted = getattr(payload, "accepted", None)
+    with contextlib.suppress(AttributeError, KeyError, TypeError, ValueError):
+        if accepted is not None:
+            return str(accepted.network), str(accepted.asset), int(accepted.amount)
+        inner = payload.payload
+        if isinstance(inner, Mapping):
+            value = inner["authorization"]["value"]
+            return str(payload.network), "", int(value)
+    return None
+
+
+def _format_labels(labels: _Labels) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        (key, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for key, value in labels
+    )
+    return "{" + ",".join(f'{key}="{value}"' for key, value in escaped) + "}"
@@ -0,0 +1,81 @@
+"""Retry policy for the paid request, reusing the same signed payment.
+
+When the paid retry fails before the gateway settled the payment (a dropped
+connection, or a ``5xx`` without a settlement header), the transports resend
+it with the *same* payment header instead of letting the ``openai`` SDK
+restart the whole flow with a fresh 402 and a fresh signature.
+
+Reuse is safe because a signed payment can settle at most once: EIP-3009
+authorizations carry a single-use nonce and Solana transactions a single
+signature.  Retries stop when the payment would expire before the next
+attempt.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import time
+from collections.abc import Mapping
+from typing import Any
+
+import httpx
+
+# Upstream failures that may be retried with the same payment when the
+# response carries no settlement header.
+_RETRY_STATUS = frozenset({500, 502, 503, 504})
+
+# Headers with which a gateway reports that the payment was settled.
+_SETTLEMENT_HEADERS = ("payment-response", "x-payment-response")
+
+# Transport errors after which the request can be resent.  Timeouts are
+# excluded: the gateway may still be processing (and settling) the request.
+RETRY_ERRORS: tuple[type[Exception], ...] = (httpx.NetworkError, httpx.RemoteProtocolError)
+
+# Base delay before the first resend; doubled on every further attempt.
+_BACKOFF = 0.1
+
+# Stop retrying this many seconds before the payment expires.
+_EXPIRY_MARGIN = 1.0
+
+
+def is_unsettled_failure(response: httpx.Response) -> bool:
+    """Return True if *response* is a server error without a settlement header."""
+    if response.status_code not in _RETRY_STATUS:
+        return False
+    return not any(h in response.headers for h in _SETTLEMENT_HEADERS)
+
+
+def valid_until(payload: Any, signed_at: float) -> float:
+    """Return the wall-clock time after which *payload* can no longer settle.
+
+    Uses the EIP-3009 ``validBefore`` of EVM payments when present, bounded
+    by ``max_timeout_seconds`` of the accepted requirements (v2).  Payloads
+    exposing neither allow no retry.
+    """
+    deadlines: list[float] = []
+
+    inner = getattr(payload, "payload", None)
+    if isinstance(inner, Mapping):
+        authorization = inner.get("authorization")
+        if isinstance(authorization, Mapping):
+            with contextlib.suppress(KeyError, TypeError, ValueError):
+                deadlines.append(float(authorization["validBefore"]))
+
+    timeout = getattr(getattr(payload, "accepted", None), "max_timeout_seconds", None)
+    if isinstance(timeout, int | float):
+        deadlines.append(signed_at + timeout)
+
+    return min(deadlines) if deadlines else signed_at
+
+
+def retry_delay(attempt: int, retries: int, deadline: float) -> float | None:
+    """Return the delay before resend number *attempt* (0-based), or ``None``.
+
+    ``None`` means the retry budget is spent or the payment would expire.
+    """
+    if attempt >= retries:
+        return None
+    delay: float = _BACKOFF * 2.0**attempt
+    if time.time() + delay + _EXPIRY_MARGIN >= deadline:
+        return None
+    return delay
@@ -0,0 +1,423 @@
+"""x402 payment for the Realtime (WebSocket) API.
+
+The OpenAI SDK opens realtime sessions with ``websockets`` rather than
+through ``httpx``, so the transports never see them.  The clients instead
+replace their ``realtime`` and ``beta.realtime`` resources with the ones
+here, whose ``connect()``:
+
+- answers a ``402`` to the WebSocket upgrade the way the transports answer
+  one to a request: the x402 client signs the challenge (the
+  ``payment-required`` header and body of the refused upgrade) and the
+  handshake is repeated once with the payment headers.  If signing fails,
+  the refusal (``websockets.exceptions.InvalidStatus``) is raised;
+- renews the payment during the session: the gateway sends an
+  ``{"type": "x402.payment_required", "payment_required": "<header value>"}``
+  event, and the connection answers it with
+  ``{"type": "x402.payment", "headers": {...}}``, the headers a paid HTTP
+  request would carry.  Renewal events are consumed while receiving and
+  never reach the application.
+
+Requires ``openai[realtime]`` (``pip install x402-openai[realtime]``).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+import httpx
+from openai import Omit, omit
+from openai.resources.beta.beta import AsyncBeta, Beta
+from openai.resources.beta.realtime.realtime import (
+    AsyncRealtime as AsyncBetaRealtime,
+)
+from openai.resources.beta.realtime.realtime import (
+    AsyncRealtimeConnection as AsyncBetaRealtimeConnection,
+)
+from openai.resources.beta.realtime.realtime import Realtime as BetaRealtime
+from openai.resources.beta.realtime.realtime import (
+    RealtimeConnection as BetaRealtimeConnection,
+)
+from openai.resources.realtime.realtime import (
+    AsyncRealtime,
+    AsyncRealtimeConnection,
+    Realtime,
+    RealtimeConnection,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from openai import AsyncOpenAI, OpenAI
+    from openai.types.websocket_connection_options import WebsocketConnectionOptions
+
+logger = logging.getLogger(__name__)
+
+RENEWAL_EVENT = "x402.payment_required"
+PAYMENT_EVENT = "x402.payment"
+
+
+def _challenge(exc: Exception) -> tuple[dict[str, str], bytes] | None:
+    """Return the x402 challenge of an upgrade refused with ``402``, else ``None``."""
+    from websockets.exceptions import InvalidStatus
+
+    if not isinstance(exc, InvalidStatus) or exc.response.status_code != 402:
+        return None
+    response = exc.response
+    headers = {name.lower(): value for name, value in response.headers.raw_items()}
+    return headers, response.body or b""
+
+
+def _renewal(message: bytes) -> tuple[dict[str, str], bytes] | None:
+    """Return the challenge of a renewal event, or ``None`` for other messages.
+
+    A malformed renewal event is logged and passed on like other messages.
+    """
+    if RENEWAL_EVENT.encode() not in message:
+        return None
+    try:
+        event = json.loads(message)
+    except ValueError:
+        return None
+    if not isinstance(event, dict) or event.get("type") != RENEWAL_EVENT:
+        return None
+    payment_required = event.get("payment_required")
+    if not isinstance(payment_required, str):
+        logger.warning("x402: realtime renewal event without a payment_required header")
+        return None
+    return {"payment-required": payment_required}, b""
+
+
+def _payment_event(headers: Mapping[str, str]) -> str:
+    return json.dumps({"type": PAYMENT_EVENT, "headers": dict(headers)})
+
+
+def _url(client: OpenAI | AsyncOpenAI, query: Mapping[str, Any]) -> str:
+    """Return the realtime endpoint URL, as the SDK builds it."""
+    if client.websocket_base_url is not None:
+        base = httpx.URL(client.websocket_base_url)
+    else:
+        base = client.base_url.copy_with(scheme="wss")
+    url = base.copy_with(raw_path=base.raw_path.rstrip(b"/") + b"/realtime")
+    return str(url.copy_with(params={**client.base_url.params, **query}))
+
+
+def _headers(*parts: Mapping[str, Any]) -> dict[str, str]:
+    """Merge header mappings, dropping entries removed with ``omit``."""
+    merged: dict[str, Any] = {}
+    for part in parts:
+        merged.update(part)
+    return {name: value for name, value in merged.items() if not isinstance(value, Omit)}
+
+
+def _query(
+    model: str | Omit, call_id: str | Omit, extra_query: Mapping[str, Any]
+) -> dict[str, Any]:
+    query: dict[str, Any] = {}
+    if not isinstance(model, Omit):
+        query["model"] = model
+    if not isinstance(call_id, Omit):
+        query["call_id"] = call_id
+    return {**query, **extra_query}
+
+
+class _AsyncRenewal:
+    """Mixin for async realtime connections that renews the session's payment."""
+
+    _connection: Any
+
+    def __init__(self, connection: Any, x402_client: Any) -> None:
+        super().__init__(connection)  # type: ignore[call-arg]
+        self._x402 = x402_client
+
+    async def recv_bytes(self) -> bytes:
+        while True:
+            message: bytes = await super().recv_bytes()  # type: ignore[misc]
+            challenge = _renewal(message)
+            if challenge is None:
+                return message
+            logger.debug("x402: realtime payment renewal — signing payment")
+            headers, _ = await self._x402.handle_402_response(*challenge)
+            await self._connection.send(_payment_event(headers))
+
+
+class _Renewal:
+    """Mixin for realtime connections that renews the session's payment."""
+
+    _connection: Any
+
+    def __init__(self, connection: Any, x402_client: Any) -> None:
+        super().__init__(connection)  # type: ignore[call-arg]
+        self._x402 = x402_client
+
+    def recv_bytes(self) -> bytes:
+        while True:
+            message: bytes = super().recv_bytes()  # type: ignore[misc]
+            challenge = _renewal(message)
+            if challenge is None:
+                return message
+            logger.debug("x402: realtime payment renewal — signing payment")
+            headers, _ = self._x402.handle_402_response(*challenge)
+            self._connection.send(_payment_event(headers))
+
+
+class _AsyncConnection(_AsyncRenewal, AsyncRealtimeConnection):
+    """Realtime connection that renews the session's payment."""
+
+
+class _AsyncBetaConnection(_AsyncRenewal, AsyncBetaRealtimeConnection):
+    """Beta realtime connection that renews the session's payment."""
+
+
+class _Connection(_Renewal, RealtimeConnection):
+    """Realtime connection that renews the session's payment."""
+
+
+class _BetaConnection(_Renewal, BetaRealtimeConnection):
+    """Beta realtime connection that renews the session's payment."""
+
+
+class AsyncConnectionManager:
+    """Opens a paid realtime connection; ``async with`` closes it again."""
+
+    def __init__(
+        self,
+        client: AsyncOpenAI,
+        x402_client: Any,
+        connection_type: type[_AsyncConnection | _AsyncBetaConnection],
+        *,
+        query: Mapping[str, Any],
+        headers: Mapping[str, Any],
+        options: WebsocketConnectionOptions,
+    ) -> None:
+        self._client = client
+        self._x402 = x402_client
+        self._connection_type = connection_type
+        self._query = query
+        self._headers = headers
+        self._options = options
+        self._connection: _AsyncConnection | _AsyncBetaConnection | None = None
+
+    async def __aenter__(self) -> Any:
+        from websockets.asyncio.client import connect
+
+        client = self._client
+        await client._refresh_api_key()
+        url = _url(client, self._query)
+        headers = _headers(client.auth_headers, self._headers)
+        try:
+            websocket = await connect(
+                url,
+                user_agent_header=client.user_agent,
+                additional_headers=headers,
+                **self._options,
+            )
+        except Exception as exc:
+            challenge = _challenge(exc)
+            if challenge is None:
+                raise
+            logger.debug("x402: realtime upgrade answered 402 — signing payment")
+            try:
+                payment_headers, _ = await self._x402.handle_402_response(*challenge)
+            except Exception:
+                logger.exception("x402: payment signing failed")
+                raise exc from None
+            websocket = await connect(
+                url,
+                user_agent_header=client.user_agent,
+                additional_headers={**headers, **payment_headers},
+                **self._options,
+            )
+        self._connection = self._connection_type(websocket, self._x402)
+        return self._connection
+
+    enter = __aenter__
+
+    async def __aexit__(self, *exc: object) -> None:
+        if self._connection is not None:
+            await self._connection.close()
+
+
+class ConnectionManager:
+    """Opens a paid realtime connection; ``with`` closes it again."""
+
+    def __init__(
+        self,
+        client: OpenAI,
+        x402_client: Any,
+        connection_type: type[_Connection | _BetaConnection],
+        *,
+        query: Mapping[str, Any],
+        headers: Mapping[str, Any],
+        options: WebsocketConnectionOptions,
+    ) -> None:
+        self._client = client
+        self._x402 = x402_client
+        self._connection_type = connection_type
+        self._query = query
+        self._headers = headers
+        self._options = options
+        self._connection: _Connection | _BetaConnection | None = None
+
+    def __enter__(self) -> Any:
+        from websockets.sync.client import connect
+
+        client = self._client
+        client._refresh_api_key()
+        url = _url(client, self._query)
+        headers = _headers(client.auth_headers, self._headers)
+        try:
+            websocket = connect(
+                url,
+                user_agent_header=client.user_agent,
+                additional_headers=headers,
+                **self._options,
+            )
+        except Exception as exc:
+            challenge = _challenge(exc)
+            if challenge is None:
+                raise
+            logger.debug("x402: realtime upgrade answered 402 — signing payment")
+            try:
+                payment_headers, _ = self._x402.handle_402_response(*challenge)
+            except Exception:
+                logger.exception("x402: payment signing failed")
+                raise exc from None
+            websocket = connect(
+                url,
+                user_agent_header=client.user_agent,
+                additional_headers={**headers, **payment_headers},
+                **self._options,
+            )
+        self._connection = self._connection_type(websocket, self._x402)
+        return self._connection
+
+    enter = __enter__
+
+    def __exit__(self, *exc: object) -> None:
+        if self._connection is not None:
+            self._connection.close()
+
+
+class PaidAsyncRealtime(AsyncRealtime):
+    """``client.realtime`` paying for sessions with the client's x402 client."""
+
+    def __init__(self, client: AsyncOpenAI, x402_client: Any) -> None:
+        super().__init__(client)
+        self._x402 = x402_client
+
+    def connect(  # type: ignore[override]
+        self,
+        *,
+        call_id: str | Omit = omit,
+        model: str | Omit = omit,
+        extra_query: Mapping[str, Any] = {},
+        extra_headers: Mapping[str, Any] = {},
+        websocket_connection_options: WebsocketConnectionOptions | None = None,
+    ) -> AsyncConnectionManager:
+        return AsyncConnectionManager(
+            self._client,
+            self._x402,
+            _AsyncConnection,
+            query=_query(model, call_id, extra_query),
+            headers=extra_headers,
+            options=websocket_connection_options or {},
+        )
+
+
+class PaidRealtime(Realtime):
+    """``client.realtime`` paying for sessions with the client's x402 client."""
+
+    def __init__(self, client: OpenAI, x402_client: Any) -> None:
+        super().__init__(client)
+        self._x402 = x402_client
+
+    def connect(  # type: ignore[override]
+        self,
+        *,
+        call_id: str | Omit = omit,
+        model: str | Omit = omit,
+        extra_query: Mapping[str, Any] = {},
+        extra_headers: Mapping[str, Any] = {},
+        websocket_connection_options: WebsocketConnectionOptions | None = None,
+    ) -> ConnectionManager:
+        return ConnectionManager(
+            self._client,
+            self._x402,
+            _Connection,
+            query=_query(model, call_id, extra_query),
+            headers=extra_headers,
+            options=websocket_connection_options or {},
+        )
+
+
+class _PaidAsyncBetaRealtime(AsyncBetaRealtime):
+    def __init__(self, client: AsyncOpenAI, x402_client: Any) -> None:
+        super().__init__(client)
+        self._x402 = x402_client
+
+    def connect(  # type: ignore[override]
+        self,
+        *,
+        model: str,
+        extra_query: Mapping[str, Any] = {},
+        extra_headers: Mapping[str, Any] = {},
+        websocket_connection_options: WebsocketConnectionOptions | None = None,
+    ) -> AsyncConnectionManager:
+        return AsyncConnectionManager(
+            self._client,
+            self._x402,
+            _AsyncBetaConnection,
+            query=_query(model, omit, extra_query),
+            headers={"OpenAI-Beta": "realtime=v1", **extra_headers},
+            options=websocket_connection_options or {},
+        )
+
+
+class _PaidBetaRealtime(BetaRealtime):
+    def __init__(self, client: OpenAI, x402_client: Any) -> None:
+        super().__init__(client)
+        self._x402 = x402_client
+
+    def connect(  # type: ignore[override]
+        self,
+        *,
+        model: str,
+        extra_query: Mapping[str, Any] = {},
+        extra_headers: Mapping[str, Any] = {},
+        websocket_connection_options: WebsocketConnectionOptions | None = None,
+    ) -> ConnectionManager:
+        return ConnectionManager(
+            self._client,
+            self._x402,
+            _BetaConnection,
+            query=_query(model, omit, extra_query),
+            headers={"OpenAI-Beta": "realtime=v1", **extra_headers},
+            options=websocket_connection_options or {},
+        )
+
+
+class PaidAsyncBeta(AsyncBeta):
+    """``client.beta`` whose ``realtime`` pays for sessions."""
+
+    def __init__(self, client: AsyncOpenAI, x402_client: Any) -> None:
+        super().__init__(client)
+        self._x402 = x402_client
+
+    @cached_property
+    def realtime(self) -> AsyncBetaRealtime:
+        return _PaidAsyncBetaRealtime(self._client, self._x402)
+
+
+class PaidBeta(Beta):
+    """``client.beta`` whose ``realtime`` pays for sessions."""
+
+    def __init__(self, client: OpenAI, x402_client: Any) -> None:
+        super().__init__(client)
+        self._x402 = x402_client
+
+    @cached_property
+    def realtime(self) -> BetaRealtime:
+        return _PaidBetaRealtime(self._client, self._x402)
@@ -0,0 +1,230 @@
+"""Opt-in recording of x402 traffic shapes to a JSONL trace.
+
+A :class:`TrafficRecorder` passed to a transport (``recorder=``) wraps its
+inner transport and writes one JSON line per upstream HTTP attempt:
+
+- ``id`` — exchange id shared by the unpaid attempt and its paid retries;
+- ``t`` — start offset in seconds from the recorder's creation;
+- ``method``, ``host``, ``path`` (query string dropped), ``request_bytes``;
+- ``paid`` — whether the attempt carried a payment header;
+- ``status``, ``latency`` (to response headers), ``duration`` (to body
+  close), ``response_bytes``, ``stream`` (``text/event-stream`` body);
+- ``challenge`` — for 402s, the payment-requirements headers and body;
+- ``settled`` — whether a settlement header was returned;
+- ``error`` — exception class name when the attempt raised.
+
+Redaction is by allowlist: no request headers, query strings or bodies are
+written, payment signatures are reduced to ``paid``, and settlement headers
+to ``settled``.  :mod:`x402_openai.replay` plays a trace back offline.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from x402_openai._streams import AsyncObservedStream, ObservedStream
+
+if TYPE_CHECKING:
+    import os
+
+TRACE_ID_EXTENSION = "x402_trace_id"
+
+# Request headers that carry a signed payment (v2 and v1).
+PAYMENT_HEADERS = ("payment-signature", "x-payment")
+
+# 402 response headers describing the payment requirements.
+_CHALLENGE_HEADERS = ("payment-required", "content-type")
+
+_SETTLEMENT_HEADERS = ("payment-response", "x-payment-response")
+
+
+class TrafficRecorder:
+    """Append redacted x402 traffic records to a JSONL file.
+
+    Thread-safe; one recorder can be shared by several transports.
+
+    Parameters
+    ----------
+    path:
+        Trace file, opened for appending.
+
+    Examples
+    --------
+    ::
+
+        recorder = TrafficRecorder("x402-trace.jsonl")
+        client = X402OpenAI(wallet=wallet, recorder=recorder)
+        ...
+        recorder.close()
+    """
+
+    __slots__ = ("_epoch", "_file", "_ids", "_lock")
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self._file = open(path, "a", encoding="utf-8")  # noqa: SIM115
+        self._lock = threading.Lock()
+        self._ids = itertools.count()
+        self._epoch = time.monotonic()
+
+    def exchange_id(self, request: httpx.Request) -> int:
+        """Return the exchange id of *request*, assigning one on first sight."""
+        trace_id = request.extensions.get(TRACE_ID_EXTENSION)
+        if trace_id is None:
+            # itertools.count is not thread-safe without the GIL.
+            with self._lock:
+                trace_id = next(self._ids)
+            request.extensions[TRACE_ID_EXTENSION] = trace_id
+        return int(trace_id)
+
+    def offset(self, at: float) -> float:
+        """Return monotonic time *at* relative to the recorder's creation."""
+        return round(at - self._epoch, 6)
+
+    def write(self, record: dict[str, Any]) -> None:
+        """Append one record."""
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with self._lock:
+            if not self._file.closed:
+                self._file.write(line)
+                self._file.flush()
+
+    def close(self) -> None:
+        """Close the trace file."""
+        with self._lock:
+            self._file.close()
+
+
+def load_trace(path: str | os.PathLike[str]) -> list[dict[str, Any]]:
+    """Read the records of a trace file."""
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class _Attempt:
+    """Accumulates one attempt's record until its body is closed."""
+
+    __slots__ = ("challenge", "record", "recorder", "start")
+
+    def __init__(self, recorder: TrafficRecorder, request: httpx.Request) -> None:
+        self.recorder = recorder
+        self.start = time.monotonic()
+        self.challenge: list[bytes] = []
+        try:
+            request_bytes = len(request.content)
+        except httpx.RequestNotRead:
+            request_bytes = int(request.headers.get("content-length", 0))
+        self.record: dict[str, Any] = {
+            "id": recorder.exchange_id(request),
+            "t": recorder.offset(self.start),
+            "method": request.method,
+            "host": request.url.host,
+            "path": request.url.path,
+            "paid": any(h in request.headers for h in PAYMENT_HEADERS),
+            "request_bytes": request_bytes,
+        }
+
+    def failed(self, exc: BaseException) -> None:
+        self.record["error"] = type(exc).__name__
+        self.record["latency"] = round(time.monotonic() - self.start, 6)
+        self.recorder.write(self.record)
+
+    def responded(self, response: httpx.Response) -> bool:
+        """Record the response head; return False if the body is already read."""
+        headers = response.headers
+        self.record.update(
+            status=response.status_code,
+            latency=round(time.monotonic() - self.start, 6),
+            stream=headers.get("content-type", "").startswith("text/event-stream"),
+            settled=any(h in headers for h in _SETTLEMENT_HEADERS),
+            response_bytes=0,
+        )
+        if not response.is_closed:
+            return True
+        # Already-read responses never close their stream again.
+        self.chunk(response.content)
+        self.closed(True, headers)
+        return False
+
+    def chunk(self, chunk: bytes) -> None:
+        self.record["response_bytes"] += len(chunk)
+        if self.record["status"] == 402:
+            self.challenge.append(chunk)
+
+    def closed(self, completed: bool, headers: httpx.Headers) -> None:
+        self.record["duration"] = round(time.monotonic() - self.start, 6)
+        if self.record["status"] == 402:
+            self.record["challenge"] = {
+                "headers": {h: headers[h] for h in _CHALLENGE_HEADERS if h in headers},
+                "body": b"".join(self.challenge).decode("utf-8", "replace"),
+            }
+        if not completed:
+            self.record["error"] = "Incomplete"
+        self.recorder.write(self.record)
+
+
+class RecordingTransport(httpx.BaseTransport):
+    """Sync transport wrapper writing every attempt to a :class:`TrafficRecorder`."""
+
+    __slots__ = ("_inner", "_recorder")
+
+    def __init__(self, inner: httpx.BaseTransport, recorder: TrafficRecorder) -> None:
+        self._inner = inner
+        self._recorder = recorder
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = _Attempt(self._recorder, request)
+        try:
+            response = self._inner.handle_request(request)
+        except BaseException as exc:
+            attempt.failed(exc)
+            raise
+        if not attempt.responded(response):
+            return response
+        assert isinstance(response.stream, httpx.SyncByteStream)
+        headers = response.headers
+        response.stream = ObservedStream(
+            response.stream,
+            on_chunk=attempt.chunk,
+            on_close=lambda completed: attempt.closed(completed, headers),
+        )
+        return response
+
+    def close(self) -> None:
+        self._inner.close()
+
+
+class AsyncRecordingTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of :class:`RecordingTransport`."""
+
+    __slots__ = ("_inner", "_recorder")
+
+    def __init__(self, inner: httpx.AsyncBaseTransport, recorder: TrafficRecorder) -> None:
+        self._inner = inner
+        self._recorder = recorder
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = _Attempt(self._recorder, request)
+        try:
+            response = await self._inner.handle_async_request(request)
+        except BaseException as exc:
+            attempt.failed(exc)
+            raise
+        if not attempt.responded(response):
+            return response
+        assert isinstance(response.stream, httpx.AsyncByteStream)
+        headers = response.headers
+        response.stream = AsyncObservedStream(
+            response.stream,
+            on_chunk=attempt.chunk,
+            on_close=lambda completed: attempt.closed(completed, headers),
+        )
+        return response
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
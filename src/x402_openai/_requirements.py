@@ -0,0 +1,260 @@
+"""Cross-process cache of x402 payment requirements.
+
+Without it every process pays for a discovery round trip: the first
+request to an endpoint goes out unpaid, comes back ``402`` with the
+payment requirements, and only then is signed and resent.  Pre-fork
+servers (gunicorn, uvicorn with ``--workers``) repeat that per worker.
+
+A :class:`RequirementsCache` keeps the ``402`` challenges that led to an
+accepted payment in a memory-mapped file.  Transports look up a request's
+challenge before sending it; on a hit they sign up front and send the paid
+request directly.  If the server answers ``402`` anyway (prices changed),
+the entry is dropped and the normal challenge flow takes over.  If signing
+fails locally (e.g. this worker has no wallet for the network), the request
+falls back to that flow too, but the entry stays for the other processes.
+
+Layout: a header, then fixed-size slots addressed by key hash.  Each slot
+starts with a sequence number that writers make odd while writing and even
+when done (a seqlock), so readers never lock: they copy the slot and retry
+if the sequence number moved.  Writers serialise through a POSIX record lock
+on the file plus a thread lock.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+from typing import TYPE_CHECKING
+
+try:
+    import fcntl
+except ImportError:  # Windows: writers are serialised within one process only.
+    fcntl = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+# File header: magic, slot count, slot size.
+_MAGIC = b"X402REQ1"
+_HEADER = struct.Struct("<8sII")
+_HEADER_SIZE = 64
+
+# Slot header: sequence number, expiry (epoch seconds), data length, key digest.
+_SEQ = struct.Struct("<Q")
+_SLOT = struct.Struct("<QdI16s")
+
+# Length prefix of the JSON headers block in slot data.
+_META_LEN = struct.Struct("<I")
+
+# 402 response headers the x402 client reads the requirements from.
+_CHALLENGE_HEADERS = ("payment-required", "content-type")
+
+# Attempts at a consistent read before treating a busy slot as a miss.
+_READ_ATTEMPTS = 3
+
+
+def requirements_key(request: httpx.Request) -> str:
+    """Return the key of the payment requirements for *request*.
+
+    Requirements depend on the endpoint and, for gateways pricing per model,
+    on the ``model`` of a JSON body — not on the rest of the body or the
+    query string.  The request body must already be read.
+    """
+    model = ""
+    body = request.content
+    if body:
+        try:
+            params = json.loads(body)
+        except ValueError:
+            params = None
+        if isinstance(params, dict):
+            model = str(params.get("model", ""))
+    url = request.url
+    return f"{request.method} {url.scheme}://{url.netloc.decode('ascii')}{url.path} {model}"
+
+
+class RequirementsCache:
+    """Memory-mapped cache of ``402`` challenges shared between processes.
+
+    Parameters
+    ----------
+    path:
+        Backing file, created if missing; every process opening the same
+        path shares the cache.  ``None`` (default) uses an anonymous
+        temporary file, shared only with processes forked after creation —
+        create the cache before the server forks its workers.
+    ttl:
+        Entry lifetime in seconds (default ``300``).
+    slots:
+        Number of entries (default ``1024``).  Keys hashing to the same slot
+        replace each other.  Ignored when *path* already holds a cache.
+    slot_size:
+        Bytes per entry (default ``8192``); larger challenges are not
+        cached.  Ignored when *path* already holds a cache.
+
+    Examples
+    --------
+    ::
+
+        # In the gunicorn master, before workers fork (--preload):
+        requirements = RequirementsCache()
+        client = X402OpenAI(wallet=wallet, requirements_cache=requirements)
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] | None = None,
+        *,
+        ttl: float = 300.0,
+        slots: int = 1024,
+        slot_size: int = 8192,
+    ) -> None:
+        if ttl <= 0:
+            raise ValueError("'ttl' must be positive.")
+        if slots <= 0:
+            raise ValueError("'slots' must be positive.")
+        if slot_size <= _SLOT.size + _META_LEN.size:
+            raise ValueError(f"'slot_size' must exceed {_SLOT.size + _META_LEN.size} bytes.")
+        self._ttl = ttl
+        if path is None:
+            self._file = tempfile.TemporaryFile()  # noqa: SIM115
+        else:
+            self._file = os.fdopen(os.open(path, os.O_RDWR | os.O_CREAT, 0o600), "r+b")
+        self._lock = threading.Lock()
+        with self._writing():
+            self._slots, self._slot_size = self._initialise(slots, slot_size)
+        self._map = mmap.mmap(self._file.fileno(), _HEADER_SIZE + self._slots * self._slot_size)
+        self._counter_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _initialise(self, slots: int, slot_size: int) -> tuple[int, int]:
+        """Adopt the geometry of an existing cache file or lay out a new one.
+
+        Caller holds the write lock.
+        """
+        self._file.seek(0)
+        magic, stored_slots, stored_size = _HEADER.unpack(
+            self._file.read(_HEADER.size).ljust(_HEADER.size, b"\0")
+        )
+        if magic == _MAGIC and stored_slots and stored_size > _SLOT.size + _META_LEN.size:
+            return stored_slots, stored_size
+        self._file.truncate(0)
+        self._file.truncate(_HEADER_SIZE + slots * slot_size)
+        self._file.seek(0)
+        self._file.write(_HEADER.pack(_MAGIC, slots, slot_size))
+        self._file.flush()
+        return slots, slot_size
+
+    def get(self, key: str) -> tuple[dict[str, str], bytes] | None:
+        """Return the live challenge ``(headers, body)`` under *key*, if any."""
+        entry = self._read(key)
+        with self._counter_lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return entry
+
+    def set(self, key: str, headers: Mapping[str, str], body: bytes) -> None:
+        """Store the challenge of a ``402`` response under *key*.
+
+        Only the headers carrying the requirements are kept.
+        """
+        meta = json.dumps(
+            {name: headers[name] for name in _CHALLENGE_HEADERS if name in headers}
+        ).encode()
+        data = _META_LEN.pack(len(meta)) + meta + body
+        if _SLOT.size + len(data) > self._slot_size:
+            logger.debug("x402 requirements: %d-byte challenge does not fit a slot", len(data))
+            return
+        self._write(key, time.time() + self._ttl, data)
+
+    def delete(self, key: str) -> None:
+        """Drop the entry under *key*, if present."""
+        if self._read(key) is not None:
+            self._write(key, 0.0, b"")
+
+    def stats(self) -> dict[str, int]:
+        """Return a snapshot of the hit/miss counters."""
+        with self._counter_lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+    def close(self) -> None:
+        """Unmap and close the backing file."""
+        self._map.close()
+        self._file.close()
+
+    def _slot(self, digest: bytes) -> int:
+        return _HEADER_SIZE + int.from_bytes(digest[:8], "little") % self._slots * self._slot_size
+
+    def _read(self, key: str) -> tuple[dict[str, str], bytes] | None:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        offset = self._slot(digest)
+        for _ in range(_READ_ATTEMPTS):
+            seq, expires, length, stored = _SLOT.unpack_from(self._map, offset)
+            if seq % 2:
+                continue  # A writer is mid-update.
+            if (
+                stored != digest
+                or expires < time.time()
+                or not length
+                or _SLOT.size + length > self._slot_size
+            ):
+                data = None
+            else:
+                start = offset + _SLOT.size
+                data = self._map[start : start + length]
+            if _SEQ.unpack_from(self._map, offset)[0] == seq:
+                break
+        else:
+            return None
+        if data is None:
+            return None
+        # Slots are written by other processes: anything undecodable is a miss.
+        try:
+            (meta_len,) = _META_LEN.unpack_from(data)
+            headers = json.loads(data[_META_LEN.size : _META_LEN.size + meta_len])
+        except (struct.error, ValueError):
+            logger.debug("x402 requirements: ignoring undecodable slot for %s", key)
+            return None
+        if not isinstance(headers, dict) or not all(isinstance(v, str) for v in headers.values()):
+            return None
+        return headers, data[_META_LEN.size + meta_len :]
+
+    def _write(self, key: str, expires: float, data: bytes) -> None:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        offset = self._slot(digest)
+        with self._writing():
+            (seq,) = _SEQ.unpack_from(self._map, offset)
+            seq += seq % 2  # Recover from a writer that died mid-update.
+            _SEQ.pack_into(self._map, offset, seq + 1)
+            start = offset + _SLOT.size
+            self._map[start : start + len(data)] = data
+            _SLOT.pack_into(self._map, offset, seq + 1, expires, len(data), digest)
+            _SEQ.pack_into(self._map, offset, seq + 2)
+
+    @contextlib.contextmanager
+    def _writing(self) -> Iterator[None]:
+        """Hold the thread lock and, where available, the file's record lock."""
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            fcntl.lockf(self._file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.lockf(self._file.fileno(), fcntl.LOCK_UN)
@@ -0,0 +1,220 @@
+"""Per-request wallet routing for multi-tenant servers.
+
+A :class:`WalletRegistry` stands in for the ``x402_client`` of a single
+:class:`~x402_openai.X402OpenAI` (or transport) and picks the paying wallet
+for every 402 challenge, so all tenants share one ``httpx`` connection pool.
+
+The wallet is selected by key:
+
+- :func:`use_wallet` — a context manager setting the key for the current
+  thread or ``asyncio`` task (works through the OpenAI SDK);
+- the ``"x402_wallet"`` request extension — for direct ``httpx`` use; it
+  takes precedence over the context.
+
+Keys are resolved lazily through a ``loader(key)`` callable, and the
+resulting x402 clients are kept in an LRU of bounded size.
+
+Response caching, request coalescing and embedding batching are scoped by
+:func:`caller_identity`: the selected wallet and the credential headers.
+Identical requests from different tenants never share a response or a
+payment; each tenant pays for its own.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import threading
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any
+
+from x402_openai._wallet import create_x402_http_client
+from x402_openai.wallets._base import Wallet
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    import httpx
+
+WALLET_EXTENSION = "x402_wallet"
+
+# Request headers naming the account a request is made and billed for, or
+# changing what upstream returns for the same body.
+IDENTITY_HEADERS = (
+    "authorization",
+    "api-key",
+    "openai-organization",
+    "openai-project",
+    "openai-beta",
+)
+
+_current_wallet: ContextVar[str | None] = ContextVar("x402_wallet", default=None)
+
+
+@contextlib.contextmanager
+def use_wallet(key: str) -> Iterator[None]:
+    """Pay for requests made inside the block with the wallet named *key*."""
+    token = _current_wallet.set(key)
+    try:
+        yield
+    finally:
+        _current_wallet.reset(token)
+
+
+def wallet_scope(request: httpx.Request) -> contextlib.AbstractContextManager[None]:
+    """Apply the request's ``"x402_wallet"`` extension, if any, to the context."""
+    key = request.extensions.get(WALLET_EXTENSION)
+    return use_wallet(key) if key is not None else contextlib.nullcontext()
+
+
+def selected_wallet(request: httpx.Request) -> str | None:
+    """Return the wallet key *request* is paid with, or ``None`` if unset."""
+    key = request.extensions.get(WALLET_EXTENSION)
+    return str(key) if key is not None else _current_wallet.get()
+
+
+def caller_identity(request: httpx.Request) -> str:
+    """Return what tells *request*'s caller apart: credential headers and wallet.
+
+    Requests with different identities must never share an upstream call or
+    its payment.
+    """
+    parts = [
+        f"{name}:{value}" for name in IDENTITY_HEADERS for value in request.headers.get_list(name)
+    ]
+    parts.append(f"wallet:{selected_wallet(request) or ''}")
+    return "\n".join(parts)
+
+
+class _Registry:
+    """LRU of x402 HTTP clients built lazily from ``loader(key)``."""
+
+    __slots__ = ("_clients", "_loader", "_lock", "_max_wallets", "_policies", "_sync")
+
+    def __init__(
+        self,
+        loader: Callable[[str], Any],
+        *,
+        max_wallets: int,
+        policies: list[Any] | None,
+        sync: bool,
+    ) -> None:
+        if max_wallets < 1:
+            raise ValueError("'max_wallets' must be at least 1.")
+        self._loader = loader
+        self._max_wallets = max_wallets
+        self._policies = policies
+        self._sync = sync
+        self._clients: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def client_for(self, key: str) -> Any:
+        """Return the x402 HTTP client for wallet *key*, loading it if needed."""
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self._clients.move_to_end(key)
+                return client
+
+        client = self._build(self._loader(key))
+        with self._lock:
+            client = self._clients.setdefault(key, client)
+            self._clients.move_to_end(key)
+            while len(self._clients) > self._max_wallets:
+                self._clients.popitem(last=False)
+        return client
+
+    def evict(self, key: str) -> None:
+        """Forget wallet *key*; it is loaded again on next use."""
+        with self._lock:
+            self._clients.pop(key, None)
+
+    def _current(self) -> Any:
+        key = _current_wallet.get()
+        if key is None:
+            raise LookupError(
+                "No x402 wallet selected — wrap the call in use_wallet(key) "
+                f"or set the {WALLET_EXTENSION!r} request extension."
+            )
+        return self.client_for(key)
+
+    def _build(self, loaded: Any) -> Any:
+        if isinstance(loaded, Wallet):
+            return create_x402_http_client(wallet=loaded, policies=self._policies, sync=self._sync)
+        if isinstance(loaded, list):
+            return create_x402_http_client(
+                wallets=loaded, policies=self._policies, sync=self._sync
+            )
+        return create_x402_http_client(x402_client=loaded)
+
+
+class WalletRegistry(_Registry):
+    """Route x402 payments to a per-request wallet (sync).
+
+    Pass it as ``x402_client`` to :class:`~x402_openai.X402OpenAI` or
+    :class:`~x402_openai.X402Transport`.
+
+    Parameters
+    ----------
+    loader:
+        ``loader(key)`` returning a :class:`~x402_openai.wallets.Wallet`, a
+        list of wallets, or a pre-built ``x402HTTPClientSync`` for the key.
+        Called once per key until it is evicted.
+    max_wallets:
+        Wallets kept loaded; the least recently used is evicted beyond this
+        (default ``1024``).
+    policies:
+        x402 policies registered on every wallet's client.
+
+    Examples
+    --------
+    ::
+
+        registry = WalletRegistry(lambda tenant: EvmWallet(private_key=keys[tenant]))
+        client = X402OpenAI(x402_client=registry)
+
+        with use_wallet("tenant-a"):
+            client.chat.completions.create(...)
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        loader: Callable[[str], Any],
+        *,
+        max_wallets: int = 1024,
+        policies: list[Any] | None = None,
+    ) -> None:
+        super().__init__(loader, max_wallets=max_wallets, policies=policies, sync=True)
+
+    def handle_402_response(self, headers: dict[str, str], body: bytes) -> Any:
+        """Sign the challenge with the currently selected wallet."""
+        return self._current().handle_402_response(headers, body)
+
+
+class AsyncWalletRegistry(_Registry):
+    """Async counterpart of :class:`WalletRegistry`.
+
+    Pass it as ``x402_client`` to :class:`~x402_openai.AsyncX402OpenAI` or
+    :class:`~x402_openai.AsyncX402Transport`; a pre-built client returned by
+    *loader* must be an ``x402HTTPClient``.
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        loader: Callable[[str], Any],
+        *,
+        max_wallets: int = 1024,
+        policies: list[Any] | None = None,
+    ) -> None:
+        super().__init__(loader, max_wallets=max_wallets, policies=policies, sync=False)
+
+    async def handle_402_response(self, headers: dict[str, str], body: bytes) -> Any:
+        """Sign the challenge with the currently selected wallet."""
+        return await self._current().handle_402_response(headers, body)
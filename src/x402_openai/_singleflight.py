@@ -0,0 +1,151 @@
+"""Single-flight coalescing of identical in-flight requests.
+
+When several callers send the same non-streaming request at the same time,
+only the first one (the *leader*) goes upstream and pays; the others wait
+for its response and receive a copy of the same status, headers and body.
+
+- :class:`SingleFlight` — thread-based, for :class:`~x402_openai.X402Transport`.
+- :class:`AsyncSingleFlight` — task-based, for
+  :class:`~x402_openai.AsyncX402Transport`.
+
+Requests are identified by :func:`~x402_openai._cache.request_key` over
+their method, URL, body and caller identity (credential headers and
+wallet), so callers paying with different accounts never share a flight.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from typing import TYPE_CHECKING
+
+import httpx
+
+from x402_openai._cache import request_key
+from x402_openai._routing import caller_identity
+from x402_openai._streams import replay_response
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+_Result = tuple[int, list[tuple[str, str]], bytes]
+
+
+def coalesce_key(request: httpx.Request) -> str | None:
+    """Return the single-flight key for *request*, or ``None`` to opt out.
+
+    Streaming requests are never coalesced.  The request body must already
+    be read.
+    """
+    if request.method not in ("GET", "POST"):
+        return None
+    body = request.content
+    if body:
+        try:
+            params = json.loads(body)
+        except ValueError:
+            params = None
+        if isinstance(params, dict) and params.get("stream"):
+            return None
+    return request_key(request.method, str(request.url), body, caller_identity(request))
+
+
+class _Call:
+    """State shared between the leader and the waiters of one flight."""
+
+    __slots__ = ("done", "error", "result")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: _Result | None = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Share one upstream call between identical concurrent requests."""
+
+    __slots__ = ("_calls", "_lock")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[str, _Call] = {}
+
+    def do(self, key: str, send: Callable[[], httpx.Response]) -> httpx.Response:
+        """Return the response for *key*, calling *send* only if no flight is active."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            assert call.result is not None
+            return replay_response(*call.result)
+
+        try:
+            call.result = _drain(send())
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return replay_response(*call.result)
+
+
+class AsyncSingleFlight:
+    """Async counterpart of :class:`SingleFlight`.
+
+    The upstream call runs in its own task, so a cancelled caller (even the
+    one that started the flight) does not cancel it for the others.
+    """
+
+    __slots__ = ("_tasks",)
+
+    def __init__(self) -> None:
+        self._tasks: dict[str, asyncio.Task[_Result]] = {}
+
+    async def do(
+        self,
+        key: str,
+        send: Callable[[], Awaitable[httpx.Response]],
+    ) -> httpx.Response:
+        """Return the response for *key*, calling *send* only if no flight is active."""
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(_adrain(send))
+            self._tasks[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+        return replay_response(*await asyncio.shield(task))
+
+    def _forget(self, key: str, task: asyncio.Task[_Result]) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved even if every waiter went away.
+            task.exception()
+
+
+def _drain(response: httpx.Response) -> _Result:
+    """Read the raw body of a transport-level *response* and close it."""
+    assert isinstance(response.stream, httpx.SyncByteStream)
+    try:
+        body = b"".join(response.stream)
+    finally:
+        response.close()
+    return response.status_code, response.headers.multi_items(), body
+
+
+async def _adrain(send: Callable[[], Awaitable[httpx.Response]]) -> _Result:
+    response = await send()
+    assert isinstance(response.stream, httpx.AsyncByteStream)
+    try:
+        body = b"".join([chunk async for chunk in response.stream])
+    finally:
+        await response.aclose()
+    return response.status_code, response.headers.multi_items(), body
@@ -0,0 +1,281 @@
+"""Local stand-in x402 gateway for the load generator, replays and the benchmarks.
+
+Answers OpenAI-style requests with a real x402 v2 ``exact`` EVM challenge
+(Base USDC) until the request carries a payment header, then with a small
+chat completion (or SSE stream when ``"stream": true``).  Payments are not
+verified, so any signed header passes.  ``GET …/models`` is free.
+
+Run it in a separate process so it does not compete with the client under
+test for the interpreter: ``with StandInGateway() as url: ...``.  Other
+answers (such as the recorded ones of :mod:`x402_openai.replay`) plug in
+through ``answer=``.
+
+:class:`RealtimeStandIn` does the same for the Realtime (WebSocket) API:
+it refuses unpaid upgrades with the challenge and renews the payment of
+long sessions with ``x402.payment_required`` events.  It runs on an event
+loop in a background thread (``websockets`` required).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import multiprocessing
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_USDC_BASE = "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913"
+
+_COMPLETION = {
+    "id": "chatcmpl-standin",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "stand-in",
+    "choices": [
+        {
+            "index": 0,
+            "message": {"role": "assistant", "content": "ok"},
+            "finish_reason": "stop",
+        }
+    ],
+    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+}
+
+
+def challenge_header() -> str:
+    """Return a ``payment-required`` header value for a 0.001 USDC payment."""
+    from x402.http.utils import encode_payment_required_header
+    from x402.schemas import PaymentRequired, PaymentRequirements
+
+    return encode_payment_required_header(
+        PaymentRequired(
+            accepts=[
+                PaymentRequirements(
+                    scheme="exact",
+                    network="eip155:8453",
+                    asset=_USDC_BASE,
+                    amount="1000",
+                    pay_to="0x" + os.urandom(20).hex(),
+                    max_timeout_seconds=300,
+                    extra={"name": "USD Coin", "version": "2"},
+                )
+            ]
+        )
+    )
+
+
+class _Paywall:
+    """Default answers: the challenge until paid, then a completion or stream."""
+
+    def __init__(self, latency: float, chunk_delay: float) -> None:
+        self._latency = latency
+        self._chunk_delay = chunk_delay
+        self._challenge = challenge_header()
+        self._completion = json.dumps(_COMPLETION).encode()
+        self._models = json.dumps(
+            {"object": "list", "data": [{"id": "stand-in", "object": "model", "owned_by": "x402"}]}
+        ).encode()
+        chunk = {**_COMPLETION, "object": "chat.completion.chunk"}
+        self._events = [b"data: " + json.dumps(chunk).encode() + b"\n\n" for _ in range(8)]
+        self._events.append(b"data: [DONE]\n\n")
+
+    def __call__(self, handler: BaseHTTPRequestHandler) -> None:
+        body = handler.rfile.read(int(handler.headers.get("content-length", 0)))
+        if handler.command == "GET" and handler.path.endswith("/models"):
+            self._reply(handler, [self._models], "application/json")
+            return
+        if "payment-signature" not in handler.headers and "x-payment" not in handler.headers:
+            handler.send_response(402)
+            handler.send_header("payment-required", self._challenge)
+            handler.send_header("content-length", "2")
+            handler.end_headers()
+            handler.wfile.write(b"{}")
+            return
+        if self._latency:
+            time.sleep(self._latency)
+        streaming = b'"stream": true' in body or b'"stream":true' in body
+        if streaming:
+            self._reply(handler, self._events, "text/event-stream")
+        else:
+            self._reply(handler, [self._completion], "application/json")
+
+    def _reply(
+        self, handler: BaseHTTPRequestHandler, parts: list[bytes], content_type: str
+    ) -> None:
+        handler.send_response(200)
+        handler.send_header("content-type", content_type)
+        handler.send_header("payment-response", "stand-in")
+        handler.send_header("content-length", str(sum(map(len, parts))))
+        handler.end_headers()
+        for i, part in enumerate(parts):
+            if i and self._chunk_delay:
+                time.sleep(self._chunk_delay)
+            handler.wfile.write(part)
+
+
+def _serve(port: Any, answer: Callable[[BaseHTTPRequestHandler], None]) -> None:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self) -> None:
+            answer(self)
+
+        do_POST = do_PUT = do_DELETE = do_GET  # noqa: N815
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    ThreadingHTTPServer.request_queue_size = 1024
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    port.put(server.server_address[1])
+    server.serve_forever()
+
+
+class StandInGateway:
+    """Run the stand-in gateway in a child process; ``__enter__`` returns its base URL.
+
+    Parameters
+    ----------
+    latency:
+        Seconds the gateway waits before answering a paid request.
+    chunk_delay:
+        Seconds between the events of a streamed answer.
+    answer:
+        Picklable ``answer(handler)`` called with the ``BaseHTTPRequestHandler``
+        of every request, replacing the default challenge-then-completion
+        answers (and *latency* and *chunk_delay*).
+    prefix:
+        Path appended to the returned base URL (default ``"/v1"``).
+    """
+
+    def __init__(
+        self,
+        *,
+        latency: float = 0.0,
+        chunk_delay: float = 0.0,
+        answer: Callable[[BaseHTTPRequestHandler], None] | None = None,
+        prefix: str = "/v1",
+    ) -> None:
+        self._answer = answer or _Paywall(latency, chunk_delay)
+        self._prefix = prefix
+        self._process: multiprocessing.Process | None = None
+
+    def __enter__(self) -> str:
+        port: Any = multiprocessing.Queue()
+        self._process = multiprocessing.Process(
+            target=_serve, args=(port, self._answer), daemon=True
+        )
+        self._process.start()
+        return f"http://127.0.0.1:{port.get(timeout=30)}{self._prefix}"
+
+    def __exit__(self, *exc: object) -> None:
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join()
+
+
+class RealtimeStandIn:
+    """Stand-in realtime gateway; ``__enter__`` returns its WebSocket base URL.
+
+    Refuses the upgrade with an x402 challenge unless it carries a payment,
+    then answers every client event with a ``response.done`` event.  After
+    every *renew_every* answers it sends an ``x402.payment_required`` event
+    and holds further answers until an ``x402.payment`` event arrives.
+
+    Parameters
+    ----------
+    renew_every:
+        Answers per payment; ``0`` (default) never renews.
+
+    Attributes
+    ----------
+    payments:
+        Payment header values received, at upgrades and renewals.
+    """
+
+    def __init__(self, *, renew_every: int = 0) -> None:
+        self.payments: list[str] = []
+        self._renew_every = renew_every
+        self._challenge = challenge_header()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._server: Any = None
+
+    def __enter__(self) -> str:
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        self._server = asyncio.run_coroutine_threadsafe(self._start(), self._loop).result(30)
+        return f"ws://127.0.0.1:{self._server.sockets[0].getsockname()[1]}/v1"
+
+    def __exit__(self, *exc: object) -> None:
+        assert self._loop is not None and self._thread is not None
+        asyncio.run_coroutine_threadsafe(self._stop(), self._loop).result(30)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    async def _start(self) -> Any:
+        from websockets.asyncio.server import serve
+
+        return await serve(self._session, "127.0.0.1", 0, process_request=self._upgrade)
+
+    async def _stop(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    def _upgrade(self, connection: Any, request: Any) -> Any:
+        payment = request.headers.get("payment-signature") or request.headers.get("x-payment")
+        if payment is None:
+            response = connection.respond(402, "{}")
+            response.headers["payment-required"] = self._challenge
+            return response
+        self.payments.append(payment)
+        return None
+
+    async def _session(self, websocket: Any) -> None:
+        await websocket.send(json.dumps({"type": "session.created", "event_id": "evt_0"}))
+        queued: list[dict[str, Any]] = []
+        answered = 0
+        owed = False
+        async for message in websocket:
+            event = json.loads(message)
+            if event.get("type") == "x402.payment":
+                headers = {name.lower(): value for name, value in event["headers"].items()}
+                self.payments.append(headers.get("payment-signature") or headers["x-payment"])
+                owed = False
+            else:
+                queued.append(event)
+            while queued and not owed:
+                answered += 1
+                await websocket.send(self._answer(queued.pop(0), answered))
+                if self._renew_every and answered % self._renew_every == 0:
+                    renewal = {
+                        "type": "x402.payment_required",
+                        "payment_required": self._challenge,
+                    }
+                    await websocket.send(json.dumps(renewal))
+                    owed = True
+
+    @staticmethod
+    def _answer(event: dict[str, Any], number: int) -> str:
+        return json.dumps(
+            {
+                "type": "response.done",
+                "event_id": f"evt_{number}",
+                "response": {
+                    "id": f"resp_{number}",
+                    "object": "realtime.response",
+                    "status": "completed",
+                    "output": [],
+                    "metadata": {"echo": event.get("type")},
+                },
+            }
+        )
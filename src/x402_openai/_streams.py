@@ -0,0 +1,112 @@
+"""Byte-stream wrappers used by the transports to observe response bodies.
+
+The transports return responses whose bodies have not been read yet, so any
+feature that needs the full body (caching) or needs to know when the caller
+is done with it (slot release, metrics) wraps ``response.stream``:
+
+- :class:`ObservedStream` — for ``httpx.SyncByteStream``.
+- :class:`AsyncObservedStream` — for ``httpx.AsyncByteStream``.
+
+Both pass raw (still content-encoded) chunks through unchanged.
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Callable, Iterator
+
+import httpx
+
+ChunkHook = Callable[[bytes], None]
+CloseHook = Callable[[bool], None]
+
+
+class ObservedStream(httpx.SyncByteStream):
+    """Wrap a sync byte stream and report chunks and closure.
+
+    Parameters
+    ----------
+    on_chunk:
+        Called with every chunk as it is yielded.
+    on_close:
+        Called once when the stream is closed, with ``True`` if it was
+        consumed to the end.
+    """
+
+    __slots__ = ("_closed", "_completed", "_on_chunk", "_on_close", "_stream")
+
+    def __init__(
+        self,
+        stream: httpx.SyncByteStream,
+        *,
+        on_chunk: ChunkHook | None = None,
+        on_close: CloseHook | None = None,
+    ) -> None:
+        self._stream = stream
+        self._on_chunk = on_chunk
+        self._on_close = on_close
+        self._completed = False
+        self._closed = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._stream:
+            if self._on_chunk is not None:
+                self._on_chunk(chunk)
+            yield chunk
+        self._completed = True
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._stream.close()
+        finally:
+            if self._on_close is not None:
+                self._on_close(self._completed)
+
+
+class AsyncObservedStream(httpx.AsyncByteStream):
+    """Async counterpart of :class:`ObservedStream`."""
+
+    __slots__ = ("_closed", "_completed", "_on_chunk", "_on_close", "_stream")
+
+    def __init__(
+        self,
+        stream: httpx.AsyncByteStream,
+        *,
+        on_chunk: ChunkHook | None = None,
+        on_close: CloseHook | None = None,
+    ) -> None:
+        self._stream = stream
+        self._on_chunk = on_chunk
+        self._on_close = on_close
+        self._completed = False
+        self._closed = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            if self._on_chunk is not None:
+                self._on_chunk(chunk)
+            yield chunk
+        self._completed = True
+
+    async def aclose(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._on_close is not None:
+                self._on_close(self._completed)
+
+
+def replay_response(
+    status_code: int, headers: list[tuple[str, str]], body: bytes
+) -> httpx.Response:
+    """Build an unread transport-level response that replays *body*.
+
+    *headers* may describe a content-encoded *body*; it is decoded by the
+    client exactly as if it had arrived from the network.
+    """
+    return httpx.Response(status_code, headers=headers, stream=httpx.ByteStream(body))
@@ -12,11 +12,40 @@ Two flavours:
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any
+import time
+from typing import TYPE_CHECKING, Any
 
 import httpx
 
+from x402_openai._cache import CachedResponse
+from x402_openai._concurrency import is_overload
+from x402_openai._deadline import (
+    X402DeadlineExceeded,
+    bound_timeouts,
+    enforce_deadline,
+    require_time,
+    sleep_allowed,
+    start_deadline,
+)
+from x402_openai._paid_retry import RETRY_ERRORS, is_unsettled_failure, retry_delay, valid_until
+from x402_openai._recording import AsyncRecordingTransport, RecordingTransport
+from x402_openai._requirements import requirements_key
+from x402_openai._routing import wallet_scope
+from x402_openai._singleflight import AsyncSingleFlight, SingleFlight, coalesce_key
+from x402_openai._streams import AsyncObservedStream, ObservedStream, replay_response
+
+if TYPE_CHECKING:
+    from x402_openai._batching import EmbeddingBatcher
+    from x402_openai._cache import ResponseCache
+    from x402_openai._compression import RequestCompressor
+    from x402_openai._concurrency import AdaptiveLimiter, AsyncAdaptiveLimiter
+    from x402_openai._metrics import PaymentMetrics
+    from x402_openai._recording import TrafficRecorder
+    from x402_openai._requirements import RequirementsCache
+    from x402_openai._streams import ChunkHook, CloseHook
+
 logger = logging.getLogger(__name__)
 
 
@@ -46,6 +75,29 @@ def _clone_request_with_headers(
     )
 
 
+def _capture_hooks(
+    cache: ResponseCache,
+    key: str,
+    response: httpx.Response,
+) -> tuple[ChunkHook, CloseHook]:
+    """Return stream hooks that store *response* in *cache* once fully read."""
+    chunks: list[bytes] = []
+    status_code = response.status_code
+    headers = response.headers.multi_items()
+
+    def on_close(completed: bool) -> None:
+        if completed:
+            cache.set(key, CachedResponse(status_code, headers, b"".join(chunks)))
+
+    return chunks.append, on_close
+
+
+def _signed(metrics: PaymentMetrics | None, started: float, *, ok: bool) -> None:
+    """Record a signing attempt begun at monotonic time *started*."""
+    if metrics is not None:
+        metrics.signed(time.monotonic() - started, ok=ok)
+
+
 class X402Transport(httpx.BaseTransport):
     """Synchronous httpx transport with automatic x402 payment handling.
 
@@ -55,49 +107,300 @@ class X402Transport(httpx.BaseTransport):
         A configured ``x402HTTPClientSync`` with registered payment schemes.
     inner:
         Underlying transport to delegate to.  Defaults to ``httpx.HTTPTransport()``.
+    cache:
+        Optional :class:`~x402_openai.ResponseCache`.  Deterministic requests
+        found in the cache are answered without network access or payment.
+    coalesce:
+        When True, identical non-streaming requests in flight at the same
+        time share one upstream (paid) call.
+    limiter:
+        Optional :class:`~x402_openai.AdaptiveLimiter` bounding concurrent
+        upstream requests per gateway host.
+    paid_retries:
+        How often to resend the paid request with the same payment when it
+        fails before settlement (connection errors, ``5xx`` without a
+        settlement header).  Default ``2``; ``0`` disables.
+    recorder:
+        Optional :class:`~x402_openai.TrafficRecorder` writing a redacted
+        trace of every upstream attempt.
+    compressor:
+        Optional :class:`~x402_openai.RequestCompressor`; large bodies are
+        compressed once and the compressed bytes reused for the paid retry.
+    deadline:
+        Optional end-to-end budget in seconds per call, covering the unpaid
+        attempt, signing and the paid retry.  The ``"x402_deadline"``
+        request extension overrides it per request.
+    metrics:
+        Optional :class:`~x402_openai.PaymentMetrics` registry recording
+        request, challenge, signing and payment metrics.
+    requirements:
+        Optional :class:`~x402_openai.RequirementsCache`.  Requests whose
+        payment requirements are cached are paid up front, skipping the
+        unpaid attempt.
     """
 
-    __slots__ = ("_inner", "_x402")
+    __slots__ = (
+        "_cache",
+        "_compressor",
+        "_deadline",
+        "_flights",
+        "_inner",
+        "_limiter",
+        "_metrics",
+        "_paid_retries",
+        "_requirements",
+        "_x402",
+    )
 
     def __init__(
         self,
         x402_client: Any,
         *,
         inner: httpx.BaseTransport | None = None,
+        cache: ResponseCache | None = None,
+        coalesce: bool = False,
+        limiter: AdaptiveLimiter | None = None,
+        paid_retries: int = 2,
+        recorder: TrafficRecorder | None = None,
+        compressor: RequestCompressor | None = None,
+        deadline: float | None = None,
+        metrics: PaymentMetrics | None = None,
+        requirements: RequirementsCache | None = None,
     ) -> None:
+        if paid_retries < 0:
+            raise ValueError("'paid_retries' must not be negative.")
+        if deadline is not None and deadline <= 0:
+            raise ValueError("'deadline' must be positive.")
         self._x402 = x402_client
         self._inner = inner or httpx.HTTPTransport()
+        if recorder is not None:
+            self._inner = RecordingTransport(self._inner, recorder)
+        self._cache = cache
+        self._flights = SingleFlight() if coalesce else None
+        self._limiter = limiter
+        self._paid_retries = paid_retries
+        self._compressor = compressor
+        self._deadline = deadline
+        self._metrics = metrics
+        self._requirements = requirements
 
     def handle_request(self, request: httpx.Request) -> httpx.Response:
         """Send *request*; on 402 sign payment and retry transparently."""
+        start_deadline(request, self._deadline)
+        if self._cache is None:
+            return self._dispatch(request)
+
+        request.read()
+        key = self._cache.key_for(request)
+        if key is None:
+            return self._dispatch(request)
+        hit = self._cache.get(key)
+        if hit is not None:
+            logger.debug("x402: cache hit %s %s", request.method, request.url)
+            return replay_response(hit.status_code, hit.headers, hit.content)
+
+        response = self._dispatch(request)
+        if response.status_code == 200:
+            assert isinstance(response.stream, httpx.SyncByteStream)
+            on_chunk, on_close = _capture_hooks(self._cache, key, response)
+            response.stream = ObservedStream(response.stream, on_chunk=on_chunk, on_close=on_close)
+        return response
+
+    def _dispatch(self, request: httpx.Request) -> httpx.Response:
+        """Join an identical in-flight request if coalescing, else :meth:`_send`."""
+        if self._flights is not None:
+            request.read()
+            key = coalesce_key(request)
+            if key is not None:
+                return self._flights.do(key, lambda: self._send(request))
+        return self._send(request)
+
+    def _send(self, request: httpx.Request) -> httpx.Response:
+        """Run :meth:`_exchange` inside a concurrency slot when limiting."""
+        limiter = self._limiter
+        if limiter is None:
+            return self._exchange(request)
+
+        host = request.url.netloc.decode("ascii")
+        limiter.acquire(host)
+        start = time.monotonic()
+        try:
+            response = self._exchange(request)
+        except X402DeadlineExceeded:
+            # The caller's budget ran out; that says nothing about the gateway.
+            limiter.release(host)
+            raise
+        except httpx.TimeoutException:
+            limiter.release(host, overload=True)
+            raise
+        except BaseException:
+            limiter.release(host)
+            raise
+
+        latency = time.monotonic() - start if response.is_success else None
+        overload = is_overload(response)
+        if response.is_closed:
+            # Already-read responses never close their stream again.
+            limiter.release(host, latency=latency, overload=overload)
+            return response
+        assert isinstance(response.stream, httpx.SyncByteStream)
+        response.stream = ObservedStream(
+            response.stream,
+            on_close=lambda _: limiter.release(host, latency=latency, overload=overload),
+        )
+        return response
+
+    def _exchange(self, request: httpx.Request) -> httpx.Response:
+        """Run the unpaid attempt and, on 402, the paid retry."""
         logger.debug("x402: %s %s", request.method, request.url)
-        response = self._inner.handle_request(request)
+        metrics = self._metrics
+        if metrics is not None:
+            metrics.request()
+        sent = request
+        if self._compressor is not None:
+            request.read()
+            sent = self._compressor.compress(request)
+        started = time.monotonic()
+        response = self._prepay(request, sent) if self._requirements is not None else None
+        if response is None:
+            bound_timeouts(sent, "request")
+            response = self._inner.handle_request(sent)
+        if self._compressor is not None and self._compressor.rejected(request, sent, response):
+            logger.debug("x402: %s rejected compressed body — resending", request.url.host)
+            response.close()
+            sent = request
+            bound_timeouts(sent, "request")
+            response = self._inner.handle_request(sent)
 
         if response.status_code != 402:
             return response
 
         logger.debug("x402: received 402 — signing payment")
         response.read()
+        round_trip = time.monotonic() - started
+        if metrics is None:
+            return self._pay(request, sent, response, round_trip)
 
+        metrics.challenge()
+        challenged = time.monotonic()
+        paid: httpx.Response | None = None
         try:
-            payment_headers, _ = self._x402.handle_402_response(
-                dict(response.headers),
-                response.content,
-            )
+            paid = self._pay(request, sent, response, round_trip)
+            return paid
+        finally:
+            answered = paid is not None and paid is not response
+            metrics.payment_done(time.monotonic() - challenged if answered else None)
+
+    def _pay(
+        self,
+        request: httpx.Request,
+        sent: httpx.Request,
+        response: httpx.Response,
+        round_trip: float,
+    ) -> httpx.Response:
+        """Sign a payment for the 402 *response* to *sent* and send the paid retry."""
+        challenge = response
+        # Only pay if the paid retry can plausibly finish in time: it costs
+        # about one more round trip (*round_trip*) like the unpaid attempt.
+        require_time(request, round_trip, "signing")
+        signing = time.monotonic()
+        try:
+            with wallet_scope(request):
+                payment_headers, payload = self._x402.handle_402_response(
+                    dict(response.headers),
+                    response.content,
+                )
         except Exception:
             logger.exception("x402: payment signing failed")
+            _signed(self._metrics, signing, ok=False)
             return response
+        _signed(self._metrics, signing, ok=True)
+        require_time(request, round_trip, "the paid request")
+        expires = valid_until(payload, time.time())
 
         try:
-            body = request.content
+            body = sent.content
         except httpx.RequestNotRead:
             # Some transports/proxies can short-circuit with 402 before consuming
             # the request body. Ensure we materialize it so the retry is replayable.
-            body = request.read()
+            body = sent.read()
 
-        retry = _clone_request_with_headers(request, payment_headers, content=body)
+        # The retry reuses the (possibly compressed) body of the unpaid attempt.
+        retry = _clone_request_with_headers(sent, payment_headers, content=body)
         response.close()
-        return self._inner.handle_request(retry)
+        response = self._send_paid(retry, expires)
+        if self._compressor is not None and self._compressor.rejected(request, sent, response):
+            response.close()
+            retry = _clone_request_with_headers(request, payment_headers)
+            response = self._send_paid(retry, expires)
+        if response.is_success:
+            if self._metrics is not None:
+                self._metrics.paid(payload)
+            if self._requirements is not None:
+                self._requirements.set(
+                    requirements_key(request), challenge.headers, challenge.content
+                )
+        return response
+
+    def _prepay(self, request: httpx.Request, sent: httpx.Request) -> httpx.Response | None:
+        """Pay *sent* up front with cached requirements; ``None`` on a miss.
+
+        A ``402`` answer means the requirements changed: the entry is dropped
+        and the ``402`` is handled like that of an unpaid attempt.
+        """
+        assert self._requirements is not None
+        request.read()
+        key = requirements_key(request)
+        challenge = self._requirements.get(key)
+        if challenge is None:
+            return None
+        signing = time.monotonic()
+        try:
+            with wallet_scope(request):
+                payment_headers, payload = self._x402.handle_402_response(*challenge)
+        except Exception:
+            # Only an upstream 402 proves the entry stale; other processes
+            # may well be able to pay it.
+            logger.debug("x402: signing with cached requirements failed", exc_info=True)
+            _signed(self._metrics, signing, ok=False)
+            return None
+        _signed(self._metrics, signing, ok=True)
+        retry = _clone_request_with_headers(sent, payment_headers, content=sent.read())
+        response = self._send_paid(retry, valid_until(payload, time.time()))
+        if response.status_code == 402:
+            self._requirements.delete(key)
+        elif self._metrics is not None and response.is_success:
+            self._metrics.paid(payload)
+        return response
+
+    def _send_paid(self, request: httpx.Request, expires: float) -> httpx.Response:
+        """Send the paid *request*, resending it while the payment is unsettled."""
+        attempt = 0
+        while True:
+            bound_timeouts(request, "the paid request")
+            try:
+                response = self._inner.handle_request(request)
+            except RETRY_ERRORS:
+                delay = self._retry_delay(request, attempt, expires)
+                if delay is None:
+                    raise
+            else:
+                if not is_unsettled_failure(response):
+                    return response
+                delay = self._retry_delay(request, attempt, expires)
+                if delay is None:
+                    return response
+                response.close()
+            logger.debug("x402: paid request failed before settlement — resending")
+            if self._metrics is not None:
+                self._metrics.paid_retry()
+            time.sleep(delay)
+            attempt += 1
+
+    def _retry_delay(self, request: httpx.Request, attempt: int, expires: float) -> float | None:
+        """Return the backoff before resending, or ``None`` to give up."""
+        delay = retry_delay(attempt, self._paid_retries, expires)
+        return delay if delay is not None and sleep_allowed(request, delay) else None
 
     def close(self) -> None:
         """Shut down the underlying transport."""
@@ -113,49 +416,324 @@ class AsyncX402Transport(httpx.AsyncBaseTransport):
         A configured ``x402HTTPClient`` with registered payment schemes.
     inner:
         Underlying transport to delegate to.  Defaults to ``httpx.AsyncHTTPTransport()``.
+    cache:
+        Optional :class:`~x402_openai.ResponseCache`.  Deterministic requests
+        found in the cache are answered without network access or payment.
+    coalesce:
+        When True, identical non-streaming requests in flight at the same
+        time share one upstream (paid) call.
+    limiter:
+        Optional :class:`~x402_openai.AsyncAdaptiveLimiter` bounding concurrent
+        upstream requests per gateway host.
+    paid_retries:
+        How often to resend the paid request with the same payment when it
+        fails before settlement.  Default ``2``; ``0`` disables.
+    recorder:
+        Optional :class:`~x402_openai.TrafficRecorder` writing a redacted
+        trace of every upstream attempt.
+    compressor:
+        Optional :class:`~x402_openai.RequestCompressor`; large bodies are
+        compressed once and the compressed bytes reused for the paid retry.
+    deadline:
+        Optional end-to-end budget in seconds per call, covering the unpaid
+        attempt, signing and the paid retry.  The ``"x402_deadline"``
+        request extension overrides it per request.
+    metrics:
+        Optional :class:`~x402_openai.PaymentMetrics` registry recording
+        request, challenge, signing and payment metrics.
+    requirements:
+        Optional :class:`~x402_openai.RequirementsCache`.  Requests whose
+        payment requirements are cached are paid up front, skipping the
+        unpaid attempt.
+    embedding_batcher:
+        Optional :class:`~x402_openai.EmbeddingBatcher` that merges concurrent
+        embedding requests into one paid upstream call.
     """
 
-    __slots__ = ("_inner", "_x402")
+    __slots__ = (
+        "_batcher",
+        "_cache",
+        "_compressor",
+        "_deadline",
+        "_flights",
+        "_inner",
+        "_limiter",
+        "_metrics",
+        "_paid_retries",
+        "_requirements",
+        "_x402",
+    )
 
     def __init__(
         self,
         x402_client: Any,
         *,
         inner: httpx.AsyncBaseTransport | None = None,
+        cache: ResponseCache | None = None,
+        coalesce: bool = False,
+        limiter: AsyncAdaptiveLimiter | None = None,
+        paid_retries: int = 2,
+        recorder: TrafficRecorder | None = None,
+        compressor: RequestCompressor | None = None,
+        deadline: float | None = None,
+        metrics: PaymentMetrics | None = None,
+        requirements: RequirementsCache | None = None,
+        embedding_batcher: EmbeddingBatcher | None = None,
     ) -> None:
+        if paid_retries < 0:
+            raise ValueError("'paid_retries' must not be negative.")
+        if deadline is not None and deadline <= 0:
+            raise ValueError("'deadline' must be positive.")
         self._x402 = x402_client
         self._inner = inner or httpx.AsyncHTTPTransport()
+        if recorder is not None:
+            self._inner = AsyncRecordingTransport(self._inner, recorder)
+        self._cache = cache
+        self._flights = AsyncSingleFlight() if coalesce else None
+        self._limiter = limiter
+        self._paid_retries = paid_retries
+        self._compressor = compressor
+        self._deadline = deadline
+        self._metrics = metrics
+        self._requirements = requirements
+        self._batcher = embedding_batcher
 
     async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
         """Send *request*; on 402 sign payment and retry transparently."""
+        start_deadline(request, self._deadline)
+        if self._cache is None:
+            return await self._dispatch(request)
+
+        await request.aread()
+        key = self._cache.key_for(request)
+        if key is None:
+            return await self._dispatch(request)
+        hit = self._cache.get(key)
+        if hit is not None:
+            logger.debug("x402: cache hit %s %s", request.method, request.url)
+            return replay_response(hit.status_code, hit.headers, hit.content)
+
+        response = await self._dispatch(request)
+        if response.status_code == 200:
+            assert isinstance(response.stream, httpx.AsyncByteStream)
+            on_chunk, on_close = _capture_hooks(self._cache, key, response)
+            response.stream = AsyncObservedStream(
+                response.stream, on_chunk=on_chunk, on_close=on_close
+            )
+        return response
+
+    async def _dispatch(self, request: httpx.Request) -> httpx.Response:
+        """Coalesce identical in-flight requests, then route to batcher or :meth:`_send`."""
+        if self._flights is not None:
+            await request.aread()
+            key = coalesce_key(request)
+            if key is not None:
+                return await self._flights.do(key, lambda: self._route(request))
+        return await self._route(request)
+
+    async def _route(self, request: httpx.Request) -> httpx.Response:
+        """Send embedding calls through the batcher, everything else to :meth:`_send`."""
+        if self._batcher is not None and self._batcher.accepts(request):
+            return await self._batcher.submit(request, self._send)
+        return await self._send(request)
+
+    async def _send(self, request: httpx.Request) -> httpx.Response:
+        """Run :meth:`_exchange` inside a concurrency slot when limiting."""
+        limiter = self._limiter
+        if limiter is None:
+            return await self._exchange(request)
+
+        host = request.url.netloc.decode("ascii")
+        await limiter.acquire(host)
+        start = time.monotonic()
+        try:
+            response = await self._exchange(request)
+        except X402DeadlineExceeded:
+            # The caller's budget ran out; that says nothing about the gateway.
+            limiter.release(host)
+            raise
+        except httpx.TimeoutException:
+            limiter.release(host, overload=True)
+            raise
+        except BaseException:
+            limiter.release(host)
+            raise
+
+        latency = time.monotonic() - start if response.is_success else None
+        overload = is_overload(response)
+        if response.is_closed:
+            # Already-read responses never close their stream again.
+            limiter.release(host, latency=latency, overload=overload)
+            return response
+        assert isinstance(response.stream, httpx.AsyncByteStream)
+        response.stream = AsyncObservedStream(
+            response.stream,
+            on_close=lambda _: limiter.release(host, latency=latency, overload=overload),
+        )
+        return response
+
+    async def _exchange(self, request: httpx.Request) -> httpx.Response:
+        """Run the unpaid attempt and, on 402, the paid retry."""
         logger.debug("x402: %s %s", request.method, request.url)
-        response = await self._inner.handle_async_request(request)
+        metrics = self._metrics
+        if metrics is not None:
+            metrics.request()
+        sent = request
+        if self._compressor is not None:
+            await request.aread()
+            sent = self._compressor.compress(request)
+        started = time.monotonic()
+        response = await self._prepay(request, sent) if self._requirements is not None else None
+        if response is None:
+            response = await self._attempt(sent, "request")
+        if self._compressor is not None and self._compressor.rejected(request, sent, response):
+            logger.debug("x402: %s rejected compressed body — resending", request.url.host)
+            await response.aclose()
+            sent = request
+            response = await self._attempt(sent, "request")
 
         if response.status_code != 402:
             return response
 
         logger.debug("x402: received 402 — signing payment")
         await response.aread()
+        round_trip = time.monotonic() - started
+        if metrics is None:
+            return await self._pay(request, sent, response, round_trip)
 
+        metrics.challenge()
+        challenged = time.monotonic()
+        paid: httpx.Response | None = None
         try:
-            payment_headers, _ = await self._x402.handle_402_response(
-                dict(response.headers),
-                response.content,
-            )
+            paid = await self._pay(request, sent, response, round_trip)
+            return paid
+        finally:
+            answered = paid is not None and paid is not response
+            metrics.payment_done(time.monotonic() - challenged if answered else None)
+
+    async def _pay(
+        self,
+        request: httpx.Request,
+        sent: httpx.Request,
+        response: httpx.Response,
+        round_trip: float,
+    ) -> httpx.Response:
+        """Sign a payment for the 402 *response* to *sent* and send the paid retry."""
+        challenge = response
+        # Only pay if the paid retry can plausibly finish in time: it costs
+        # about one more round trip (*round_trip*) like the unpaid attempt.
+        require_time(request, round_trip, "signing")
+        signing = time.monotonic()
+        try:
+            async with enforce_deadline(request, "signing"):
+                with wallet_scope(request):
+                    payment_headers, payload = await self._x402.handle_402_response(
+                        dict(response.headers),
+                        response.content,
+                    )
+        except X402DeadlineExceeded:
+            _signed(self._metrics, signing, ok=False)
+            raise
         except Exception:
             logger.exception("x402: payment signing failed")
+            _signed(self._metrics, signing, ok=False)
             return response
+        _signed(self._metrics, signing, ok=True)
+        require_time(request, round_trip, "the paid request")
+        expires = valid_until(payload, time.time())
 
         try:
-            body = request.content
+            body = sent.content
         except httpx.RequestNotRead:
             # Some transports/proxies can short-circuit with 402 before consuming
             # the request body. Ensure we materialize it so the retry is replayable.
-            body = await request.aread()
+            body = await sent.aread()
 
-        retry = _clone_request_with_headers(request, payment_headers, content=body)
+        # The retry reuses the (possibly compressed) body of the unpaid attempt.
+        retry = _clone_request_with_headers(sent, payment_headers, content=body)
         await response.aclose()
-        return await self._inner.handle_async_request(retry)
+        response = await self._send_paid(retry, expires)
+        if self._compressor is not None and self._compressor.rejected(request, sent, response):
+            await response.aclose()
+            retry = _clone_request_with_headers(request, payment_headers)
+            response = await self._send_paid(retry, expires)
+        if response.is_success:
+            if self._metrics is not None:
+                self._metrics.paid(payload)
+            if self._requirements is not None:
+                self._requirements.set(
+                    requirements_key(request), challenge.headers, challenge.content
+                )
+        return response
+
+    async def _prepay(self, request: httpx.Request, sent: httpx.Request) -> httpx.Response | None:
+        """Pay *sent* up front with cached requirements; ``None`` on a miss.
+
+        A ``402`` answer means the requirements changed: the entry is dropped
+        and the ``402`` is handled like that of an unpaid attempt.
+        """
+        assert self._requirements is not None
+        await request.aread()
+        key = requirements_key(request)
+        challenge = self._requirements.get(key)
+        if challenge is None:
+            return None
+        signing = time.monotonic()
+        try:
+            async with enforce_deadline(request, "signing"):
+                with wallet_scope(request):
+                    payment_headers, payload = await self._x402.handle_402_response(*challenge)
+        except X402DeadlineExceeded:
+            _signed(self._metrics, signing, ok=False)
+            raise
+        except Exception:
+            # Only an upstream 402 proves the entry stale; other processes
+            # may well be able to pay it.
+            logger.debug("x402: signing with cached requirements failed", exc_info=True)
+            _signed(self._metrics, signing, ok=False)
+            return None
+        _signed(self._metrics, signing, ok=True)
+        retry = _clone_request_with_headers(sent, payment_headers, content=await sent.aread())
+        response = await self._send_paid(retry, valid_until(payload, time.time()))
+        if response.status_code == 402:
+            self._requirements.delete(key)
+        elif self._metrics is not None and response.is_success:
+            self._metrics.paid(payload)
+        return response
+
+    async def _attempt(self, request: httpx.Request, phase: str) -> httpx.Response:
+        """Send *request* upstream, cancelled when its deadline expires."""
+        bound_timeouts(request, phase)
+        async with enforce_deadline(request, phase):
+            return await self._inner.handle_async_request(request)
+
+    async def _send_paid(self, request: httpx.Request, expires: float) -> httpx.Response:
+        """Send the paid *request*, resending it while the payment is unsettled."""
+        attempt = 0
+        while True:
+            try:
+                response = await self._attempt(request, "the paid request")
+            except RETRY_ERRORS:
+                delay = self._retry_delay(request, attempt, expires)
+                if delay is None:
+                    raise
+            else:
+                if not is_unsettled_failure(response):
+                    return response
+                delay = self._retry_delay(request, attempt, expires)
+                if delay is None:
+                    return response
+                await response.aclose()
+            logger.debug("x402: paid request failed before settlement — resending")
+            if self._metrics is not None:
+                self._metrics.paid_retry()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _retry_delay(self, request: httpx.Request, attempt: int, expires: float) -> float | None:
+        """Return the backoff before resending, or ``None`` to give up."""
+        delay = retry_delay(attempt, self._paid_retries, expires)
+        return delay if delay is not None and sleep_allowed(request, delay) else None
 
     async def aclose(self) -> None:
         """Shut down the underlying transport."""
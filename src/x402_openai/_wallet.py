@@ -2,7 +2,8 @@
 
 Provides a single entry point — :func:`create_x402_http_client` — that accepts
 wallet adapters and returns a ready-to-use x402 HTTP client for the transport
-layer.
+layer.  :func:`acreate_x402_http_client` builds the async client without
+blocking the event loop.
 
 Supported credential strategies:
 
@@ -14,6 +15,7 @@ Supported credential strategies:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING, Any
 
@@ -58,16 +60,108 @@ def create_x402_http_client(
 
     # Pre-built client — return as-is.
     if not isinstance(resolved, list):
-        if policies:
-            logger.warning(
-                "x402: 'policies' ignored when 'x402_client' is provided — "
-                "register policies on the pre-built client directly."
-            )
-        return resolved
+        return _prebuilt(resolved, policies)
 
     return _build_client(resolved, policies=policies, sync=sync)
 
 
+async def acreate_x402_http_client(
+    *,
+    wallet: Wallet | None = None,
+    wallets: list[Wallet] | None = None,
+    x402_client: Any = None,
+    policies: list[Any] | None = None,
+) -> Any:
+    """Like :func:`create_x402_http_client` with ``sync=False``, off the event loop.
+
+    The x402 modules are imported, and every wallet registers (deriving
+    keys, importing its chain libraries), in worker threads — the wallets
+    concurrently.  Their registrations are recorded and applied to the
+    client in the order the wallets were given, as the sync path does.
+    """
+    resolved = _resolve_wallets(
+        wallet=wallet,
+        wallets=wallets,
+        x402_client=x402_client,
+    )
+    if not isinstance(resolved, list):
+        return _prebuilt(resolved, policies)
+
+    client_type, http_type = await asyncio.to_thread(_async_types)
+    recorded = await asyncio.gather(*(asyncio.to_thread(_record, w) for w in resolved))
+
+    client = client_type()
+    hooks: list[tuple[str, tuple[Any, ...]]] = []
+    for registrations in recorded:
+        for name, args in registrations.calls:
+            if name not in ("register", "register_v1"):
+                # A policy or hook shared by several wallets is added to
+                # the client once.
+                if (name, args) in hooks:
+                    continue
+                hooks.append((name, args))
+            getattr(client, name)(*args)
+    for p in policies or ():
+        client.register_policy(p)
+    return http_type(client)
+
+
+class _Registrations:
+    """Stands in for an x402 client, recording what a wallet registers."""
+
+    # The recorded hooks are applied to an async client, which awaits them.
+    awaits_hooks = True
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, tuple[Any, ...]]] = []
+
+    def register(self, network: str, client: Any) -> _Registrations:
+        self.calls.append(("register", (network, client)))
+        return self
+
+    def register_v1(self, network: str, client: Any) -> _Registrations:
+        self.calls.append(("register_v1", (network, client)))
+        return self
+
+    def register_policy(self, policy: Any) -> _Registrations:
+        self.calls.append(("register_policy", (policy,)))
+        return self
+
+    def on_before_payment_creation(self, hook: Any) -> _Registrations:
+        self.calls.append(("on_before_payment_creation", (hook,)))
+        return self
+
+    def on_after_payment_creation(self, hook: Any) -> _Registrations:
+        self.calls.append(("on_after_payment_creation", (hook,)))
+        return self
+
+    def on_payment_creation_failure(self, hook: Any) -> _Registrations:
+        self.calls.append(("on_payment_creation_failure", (hook,)))
+        return self
+
+
+def _record(wallet: Wallet) -> _Registrations:
+    registrations = _Registrations()
+    wallet.register(registrations)
+    return registrations
+
+
+def _async_types() -> tuple[Any, Any]:
+    from x402 import x402Client
+    from x402.http import x402HTTPClient
+
+    return x402Client, x402HTTPClient
+
+
+def _prebuilt(x402_client: Any, policies: list[Any] | None) -> Any:
+    if policies:
+        logger.warning(
+            "x402: 'policies' ignored when 'x402_client' is provided — "
+            "register policies on the pre-built client directly."
+        )
+    return x402_client
+
+
 def _resolve_wallets(
     *,
     wallet: Wallet | None,
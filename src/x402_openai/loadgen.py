@@ -0,0 +1,326 @@
+"""Load generator for x402 gateways and clients.
+
+Drives one :class:`~x402_openai.AsyncX402OpenAI` at a fixed concurrency
+(closed loop) or request rate (open loop) with a weighted mix of models,
+prompt sizes and streamed or unstreamed chat completions, then reports:
+
+- achieved requests per second and payments per second;
+- end-to-end latency p50/p95/p99;
+- time to first token (TTFT) p50/p95/p99 of streamed calls;
+- errors by kind (HTTP status or exception type).
+
+Without ``--base-url`` a local stand-in gateway is started in a child
+process and paid with a throwaway key, so runs need no network or funds.
+With ``--base-url`` (e.g. a staging gateway) wallets are read from the
+environment as for the paying proxy (``EVM_PRIVATE_KEY``, ``MNEMONIC``,
+``SOLANA_PRIVATE_KEY``).
+
+Usage::
+
+    python -m x402_openai.loadgen [--concurrency 16 | --rate 50]
+        [--duration 30 | --requests 1000] [--model gpt-4o-mini=3 --model gpt-4o=1]
+        [--prompt-words 50=4 --prompt-words 2000=1] [--stream-ratio 0.5]
+        [--base-url URL] [--json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import json
+import random
+import time
+from typing import TYPE_CHECKING, Any
+
+import openai
+
+from x402_openai._client import AsyncX402OpenAI
+from x402_openai._metrics import PaymentMetrics
+from x402_openai.proxy import wallets_from_env
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# Prompt filler; one word per entry.
+_WORDS = ("lorem", "ipsum", "dolor", "sit", "amet", "consectetur", "adipiscing", "elit")
+
+
+class Sample:
+    """Outcome of one request."""
+
+    __slots__ = ("error", "latency", "stream", "ttft")
+
+    def __init__(
+        self, latency: float, *, stream: bool, ttft: float | None = None, error: str | None = None
+    ) -> None:
+        self.latency = latency
+        self.stream = stream
+        self.ttft = ttft
+        self.error = error
+
+
+def weighted(spec: str) -> tuple[str, float]:
+    """Parse a ``value[=weight]`` mix entry; the weight defaults to ``1``."""
+    value, _, weight = spec.partition("=")
+    if not value:
+        raise argparse.ArgumentTypeError(f"empty value in {spec!r}")
+    try:
+        share = float(weight) if weight else 1.0
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid weight in {spec!r}") from None
+    if share <= 0:
+        raise argparse.ArgumentTypeError(f"weight must be positive in {spec!r}")
+    return value, share
+
+
+def percentile(values: Sequence[float], q: float) -> float | None:
+    """Return the *q*-quantile (0 to 1) of sorted *values* by nearest rank."""
+    if not values:
+        return None
+    return values[min(len(values) - 1, max(0, round(q * len(values)) - 1))]
+
+
+def _error_kind(exc: BaseException) -> str:
+    if isinstance(exc, openai.APIStatusError):
+        return f"HTTP {exc.status_code}"
+    if isinstance(exc, openai.APITimeoutError):
+        return "timeout"
+    if isinstance(exc, openai.APIConnectionError):
+        return "connection"
+    return type(exc).__name__
+
+
+class LoadGenerator:
+    """Send the request mix through *client* and collect :class:`Sample` s.
+
+    Parameters
+    ----------
+    client:
+        The client under test.
+    models, prompt_words:
+        ``(value, weight)`` mixes to draw each request's model and prompt
+        length (in words) from.
+    stream_ratio:
+        Share of requests that stream.
+    max_tokens:
+        ``max_tokens`` of every request.
+    seed:
+        Seed of the mix, for repeatable runs.
+    """
+
+    def __init__(
+        self,
+        client: AsyncX402OpenAI,
+        *,
+        models: Sequence[tuple[str, float]],
+        prompt_words: Sequence[tuple[str, float]],
+        stream_ratio: float = 0.0,
+        max_tokens: int = 16,
+        seed: int | None = None,
+    ) -> None:
+        if not 0 <= stream_ratio <= 1:
+            raise ValueError("'stream_ratio' must be between 0 and 1.")
+        self.client = client
+        self.samples: list[Sample] = []
+        self._models = models
+        self._words = [(int(words), weight) for words, weight in prompt_words]
+        self._stream_ratio = stream_ratio
+        self._max_tokens = max_tokens
+        self._random = random.Random(seed)
+
+    async def closed_loop(self, concurrency: int, *, until: float, requests: int | None) -> None:
+        """Keep *concurrency* requests in flight until *until* or *requests* are sent."""
+        budget = iter(range(requests)) if requests is not None else None
+
+        async def worker() -> None:
+            while time.monotonic() < until:
+                if budget is not None and next(budget, None) is None:
+                    return
+                await self.one()
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    async def open_loop(self, rate: float, *, until: float, requests: int | None) -> None:
+        """Start *rate* requests per second, however many are still in flight."""
+        tasks: set[asyncio.Task[None]] = set()
+        start = time.monotonic()
+        sent = 0
+        while (requests is None or sent < requests) and time.monotonic() < until:
+            task = asyncio.create_task(self.one())
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            sent += 1
+            await asyncio.sleep(max(0.0, start + sent / rate - time.monotonic()))
+        if tasks:
+            await asyncio.wait(tasks)
+
+    async def one(self) -> None:
+        """Send one request drawn from the mix and record its :class:`Sample`."""
+        model = self._pick(self._models)
+        words = self._pick(self._words)
+        stream = self._random.random() < self._stream_ratio
+        prompt = " ".join(_WORDS[i % len(_WORDS)] for i in range(words))
+        messages: Any = [{"role": "user", "content": prompt}]
+        start = time.monotonic()
+        ttft = None
+        try:
+            if stream:
+                response = await self.client.chat.completions.create(
+                    model=model, messages=messages, max_tokens=self._max_tokens, stream=True
+                )
+                async with response:
+                    async for _ in response:
+                        if ttft is None:
+                            ttft = time.monotonic() - start
+            else:
+                await self.client.chat.completions.create(
+                    model=model, messages=messages, max_tokens=self._max_tokens
+                )
+        except Exception as exc:
+            error: str | None = _error_kind(exc)
+        else:
+            error = None
+        self.samples.append(
+            Sample(time.monotonic() - start, stream=stream, ttft=ttft, error=error)
+        )
+
+    def _pick(self, mix: Sequence[tuple[Any, float]]) -> Any:
+        values = [value for value, _ in mix]
+        return self._random.choices(values, weights=[weight for _, weight in mix])[0]
+
+
+def report(samples: Sequence[Sample], elapsed: float, metrics: PaymentMetrics) -> dict[str, Any]:
+    """Summarise a run (see the module docstring)."""
+    ok = sorted(s.latency for s in samples if s.error is None)
+    ttft = sorted(s.ttft for s in samples if s.ttft is not None and s.error is None)
+    errors: dict[str, int] = {}
+    for sample in samples:
+        if sample.error is not None:
+            errors[sample.error] = errors.get(sample.error, 0) + 1
+    signings = metrics.snapshot().get("x402_signings_total", {})
+    payments = signings.get((("outcome", "ok"),), 0)
+    quantiles = {"p50": 0.5, "p95": 0.95, "p99": 0.99}
+    return {
+        "requests": len(samples),
+        "succeeded": len(ok),
+        "streamed": sum(s.stream for s in samples),
+        "seconds": elapsed,
+        "requests_per_s": len(samples) / elapsed if elapsed else 0.0,
+        "payments": payments,
+        "payments_per_s": payments / elapsed if elapsed else 0.0,
+        "signing_errors": signings.get((("outcome", "error"),), 0),
+        "latency_s": {name: percentile(ok, q) for name, q in quantiles.items()},
+        "ttft_s": {name: percentile(ttft, q) for name, q in quantiles.items()},
+        "errors": errors,
+    }
+
+
+def _format(summary: dict[str, Any]) -> str:
+    def ms(value: float | None) -> str:
+        return "-" if value is None else f"{value * 1000:.1f} ms"
+
+    lines = [
+        f"requests   {summary['requests']:,} in {summary['seconds']:.1f} s "
+        f"({summary['requests_per_s']:,.1f}/s), {summary['succeeded']:,} ok, "
+        f"{summary['streamed']:,} streamed",
+        f"payments   {summary['payments']:,} ({summary['payments_per_s']:,.1f}/s), "
+        f"{summary['signing_errors']:,} signing errors",
+        "latency    " + "  ".join(f"{k} {ms(v)}" for k, v in summary["latency_s"].items()),
+        "ttft       " + "  ".join(f"{k} {ms(v)}" for k, v in summary["ttft_s"].items()),
+    ]
+    for kind, count in sorted(summary["errors"].items(), key=lambda item: -item[1]):
+        lines.append(f"error      {kind}: {count:,}")
+    return "\n".join(lines)
+
+
+async def _run(args: argparse.Namespace, base_url: str, wallets: list[Any]) -> dict[str, Any]:
+    policies: list[Any] = []
+    if args.prefer_network or args.max_amount is not None:
+        import x402
+
+        policies += [x402.prefer_network(network) for network in args.prefer_network]
+        if args.max_amount is not None:
+            policies.append(x402.max_amount(args.max_amount))
+
+    metrics = PaymentMetrics()
+    async with AsyncX402OpenAI(
+        wallets=wallets,
+        policies=policies,
+        base_url=base_url,
+        max_retries=0,
+        timeout=args.timeout,
+        metrics=metrics,
+    ) as client:
+        generator = LoadGenerator(
+            client,
+            models=args.model or [("gpt-4o-mini", 1.0)],
+            prompt_words=args.prompt_words or [("50", 1.0)],
+            stream_ratio=args.stream_ratio,
+            max_tokens=args.max_tokens,
+            seed=args.seed,
+        )
+        start = time.monotonic()
+        until = start + args.duration if args.duration is not None else float("inf")
+        if args.rate is not None:
+            await generator.open_loop(args.rate, until=until, requests=args.requests)
+        else:
+            await generator.closed_loop(args.concurrency, until=until, requests=args.requests)
+        return report(generator.samples, time.monotonic() - start, metrics)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m x402_openai.loadgen", description=__doc__.splitlines()[0]
+    )
+    load = parser.add_mutually_exclusive_group()
+    load.add_argument("--concurrency", type=int, default=8, help="requests in flight")
+    load.add_argument("--rate", type=float, help="requests started per second")
+    parser.add_argument("--duration", type=float, help="seconds to run")
+    parser.add_argument("--requests", type=int, help="requests to send")
+    parser.add_argument(
+        "--model", type=weighted, action="append", help="NAME[=WEIGHT] (repeatable)"
+    )
+    parser.add_argument(
+        "--prompt-words", type=weighted, action="append", help="WORDS[=WEIGHT] (repeatable)"
+    )
+    parser.add_argument("--stream-ratio", type=float, default=0.0, help="share of streamed calls")
+    parser.add_argument("--max-tokens", type=int, default=16)
+    parser.add_argument("--timeout", type=float, default=60.0, help="seconds per request")
+    parser.add_argument("--seed", type=int, help="seed of the request mix")
+    parser.add_argument("--base-url", help="x402 gateway (default: local stand-in)")
+    parser.add_argument(
+        "--prefer-network", action="append", default=[], help="e.g. eip155:8453 (repeatable)"
+    )
+    parser.add_argument("--max-amount", type=int, help="largest payment, in atomic units")
+    parser.add_argument("--latency", type=float, default=0.0, help="stand-in answer delay")
+    parser.add_argument("--chunk-delay", type=float, default=0.0, help="stand-in stream pacing")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+    if args.duration is None and args.requests is None:
+        args.duration = 10.0
+    for words, _ in args.prompt_words or []:
+        if not words.isdigit():
+            parser.error(f"--prompt-words takes a word count, not {words!r}")
+
+    if args.base_url is not None:
+        wallets = wallets_from_env()
+        if not wallets:
+            parser.error("set EVM_PRIVATE_KEY, MNEMONIC or SOLANA_PRIVATE_KEY")
+        summary = asyncio.run(_run(args, args.base_url, wallets))
+    else:
+        from eth_account import Account
+
+        from x402_openai._standin import StandInGateway
+        from x402_openai.wallets import EvmWallet
+
+        wallet = EvmWallet(private_key=Account.create().key.hex())
+        with StandInGateway(latency=args.latency, chunk_delay=args.chunk_delay) as base_url:
+            summary = asyncio.run(_run(args, base_url, [wallet]))
+
+    print(json.dumps(summary, indent=2) if args.json else _format(summary))
+
+
+if __name__ == "__main__":
+    with contextlib.suppress(KeyboardInterrupt):
+        main()
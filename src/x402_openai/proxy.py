@@ -0,0 +1,428 @@
+"""Local paying proxy: an OpenAI-compatible endpoint for non-Python services.
+
+Serves ``http://127.0.0.1:8402/v1`` and forwards every request to the
+upstream gateway through one shared :class:`~x402_openai.AsyncX402Transport`,
+so all callers share one connection pool, one x402 client (and its signing
+caches) and, with ``--cache``, one response cache.  Responses, including
+SSE streams, are relayed chunk by chunk as they arrive.
+
+Wallets are read from the environment (``EVM_PRIVATE_KEY``, ``MNEMONIC``,
+``SOLANA_PRIVATE_KEY``), as in the examples.
+
+Usage::
+
+    EVM_PRIVATE_KEY=0x… python -m x402_openai [--port 8402] [--upstream URL]
+        [--prefer-network eip155:8453] [--max-amount 10000] [--cache] [--coalesce]
+
+Point any OpenAI SDK at it with ``base_url="http://127.0.0.1:8402/v1"``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import re
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from x402_openai._cache import MemoryCache
+from x402_openai._client import _DEFAULT_BASE_URL, _DEFAULT_TIMEOUT
+from x402_openai._deadline import X402DeadlineExceeded
+from x402_openai._transport import AsyncX402Transport
+from x402_openai._wallet import create_x402_http_client
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORT = 8402
+
+# Largest request body accepted from a client.
+DEFAULT_MAX_BODY_SIZE = 64 * 1024 * 1024
+
+# Path prefix under which the proxy serves the upstream API.
+_PREFIX = "/v1"
+
+# Connection-level headers that are never forwarded (RFC 9110, section 7.6.1).
+_HOP_BY_HOP = frozenset(
+    {
+        b"connection",
+        b"keep-alive",
+        b"proxy-authenticate",
+        b"proxy-authorization",
+        b"te",
+        b"trailer",
+        b"transfer-encoding",
+        b"upgrade",
+    }
+)
+
+# Request headers answered by the proxy itself.
+_NOT_FORWARDED = frozenset({b"host", b"expect"})
+
+_REASONS = {
+    400: "Bad Request",
+    404: "Not Found",
+    413: "Content Too Large",
+    502: "Bad Gateway",
+    504: "Gateway Timeout",
+}
+
+_CHUNK_SIZE = re.compile(rb"[0-9a-fA-F]+")
+
+_Request = tuple[str, str, list[tuple[bytes, bytes]], bytes]
+
+
+class _BadRequestError(ValueError):
+    """The client sent something that is not a valid HTTP/1.1 request."""
+
+    status = 400
+
+
+class _BodyTooLargeError(_BadRequestError):
+    """The request body exceeds the proxy's limit."""
+
+    status = 413
+
+
+class PayingProxy:
+    """OpenAI-compatible HTTP endpoint that pays upstream x402 challenges.
+
+    Parameters
+    ----------
+    x402_client:
+        A configured async ``x402HTTPClient``.
+    upstream:
+        Base URL of the x402 gateway, including its ``/v1`` path.
+    host, port:
+        Listening address; port ``0`` picks a free one (see :attr:`url`).
+    timeout:
+        httpx timeout for upstream requests.
+    max_body_size:
+        Largest request body accepted, in bytes (default 64 MiB); larger
+        requests are answered with ``413``.
+    transport_options:
+        Forwarded to :class:`~x402_openai.AsyncX402Transport`, e.g.
+        ``cache=MemoryCache()`` or ``coalesce=True``.
+
+    Examples
+    --------
+    ::
+
+        async with PayingProxy(x402_client, port=8402) as proxy:
+            await proxy.serve_forever()
+    """
+
+    def __init__(
+        self,
+        x402_client: Any,
+        *,
+        upstream: str = _DEFAULT_BASE_URL,
+        host: str = "127.0.0.1",
+        port: int = DEFAULT_PORT,
+        timeout: httpx.Timeout | float = _DEFAULT_TIMEOUT,
+        max_body_size: int = DEFAULT_MAX_BODY_SIZE,
+        **transport_options: Any,
+    ) -> None:
+        self._upstream = upstream.rstrip("/")
+        self._host = host
+        self._port = port
+        self._max_body_size = max_body_size
+        self._client = httpx.AsyncClient(
+            transport=AsyncX402Transport(x402_client, **transport_options),
+            timeout=timeout,
+        )
+        self._server: asyncio.Server | None = None
+
+    @property
+    def url(self) -> str:
+        """Base URL to give OpenAI clients (valid once started)."""
+        return f"http://{self._host}:{self._port}{_PREFIX}"
+
+    async def start(self) -> None:
+        """Start listening."""
+        self._server = await asyncio.start_server(self._serve, self._host, self._port)
+        self._port = self._server.sockets[0].getsockname()[1]
+        logger.info("x402: paying proxy on %s → %s", self.url, self._upstream)
+
+    async def serve_forever(self) -> None:
+        """Serve until cancelled."""
+        if self._server is None:
+            await self.start()
+        assert self._server is not None
+        await self._server.serve_forever()
+
+    async def aclose(self) -> None:
+        """Stop listening and close the upstream connection pool."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        await self._client.aclose()
+
+    async def __aenter__(self) -> PayingProxy:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.aclose()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Answer requests on one client connection until it closes."""
+        try:
+            while True:
+                try:
+                    request = await _read_request(reader, writer, self._max_body_size)
+                except _BadRequestError as exc:
+                    await _write_error(writer, exc.status, str(exc), keep_alive=False)
+                    return
+                except ValueError:  # A line longer than the stream buffer limit.
+                    await _write_error(writer, 400, "line too long", keep_alive=False)
+                    return
+                if request is None:
+                    return
+                keep_alive = _keep_alive(request[2])
+                await self._forward(request, writer, keep_alive=keep_alive)
+                if not keep_alive:
+                    return
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass  # The client went away.
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _forward(
+        self, request: _Request, writer: asyncio.StreamWriter, *, keep_alive: bool
+    ) -> None:
+        """Send *request* upstream and relay the response to *writer*."""
+        method, target, headers, body = request
+        if not (target == _PREFIX or target.startswith((_PREFIX + "/", _PREFIX + "?"))):
+            await _write_error(writer, 404, f"not found: {target}", keep_alive=keep_alive)
+            return
+
+        upstream = self._client.build_request(
+            method,
+            self._upstream + target[len(_PREFIX) :],
+            headers=[
+                (n, v) for n, v in headers if n not in _HOP_BY_HOP and n not in _NOT_FORWARDED
+            ],
+            content=body,
+        )
+        try:
+            response = await self._client.send(upstream, stream=True)
+        except X402DeadlineExceeded as exc:
+            await _write_error(writer, 504, str(exc), keep_alive=keep_alive)
+            return
+        except httpx.HTTPError as exc:
+            logger.warning("x402: proxy upstream error: %r", exc)
+            await _write_error(writer, 502, f"upstream error: {exc!r}", keep_alive=keep_alive)
+            return
+
+        try:
+            await _relay(response, writer, head_only=method == "HEAD", keep_alive=keep_alive)
+        finally:
+            await response.aclose()
+
+
+async def _read_request(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, max_body_size: int
+) -> _Request | None:
+    """Read one request from *reader*; ``None`` on a cleanly closed connection.
+
+    A client sending ``Expect: 100-continue`` is told to go on through
+    *writer* once the headers are accepted.
+    """
+    line = await reader.readline()
+    if not line:
+        return None
+    try:
+        method, target, _version = line.decode("latin-1").split()
+    except ValueError:
+        raise _BadRequestError("malformed request line") from None
+
+    headers: list[tuple[bytes, bytes]] = []
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, sep, value = line.partition(b":")
+        if not sep:
+            raise _BadRequestError("malformed header line")
+        headers.append((name.strip().lower(), value.strip()))
+
+    fields = dict(headers)
+    chunked = b"chunked" in fields.get(b"transfer-encoding", b"").lower()
+    length = 0
+    if not chunked:
+        value = fields.get(b"content-length", b"0")
+        if not value.isdigit():
+            raise _BadRequestError(f"invalid content-length: {value.decode('latin-1')}")
+        length = int(value)
+        if length > max_body_size:
+            raise _BodyTooLargeError(f"request body exceeds {max_body_size} bytes")
+
+    if fields.get(b"expect", b"").lower() == b"100-continue":
+        writer.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+        await writer.drain()
+
+    if chunked:
+        body = await _read_chunked(reader, max_body_size)
+    else:
+        body = await reader.readexactly(length) if length else b""
+    return method, target, headers, body
+
+
+async def _read_chunked(reader: asyncio.StreamReader, max_body_size: int) -> bytes:
+    """Read a chunked request body, dropping any trailers."""
+    body = bytearray()
+    while True:
+        line = (await reader.readline()).split(b";")[0].strip()
+        if not _CHUNK_SIZE.fullmatch(line):
+            raise _BadRequestError(f"invalid chunk size: {line.decode('latin-1')}")
+        size = int(line, 16)
+        if not size:
+            break
+        if len(body) + size > max_body_size:
+            raise _BodyTooLargeError(f"request body exceeds {max_body_size} bytes")
+        body += await reader.readexactly(size)
+        await reader.readline()
+    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+        pass  # Trailers are dropped.
+    return bytes(body)
+
+
+def _keep_alive(headers: list[tuple[bytes, bytes]]) -> bool:
+    return all(v.lower() != b"close" for n, v in headers if n == b"connection")
+
+
+async def _relay(
+    response: httpx.Response,
+    writer: asyncio.StreamWriter,
+    *,
+    head_only: bool,
+    keep_alive: bool,
+) -> None:
+    """Write *response* to *writer*, streaming the body without buffering it."""
+    no_body = head_only or response.status_code in (204, 304)
+    length = response.headers.get("content-length")
+    chunked = length is None and not no_body
+
+    lines = [f"HTTP/1.1 {response.status_code} {response.reason_phrase}".encode()]
+    for name, value in response.headers.raw:
+        if name.lower() not in _HOP_BY_HOP:
+            lines.append(name + b": " + value)
+    if chunked:
+        lines.append(b"transfer-encoding: chunked")
+    if not keep_alive:
+        lines.append(b"connection: close")
+    writer.write(b"\r\n".join(lines) + b"\r\n\r\n")
+    if no_body:
+        await writer.drain()
+        return
+
+    # Raw bytes keep any content encoding, which the headers above announce.
+    # Responses built in memory (not from the network) arrive already read.
+    chunks = _once(response.content) if response.is_stream_consumed else response.aiter_raw()
+    async for chunk in chunks:
+        if chunk:
+            writer.write(b"%x\r\n%s\r\n" % (len(chunk), chunk) if chunked else chunk)
+            await writer.drain()
+    if chunked:
+        writer.write(b"0\r\n\r\n")
+    await writer.drain()
+
+
+async def _once(body: bytes) -> AsyncIterator[bytes]:
+    yield body
+
+
+async def _write_error(
+    writer: asyncio.StreamWriter, status: int, message: str, *, keep_alive: bool
+) -> None:
+    """Answer with an OpenAI-style JSON error."""
+    body = json.dumps({"error": {"message": message, "type": "x402_proxy_error"}}).encode()
+    lines = [
+        f"HTTP/1.1 {status} {_REASONS[status]}".encode(),
+        b"content-type: application/json",
+        b"content-length: %d" % len(body),
+    ]
+    if not keep_alive:
+        lines.append(b"connection: close")
+    writer.write(b"\r\n".join(lines) + b"\r\n\r\n" + body)
+    await writer.drain()
+
+
+def wallets_from_env() -> list[Any]:
+    """Build wallet adapters from ``EVM_PRIVATE_KEY``, ``MNEMONIC`` and ``SOLANA_PRIVATE_KEY``."""
+    from x402_openai.wallets import EvmWallet, SvmWallet
+
+    wallets: list[Any] = []
+    if key := os.environ.get("EVM_PRIVATE_KEY"):
+        wallets.append(EvmWallet(private_key=key))
+    elif mnemonic := os.environ.get("MNEMONIC"):
+        wallets.append(EvmWallet(mnemonic=mnemonic))
+    if key := os.environ.get("SOLANA_PRIVATE_KEY"):
+        wallets.append(SvmWallet(private_key=key))
+    return wallets
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m x402_openai", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--upstream", default=_DEFAULT_BASE_URL, help="x402 gateway base URL")
+    parser.add_argument(
+        "--prefer-network", action="append", default=[], help="e.g. eip155:8453 (repeatable)"
+    )
+    parser.add_argument("--max-amount", type=int, help="largest payment, in atomic units")
+    parser.add_argument("--cache", action="store_true", help="cache deterministic responses")
+    parser.add_argument("--coalesce", action="store_true", help="enable request coalescing")
+    parser.add_argument("--paid-retries", type=int, default=2)
+    parser.add_argument("--deadline", type=float, help="end-to-end seconds per call")
+    parser.add_argument(
+        "--max-body-size", type=int, default=DEFAULT_MAX_BODY_SIZE, help="largest request, bytes"
+    )
+    args = parser.parse_args(argv)
+
+    wallets = wallets_from_env()
+    if not wallets:
+        parser.error("set EVM_PRIVATE_KEY, MNEMONIC or SOLANA_PRIVATE_KEY")
+    policies: list[Any] = []
+    if args.prefer_network or args.max_amount is not None:
+        import x402
+
+        policies += [x402.prefer_network(network) for network in args.prefer_network]
+        if args.max_amount is not None:
+            policies.append(x402.max_amount(args.max_amount))
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    proxy = PayingProxy(
+        create_x402_http_client(wallets=wallets, policies=policies, sync=False),
+        upstream=args.upstream,
+        host=args.host,
+        port=args.port,
+        max_body_size=args.max_body_size,
+        cache=MemoryCache() if args.cache else None,
+        coalesce=args.coalesce,
+        paid_retries=args.paid_retries,
+        deadline=args.deadline,
+    )
+
+    async def serve() -> None:
+        async with proxy:
+            await proxy.serve_forever()
+
+    asyncio.run(serve())
+
+
+if __name__ == "__main__":
+    with contextlib.suppress(KeyboardInterrupt):
+        main()
@@ -0,0 +1,259 @@
+"""Replay a recorded x402 trace against a local stand-in gateway.
+
+Plays back a trace written by :class:`~x402_openai.TrafficRecorder` with its
+original start times (and therefore concurrency) through an
+:class:`~x402_openai.AsyncX402Transport`, against a stand-in gateway that
+answers every request with the recorded 402 challenge, status, latency,
+body size and streaming duration (:func:`stand_in`: the shared
+:class:`~x402_openai._standin.StandInGateway` serving
+:class:`RecordedAnswers` from a child process).  Payments are signed by a
+stub unless a real x402 client is supplied, so replays run offline.
+
+Usage::
+
+    python -m x402_openai.replay x402-trace.jsonl [--speed 2] [--coalesce]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import math
+import time
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from x402_openai._recording import PAYMENT_HEADERS, load_trace
+from x402_openai._standin import StandInGateway
+from x402_openai._transport import AsyncX402Transport
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from http.server import BaseHTTPRequestHandler
+
+# Request header naming the recorded exchange a replayed request stands for.
+REPLAY_HEADER = "x-x402-replay"
+
+# Streamed bodies are replayed in this many chunks spread over their duration.
+_STREAM_CHUNKS = 16
+
+
+class Exchange:
+    """The attempts of one recorded request, unpaid first."""
+
+    __slots__ = ("challenge", "final", "id", "method", "path", "request_bytes", "t")
+
+    def __init__(self, attempts: list[dict[str, Any]]) -> None:
+        first = attempts[0]
+        self.id: int = first["id"]
+        self.t: float = first["t"]
+        self.method: str = first["method"]
+        self.path: str = first["path"]
+        self.request_bytes: int = first.get("request_bytes", 0)
+        self.challenge = next((a for a in attempts if a.get("status") == 402), None)
+        self.final = attempts[-1]
+
+    @property
+    def recorded_seconds(self) -> float:
+        """End-to-end time of the recorded exchange."""
+        final = self.final
+        return float(final["t"] + final.get("duration", final.get("latency", 0.0)) - self.t)
+
+
+def exchanges(records: Iterable[dict[str, Any]]) -> list[Exchange]:
+    """Group trace records into exchanges ordered by start time."""
+    grouped: dict[int, list[dict[str, Any]]] = {}
+    for record in records:
+        grouped.setdefault(record["id"], []).append(record)
+    result = [Exchange(sorted(a, key=lambda r: r["t"])) for a in grouped.values()]
+    return sorted(result, key=lambda e: e.t)
+
+
+class RecordedAnswers:
+    """Answers of a :class:`~x402_openai._standin.StandInGateway` replaying *recorded*.
+
+    Each request is matched to its exchange through :data:`REPLAY_HEADER`
+    and answered with the recorded challenge, status, latency, body size
+    and streaming duration.
+    """
+
+    def __init__(self, recorded: Iterable[Exchange]) -> None:
+        self._exchanges = {e.id: e for e in recorded}
+
+    def __call__(self, handler: BaseHTTPRequestHandler) -> None:
+        length = int(handler.headers.get("content-length", 0))
+        handler.rfile.read(length)
+        exchange = self._exchanges.get(int(handler.headers.get(REPLAY_HEADER, -1)))
+        if exchange is None:
+            handler.send_error(404, "unknown replay id")
+            return
+
+        paid = any(h in handler.headers for h in PAYMENT_HEADERS)
+        record = exchange.final if paid or exchange.challenge is None else exchange.challenge
+        time.sleep(record.get("latency", 0.0))
+
+        if record.get("status") == 402:
+            challenge = record.get("challenge", {})
+            body = challenge.get("body", "").encode()
+            handler.send_response(402)
+            for name, value in challenge.get("headers", {}).items():
+                handler.send_header(name, value)
+            handler.send_header("content-length", str(len(body)))
+            handler.end_headers()
+            handler.wfile.write(body)
+            return
+
+        status = record.get("status") or 502
+        size = record.get("response_bytes", 0)
+        transfer = max(record.get("duration", 0.0) - record.get("latency", 0.0), 0.0)
+        handler.send_response(status)
+        if record.get("settled"):
+            handler.send_header("payment-response", "replayed")
+        if not record.get("stream"):
+            handler.send_header("content-type", "application/json")
+            handler.send_header("content-length", str(size))
+            handler.end_headers()
+            time.sleep(transfer)
+            handler.wfile.write(b" " * size)
+            return
+
+        handler.send_header("content-type", "text/event-stream")
+        handler.send_header("transfer-encoding", "chunked")
+        handler.end_headers()
+        piece = math.ceil(size / _STREAM_CHUNKS) if size else 0
+        for _ in range(_STREAM_CHUNKS if size else 0):
+            chunk = b" " * min(piece, size)
+            size -= len(chunk)
+            if chunk:
+                handler.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+                handler.wfile.flush()
+            time.sleep(transfer / _STREAM_CHUNKS)
+        handler.wfile.write(b"0\r\n\r\n")
+
+
+def stand_in(recorded: Iterable[Exchange]) -> StandInGateway:
+    """Return a stand-in gateway replaying *recorded*; ``__enter__`` returns its URL.
+
+    Recorded paths include the API prefix, so the URL is the bare origin.
+    """
+    return StandInGateway(answer=RecordedAnswers(recorded), prefix="")
+
+
+class _StubSigner:
+    """x402 client that "signs" every challenge with a fixed header."""
+
+    async def handle_402_response(self, headers: dict[str, str], body: bytes) -> Any:
+        return {"x-payment": "replay"}, None
+
+
+class ReplayReport:
+    """End-to-end timings of a replay next to the recorded ones."""
+
+    __slots__ = ("errors", "recorded", "replayed", "wall")
+
+    def __init__(self) -> None:
+        self.recorded: list[float] = []
+        self.replayed: list[float] = []
+        self.errors = 0
+        self.wall = 0.0
+
+    def summary(self) -> str:
+        """Return a human-readable comparison."""
+        lines = [f"exchanges {len(self.replayed)}  errors {self.errors}  wall {self.wall:.2f}s"]
+        for name, values in (("recorded", self.recorded), ("replayed", self.replayed)):
+            p50, p95, p99 = (_percentile(values, q) for q in (0.5, 0.95, 0.99))
+            lines.append(
+                f"{name:<9} p50 {p50 * 1e3:8.1f} ms  p95 {p95 * 1e3:8.1f} ms  "
+                f"p99 {p99 * 1e3:8.1f} ms"
+            )
+        return "\n".join(lines)
+
+
+def _percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def replay(
+    recorded: list[Exchange],
+    *,
+    base_url: str,
+    x402_client: Any = None,
+    speed: float = 1.0,
+    **transport_options: Any,
+) -> ReplayReport:
+    """Replay *recorded* against *base_url* and return the timings.
+
+    Parameters
+    ----------
+    x402_client:
+        ``x402HTTPClient`` used to sign challenges; defaults to a stub.
+    speed:
+        Time compression of the original schedule (``2`` = twice as fast).
+    transport_options:
+        Forwarded to :class:`~x402_openai.AsyncX402Transport`, e.g.
+        ``coalesce=True``, to compare transport configurations.
+    """
+    report = ReplayReport()
+    transport = AsyncX402Transport(x402_client or _StubSigner(), **transport_options)
+    origin = recorded[0].t if recorded else 0.0
+
+    async with httpx.AsyncClient(transport=transport, timeout=60.0) as client:
+        start = time.monotonic()
+
+        async def play(exchange: Exchange) -> None:
+            await asyncio.sleep(
+                max(0.0, (exchange.t - origin) / speed - (time.monotonic() - start))
+            )
+            began = time.monotonic()
+            try:
+                async with client.stream(
+                    exchange.method,
+                    base_url + exchange.path,
+                    content=b" " * exchange.request_bytes,
+                    headers={REPLAY_HEADER: str(exchange.id)},
+                ) as response:
+                    await response.aread()
+                if response.status_code >= 400:
+                    report.errors += 1
+            except httpx.HTTPError:
+                report.errors += 1
+            report.replayed.append(time.monotonic() - began)
+            report.recorded.append(exchange.recorded_seconds)
+
+        await asyncio.gather(*(play(e) for e in recorded))
+        report.wall = time.monotonic() - start
+    return report
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m x402_openai.replay", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument("trace", help="JSONL trace written by TrafficRecorder")
+    parser.add_argument("--speed", type=float, default=1.0, help="schedule compression")
+    parser.add_argument("--coalesce", action="store_true", help="enable request coalescing")
+    parser.add_argument("--paid-retries", type=int, default=2)
+    args = parser.parse_args(argv)
+
+    recorded = exchanges(load_trace(args.trace))
+    with stand_in(recorded) as base_url:
+        report = asyncio.run(
+            replay(
+                recorded,
+                base_url=base_url,
+                speed=args.speed,
+                coalesce=args.coalesce,
+                paid_retries=args.paid_retries,
+            )
+        )
+    print(report.summary())
+
+
+if __name__ == "__main__":
+    with contextlib.suppress(KeyboardInterrupt):
+        main()
@@ -0,0 +1,310 @@
+"""Signer daemon: one process holding the wallet keys for many workers.
+
+Serves a Unix domain socket that :class:`~x402_openai.wallets.RemoteWallet`
+connects to.  Application workers hold no keys and spend no CPU on
+signing; each payment costs them one local IPC round trip.
+
+Signing requests arriving together from many connections are collected
+into batches of up to ``--max-batch`` and handed to a pool of
+``--processes`` signing processes, each with its own copy of the wallets,
+so signing uses several cores.  While every process is busy, new requests
+queue up and leave in the next, larger batch.  Requests in a batch for the
+same requirements are signed in one :class:`~x402_openai.wallets.BatchSigner`
+call.
+
+Wallets are read from the environment (``EVM_PRIVATE_KEY``, ``MNEMONIC``,
+``SOLANA_PRIVATE_KEY``), as for the paying proxy.  The socket is created
+with mode ``0600``: only the daemon's user can request signatures.
+
+Usage::
+
+    EVM_PRIVATE_KEY=0x… python -m x402_openai.signer --socket /run/x402/signer.sock
+        [--processes 4] [--max-batch 64]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import concurrent.futures
+import contextlib
+import json
+import logging
+import multiprocessing
+import os
+import stat
+import tempfile
+from typing import TYPE_CHECKING, Any
+
+from x402_openai.proxy import wallets_from_env
+from x402_openai.wallets._batch import BatchSigner
+from x402_openai.wallets._remote import FRAME, MAX_FRAME, encode_frame
+
+if TYPE_CHECKING:
+    from x402_openai.wallets._base import Wallet
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SOCKET = os.path.join(tempfile.gettempdir(), "x402-signer.sock")
+
+_Batch = list[tuple[int, dict[str, Any]]]
+
+
+def _sign_all(signer: BatchSigner, batch: _Batch) -> list[dict[str, Any]]:
+    """Sign *batch*, requests for the same requirements in one call each."""
+    groups: dict[str, list[int]] = {}
+    for index, (version, requirements) in enumerate(batch):
+        key = json.dumps([version, requirements], sort_keys=True)
+        groups.setdefault(key, []).append(index)
+
+    answers: list[dict[str, Any]] = [{}] * len(batch)
+    for indices in groups.values():
+        version, requirements = batch[indices[0]]
+        try:
+            payloads = signer.sign(requirements, len(indices), version=version)
+        except Exception as exc:
+            error = {"error": f"{type(exc).__name__}: {exc}"}
+            for index in indices:
+                answers[index] = error
+        else:
+            for index, payload in zip(indices, payloads, strict=True):
+                answers[index] = {"result": payload}
+    return answers
+
+
+# The wallets of a signing process, set up once by its initializer.
+_signer: BatchSigner | None = None
+
+
+def _start_process(wallets: list[Wallet]) -> None:
+    global _signer
+    _signer = BatchSigner(wallets)
+
+
+def _sign_in_process(batch: _Batch) -> list[dict[str, Any]]:
+    assert _signer is not None
+    return _sign_all(_signer, batch)
+
+
+class SignerDaemon:
+    """Unix-socket signing service for :class:`~x402_openai.wallets.RemoteWallet`.
+
+    Parameters
+    ----------
+    wallets:
+        Wallet adapters holding the keys.  They are pickled into each
+        signing process.
+    path:
+        Socket path; a stale socket left there is replaced.
+    processes:
+        Signing processes (default: CPU count).  ``1`` signs in a thread of
+        the daemon process instead.
+    max_batch:
+        Most signing requests handed to a process at once (default ``64``).
+
+    Examples
+    --------
+    ::
+
+        async with SignerDaemon([EvmWallet(private_key="0x…")], "/run/x402/signer.sock") as d:
+            await d.serve_forever()
+    """
+
+    def __init__(
+        self,
+        wallets: list[Wallet],
+        path: str | os.PathLike[str] = DEFAULT_SOCKET,
+        *,
+        processes: int | None = None,
+        max_batch: int = 64,
+    ) -> None:
+        processes = processes or os.cpu_count() or 1
+        if max_batch < 1:
+            raise ValueError("'max_batch' must be at least 1.")
+        self.path = os.fspath(path)
+        self.batches = 0
+        self.signed = 0
+        self._wallets = wallets
+        self._processes = processes
+        self._max_batch = max_batch
+        self._signer = BatchSigner(wallets)
+        self._pool: concurrent.futures.Executor | None = None
+        self._queue: asyncio.Queue[tuple[tuple[int, dict[str, Any]], asyncio.Future[Any]]] = (
+            asyncio.Queue()
+        )
+        self._server: asyncio.Server | None = None
+        self._connections: set[asyncio.StreamWriter] = set()
+        self._dispatcher: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Listen, then start the signing processes."""
+        with contextlib.suppress(FileNotFoundError):
+            if stat.S_ISSOCK(os.stat(self.path).st_mode):
+                os.unlink(self.path)
+        previous = os.umask(0o177)
+        try:
+            self._server = await asyncio.start_unix_server(self._serve, self.path)
+        finally:
+            os.umask(previous)
+
+        if self._processes > 1:
+            # Not forked from the daemon: its threads and sockets stay out of the children.
+            method = (
+                "forkserver"
+                if "forkserver" in multiprocessing.get_all_start_methods()
+                else "spawn"
+            )
+            self._pool = concurrent.futures.ProcessPoolExecutor(
+                self._processes,
+                mp_context=multiprocessing.get_context(method),
+                initializer=_start_process,
+                initargs=(self._wallets,),
+            )
+            loop = asyncio.get_running_loop()
+            try:
+                await asyncio.gather(
+                    *(
+                        loop.run_in_executor(self._pool, _sign_in_process, [])
+                        for _ in range(self._processes)
+                    )
+                )
+            except BaseException:
+                await self.aclose()
+                raise
+        else:
+            self._pool = concurrent.futures.ThreadPoolExecutor(1, thread_name_prefix="x402-signer")
+        self._dispatcher = asyncio.create_task(self._dispatch())
+        logger.info(
+            "x402: signer on %s (%d scheme entries, %d processes)",
+            self.path,
+            len(self._signer.describe()),
+            self._processes,
+        )
+
+    async def serve_forever(self) -> None:
+        """Serve until cancelled."""
+        if self._server is None:
+            await self.start()
+        assert self._server is not None
+        await self._server.serve_forever()
+
+    async def aclose(self) -> None:
+        """Stop listening, remove the socket and stop the signing processes."""
+        if self._server is not None:
+            self._server.close()
+            for writer in self._connections:
+                writer.close()  # Workers keep idle connections open.
+            await self._server.wait_closed()
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self.path)
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._dispatcher
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+
+    async def __aenter__(self) -> SignerDaemon:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.aclose()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Answer the requests of one connection, one at a time."""
+        self._connections.add(writer)
+        try:
+            while True:
+                (size,) = FRAME.unpack(await reader.readexactly(FRAME.size))
+                if size > MAX_FRAME:
+                    return
+                try:
+                    answer = await self._answer(json.loads(await reader.readexactly(size)))
+                except ValueError as exc:
+                    answer = {"error": f"malformed request: {exc}"}
+                writer.write(encode_frame(answer))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass  # The worker went away.
+        finally:
+            self._connections.discard(writer)
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _answer(self, request: Any) -> dict[str, Any]:
+        if not isinstance(request, dict):
+            raise ValueError(f"expected an object, got {type(request).__name__}")
+        op = request.get("op")
+        if op == "schemes":
+            return {"result": self._signer.describe()}
+        if op != "sign":
+            return {"error": f"unknown op {op!r}"}
+        version = request.get("version")
+        requirements = request.get("requirements")
+        if version not in (1, 2) or isinstance(version, bool):
+            raise ValueError(f"unsupported version {version!r}")
+        if not isinstance(requirements, dict):
+            raise ValueError("'requirements' must be an object")
+        future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait(((version, requirements), future))
+        return await future
+
+    async def _dispatch(self) -> None:
+        """Hand queued requests to idle signing processes in batches."""
+        idle = asyncio.Semaphore(self._processes)
+        while True:
+            await idle.acquire()
+            batch = [await self._queue.get()]
+            while len(batch) < self._max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            task = asyncio.create_task(self._sign(batch))
+            task.add_done_callback(lambda _: idle.release())
+
+    async def _sign(
+        self, batch: list[tuple[tuple[int, dict[str, Any]], asyncio.Future[Any]]]
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        work = [item for item, _ in batch]
+        try:
+            if isinstance(self._pool, concurrent.futures.ProcessPoolExecutor):
+                answers = await loop.run_in_executor(self._pool, _sign_in_process, work)
+            else:
+                answers = await loop.run_in_executor(self._pool, _sign_all, self._signer, work)
+        except Exception as exc:
+            logger.exception("x402: signing batch failed")
+            answers = [{"error": f"{type(exc).__name__}: {exc}"}] * len(batch)
+        self.batches += 1
+        self.signed += len(batch)
+        for (_, future), answer in zip(batch, answers, strict=True):
+            if not future.done():
+                future.set_result(answer)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m x402_openai.signer", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument("--socket", default=DEFAULT_SOCKET, help="Unix socket path")
+    parser.add_argument("--processes", type=int, help="signing processes (default: CPU count)")
+    parser.add_argument("--max-batch", type=int, default=64)
+    args = parser.parse_args(argv)
+
+    wallets = wallets_from_env()
+    if not wallets:
+        parser.error("set EVM_PRIVATE_KEY, MNEMONIC or SOLANA_PRIVATE_KEY")
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    daemon = SignerDaemon(wallets, args.socket, processes=args.processes, max_batch=args.max_batch)
+
+    async def serve() -> None:
+        async with daemon:
+            await daemon.serve_forever()
+
+    asyncio.run(serve())
+
+
+if __name__ == "__main__":
+    with contextlib.suppress(KeyboardInterrupt):
+        main()
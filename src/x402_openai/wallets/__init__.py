@@ -5,16 +5,47 @@ Public API:
 - :class:`Wallet` — protocol that all adapters implement.
 - :class:`EvmWallet` — EVM / Ethereum adapter.
 - :class:`SvmWallet` — Solana adapter.
+- :class:`BalanceMonitor` — cached token balances that let wallets skip
+  payments they cannot cover.
+- :class:`BatchSigner` — signs many payments for given requirements in one
+  call.
+- :class:`RemoteWallet` — signs through a signer daemon holding the keys
+  (:mod:`x402_openai.signer`).
+- :class:`BlockhashProvider` — shared recent-blockhash cache for SVM wallets.
+- :class:`SolanaRpcPool` — shared pooled Solana RPC clients for SVM wallets
+  (imported lazily; requires the ``svm`` extra).
 """
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any
+
+from x402_openai.wallets._balance import BalanceMonitor
 from x402_openai.wallets._base import Wallet
+from x402_openai.wallets._batch import BatchSigner
+from x402_openai.wallets._blockhash import BlockhashProvider
 from x402_openai.wallets._evm import EvmWallet
+from x402_openai.wallets._remote import RemoteWallet
 from x402_openai.wallets._svm import SvmWallet
 
+if TYPE_CHECKING:
+    from x402_openai.wallets._solana_rpc import SolanaRpcPool
+
 __all__ = [
+    "BalanceMonitor",
+    "BatchSigner",
+    "BlockhashProvider",
     "EvmWallet",
+    "RemoteWallet",
+    "SolanaRpcPool",
     "SvmWallet",
     "Wallet",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "SolanaRpcPool":
+        from x402_openai.wallets._solana_rpc import SolanaRpcPool
+
+        return SolanaRpcPool
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,245 @@
+"""Cached token-balance pre-check for x402 payments.
+
+Without it, a wallet that has run dry keeps signing payments: each one
+costs a signature and a paid round trip before settlement fails.
+
+A :class:`BalanceMonitor` polls the wallets' token balances from a
+background thread and subtracts the payments signed since, so the x402
+client can drop payment requirements the wallet cannot cover *before*
+anything is signed.  Wallets opt in with ``balance_monitor=``; the monitor
+then registers itself on their x402 client as a policy (filtering
+requirements) and an after-payment-creation hook (recording pending
+spend).  When every requirement is filtered out, signing fails and the
+transport returns the ``402`` unpaid.
+
+Balances are read over JSON-RPC — ERC-20 ``balanceOf`` for ``eip155:*``
+networks, ``getTokenAccountsByOwner`` for ``solana:*`` networks — from the
+endpoints in ``rpc_urls``.  Balances are kept per (address, network, asset),
+so wallets of different clients may share one monitor.  A pair is learnt
+from the first challenge asking for it and polled from then on; until its first
+balance arrives, and on networks without an endpoint, nothing is filtered.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import weakref
+from typing import Any
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# ERC-20 ``balanceOf(address)`` selector.
+_BALANCE_OF = "0x70a08231"
+
+
+class _Balance:
+    """Last polled balance of one (address, network, asset) plus spend signed since."""
+
+    __slots__ = ("amount", "pending")
+
+    def __init__(self) -> None:
+        self.amount: int | None = None
+        self.pending: list[tuple[float, int]] = []
+
+    def available(self) -> int | None:
+        if self.amount is None:
+            return None
+        return self.amount - sum(amount for _, amount in self.pending)
+
+
+class BalanceMonitor:
+    """Background-polled wallet balances minus pending spend.
+
+    One monitor can be shared by the EVM and SVM wallets of one client and
+    by the wallets of several clients; each client pays from one address
+    per chain family.
+
+    Parameters
+    ----------
+    rpc_urls:
+        JSON-RPC endpoint per CAIP-2 network, e.g.
+        ``{"eip155:8453": "https://mainnet.base.org"}``.
+    interval:
+        Seconds between polls (default ``15``).
+    settle_time:
+        Payments signed more than this many seconds before a poll are
+        assumed to be reflected in (or to have dropped out of) its balance
+        (default ``30``).
+    timeout:
+        Timeout of each RPC call in seconds (default ``10``).
+
+    Examples
+    --------
+    ::
+
+        monitor = BalanceMonitor(rpc_urls={"eip155:8453": "https://mainnet.base.org"})
+        client = X402OpenAI(wallet=EvmWallet(private_key="0x…", balance_monitor=monitor))
+    """
+
+    __slots__ = (
+        "_balances",
+        "_http",
+        "_interval",
+        "_lock",
+        "_owners",
+        "_rpc_urls",
+        "_settle_time",
+        "_stop",
+        "_thread",
+    )
+
+    def __init__(
+        self,
+        *,
+        rpc_urls: dict[str, str],
+        interval: float = 15.0,
+        settle_time: float = 30.0,
+        timeout: float = 10.0,
+    ) -> None:
+        if interval <= 0:
+            raise ValueError("'interval' must be positive.")
+        self._rpc_urls = dict(rpc_urls)
+        self._interval = interval
+        self._settle_time = settle_time
+        self._http = httpx.Client(timeout=timeout)
+        self._owners: weakref.WeakKeyDictionary[Any, dict[str, str]] = weakref.WeakKeyDictionary()
+        self._balances: dict[tuple[str, str, str], _Balance] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def watch(self, client: Any, family: str, address: str) -> None:
+        """Check payments of *address* on *family* networks made by *client*.
+
+        Called by wallets from ``register``; *family* is the CAIP-2
+        namespace (``"eip155"`` or ``"solana"``).  A later wallet of the same
+        family replaces the address, as it replaces the payment scheme.
+        """
+        with self._lock:
+            owners = self._owners.get(client)
+            if owners is not None:
+                owners[family] = address
+                return
+            owners = self._owners[client] = {family: address}
+        client.register_policy(lambda version, requirements: self._filter(owners, requirements))
+        client.on_after_payment_creation(lambda context: self._record(owners, context))
+
+    def available(self, address: str, network: str, asset: str) -> int | None:
+        """Return the spendable balance in atomic units, or ``None`` if unknown."""
+        with self._lock:
+            balance = self._balances.get((address, network, asset))
+            return None if balance is None else balance.available()
+
+    def _filter(self, owners: dict[str, str], requirements: list[Any]) -> list[Any]:
+        """x402 policy dropping *requirements* the paying address cannot cover."""
+        affordable = []
+        for requirement in requirements:
+            key = self._key(owners, requirement)
+            if key is None:
+                affordable.append(requirement)
+                continue
+            with self._lock:
+                balance = self._balances.get(key)
+                if balance is None:
+                    self._balances[key] = _Balance()
+                    self._start()
+                    left = None
+                else:
+                    left = balance.available()
+            if left is None or left >= _amount(requirement):
+                affordable.append(requirement)
+            else:
+                logger.info(
+                    "x402: skipping %s — balance %d below %d", key[1], left, _amount(requirement)
+                )
+        return affordable
+
+    def refresh(self) -> None:
+        """Poll every known balance now."""
+        for key in list(self._balances):
+            started = time.monotonic()
+            try:
+                amount = self._fetch(*key)
+            except Exception:
+                logger.warning("x402: balance poll failed for %s %s %s", *key)
+                continue
+            with self._lock:
+                balance = self._balances[key]
+                balance.amount = amount
+                cutoff = started - self._settle_time
+                balance.pending = [p for p in balance.pending if p[0] >= cutoff]
+
+    def close(self) -> None:
+        """Stop polling and close the RPC connections."""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join()
+        self._http.close()
+
+    def _record(self, owners: dict[str, str], context: Any) -> None:
+        """After-payment-creation hook: count the signed amount as pending."""
+        requirement = context.selected_requirements
+        key = self._key(owners, requirement)
+        if key is None:
+            return
+        with self._lock:
+            balance = self._balances.setdefault(key, _Balance())
+            balance.pending.append((time.monotonic(), _amount(requirement)))
+
+    def _key(self, owners: dict[str, str], requirement: Any) -> tuple[str, str, str] | None:
+        network = str(requirement.network)
+        owner = owners.get(network.partition(":")[0])
+        if owner is None or network not in self._rpc_urls:
+            return None
+        return owner, network, str(requirement.asset)
+
+    def _start(self) -> None:
+        """Start the poller thread if needed.  Caller holds the lock."""
+        if self._thread is None and not self._stop.is_set():
+            self._thread = threading.Thread(target=self._run, name="x402-balance", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            self.refresh()
+            if self._stop.wait(self._interval):
+                return
+
+    def _fetch(self, owner: str, network: str, asset: str) -> int:
+        if network.startswith("eip155:"):
+            data = _BALANCE_OF + owner.lower().removeprefix("0x").rjust(64, "0")
+            result = self._call(network, "eth_call", [{"to": asset, "data": data}, "latest"])
+            return int(result, 16)
+        result = self._call(
+            network,
+            "getTokenAccountsByOwner",
+            [owner, {"mint": asset}, {"encoding": "jsonParsed"}],
+        )
+        return sum(
+            int(account["account"]["data"]["parsed"]["info"]["tokenAmount"]["amount"])
+            for account in result["value"]
+        )
+
+    def _call(self, network: str, method: str, params: list[Any]) -> Any:
+        response = self._http.post(
+            self._rpc_urls[network],
+            json={"jsonrpc": "2.0", "id": 1, "method": method, "params": params},
+        )
+        response.raise_for_status()
+        body = response.json()
+        if "error" in body:
+            raise RuntimeError(f"{method} failed: {body['error']}")
+        return body["result"]
+
+
+def _amount(requirement: Any) -> int:
+    """Return the amount of v2 (``amount``) or v1 (``max_amount_required``) requirements."""
+    amount = getattr(requirement, "amount", None)
+    if amount is None:
+        amount = requirement.max_amount_required
+    return int(amount)
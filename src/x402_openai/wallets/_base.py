@@ -23,6 +23,11 @@ class Wallet(Protocol):
     - Derive or hold a signing key for its chain.
     - Register the appropriate x402 payment scheme on an ``x402ClientSync``
       or ``x402Client`` instance.
+
+    A registered scheme client may also offer
+    ``create_payment_payloads(requirements, count)``, returning *count*
+    independent inner payloads in one call; :class:`~x402_openai.wallets.BatchSigner`
+    uses it when present and signs one payment at a time otherwise.
     """
 
     def register(self, client: Any) -> None:
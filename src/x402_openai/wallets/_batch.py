@@ -0,0 +1,103 @@
+"""Batch payment signing outside an x402 client.
+
+:class:`BatchSigner` registers wallets the way an x402 client does and
+signs requirements it is handed directly: no 402 challenge, requirement
+selection or policies.  ``sign(requirements, count)`` returns *count*
+independent inner payloads (the ``payload`` member of a payment).  Scheme
+clients offering ``create_payment_payloads(requirements, count)``, such as
+the EVM exact scheme, sign the whole batch in one call; others are called
+once per payment.
+
+Pre-signing pools, bulk APIs and the signer daemon
+(:mod:`x402_openai.signer`) build on it.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from x402_openai.wallets._base import Wallet
+
+
+class BatchSigner:
+    """Signs payments for given requirements with the keys of *wallets*.
+
+    Parameters
+    ----------
+    wallets:
+        Wallet adapters whose payment schemes are used.  Each is registered
+        once, on construction.
+
+    Examples
+    --------
+    ::
+
+        signer = BatchSigner([EvmWallet(private_key="0x…")])
+        payloads = signer.sign(challenge.accepts[0], 256)
+    """
+
+    def __init__(self, wallets: list[Wallet]) -> None:
+        self.schemes: dict[str, dict[str, Any]] = {}
+        self.schemes_v1: dict[str, dict[str, Any]] = {}
+        for wallet in wallets:
+            wallet.register(self)
+
+    def register(self, network: str, client: Any) -> BatchSigner:
+        self.schemes.setdefault(network, {})[client.scheme] = client
+        return self
+
+    def register_v1(self, network: str, client: Any) -> BatchSigner:
+        self.schemes_v1.setdefault(network, {})[client.scheme] = client
+        return self
+
+    def register_policy(self, policy: Any) -> BatchSigner:
+        return self
+
+    def on_after_payment_creation(self, hook: Any) -> BatchSigner:
+        return self
+
+    def describe(self) -> list[dict[str, Any]]:
+        """Return the ``(version, network, scheme)`` entries the wallets cover."""
+        return [
+            {"version": version, "network": network, "scheme": scheme}
+            for version, table in ((2, self.schemes), (1, self.schemes_v1))
+            for network, schemes in table.items()
+            for scheme in schemes
+        ]
+
+    def sign(
+        self, requirements: Any, count: int = 1, *, version: int | None = None
+    ) -> list[dict[str, Any]]:
+        """Return *count* independent inner payloads for *requirements*.
+
+        *requirements* is a ``PaymentRequirements``, a ``PaymentRequirementsV1``
+        or the JSON form of either; *version* picks the model for the JSON
+        form (default ``2``).  Raises ``LookupError`` if no wallet covers
+        its scheme and network.
+        """
+        from x402 import find_schemes_by_network
+        from x402.schemas import PaymentRequirements, PaymentRequirementsV1
+
+        if count < 1:
+            raise ValueError("'count' must be at least 1.")
+        if isinstance(requirements, Mapping):
+            model = PaymentRequirementsV1 if version == 1 else PaymentRequirements
+            requirements = model.model_validate(requirements)
+        elif version is None:
+            version = 1 if isinstance(requirements, PaymentRequirementsV1) else 2
+
+        schemes = find_schemes_by_network(
+            self.schemes_v1 if version == 1 else self.schemes, requirements.network
+        )
+        if not schemes or requirements.scheme not in schemes:
+            raise LookupError(
+                f"no wallet for {requirements.scheme} payments on {requirements.network}"
+            )
+        scheme = schemes[requirements.scheme]
+        create_batch = getattr(scheme, "create_payment_payloads", None)
+        if create_batch is not None:
+            payloads: list[dict[str, Any]] = create_batch(requirements, count)
+            return payloads
+        return [scheme.create_payment_payload(requirements) for _ in range(count)]
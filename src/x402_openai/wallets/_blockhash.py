@@ -0,0 +1,158 @@
+"""Recent-blockhash prefetching for Solana (SVM) payments.
+
+Every exact-scheme SVM payment embeds a recent blockhash.  ``x402`` fetches
+one with ``getLatestBlockhash`` while building each payment, which puts a
+full RPC round trip on the critical path of every paid request.
+
+A :class:`BlockhashProvider` keeps the latest blockhash per RPC endpoint and
+refreshes it from a background thread well before it expires (a blockhash
+stays valid for roughly 60 to 90 seconds), so payment construction reads it
+from memory in steady state.  Only the first payment per endpoint, or one
+after the refresher fell behind ``max_age``, waits on RPC.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class _Entry:
+    """Latest ``getLatestBlockhash`` response for one endpoint."""
+
+    __slots__ = ("fetched_at", "response", "used_at")
+
+    def __init__(self, response: Any, now: float) -> None:
+        self.response = response
+        self.fetched_at = now
+        self.used_at = now
+
+
+class BlockhashProvider:
+    """Cache of recent Solana blockhashes with a background refresher.
+
+    One provider can (and should) be shared by many
+    :class:`~x402_openai.wallets.SvmWallet` instances.
+
+    Parameters
+    ----------
+    refresh_interval:
+        Seconds between background refreshes (default ``15``).
+    max_age:
+        A cached blockhash older than this is never used; the caller
+        fetches a fresh one inline instead (default ``45``).
+    idle_timeout:
+        Endpoints not used for this many seconds stop being refreshed
+        (default ``300``).
+    rpc:
+        Optional callable ``rpc(endpoint)`` returning a client with
+        ``get_latest_blockhash()``, e.g. :meth:`SolanaRpcPool.client`.
+        Defaults to one ``solana`` ``Client`` per endpoint.
+
+    Examples
+    --------
+    ::
+
+        blockhashes = BlockhashProvider()
+        wallets = [SvmWallet(private_key=k, blockhash_provider=blockhashes) for k in keys]
+    """
+
+    __slots__ = (
+        "_clients",
+        "_entries",
+        "_idle_timeout",
+        "_lock",
+        "_max_age",
+        "_refresh_interval",
+        "_rpc",
+        "_stop",
+        "_thread",
+    )
+
+    def __init__(
+        self,
+        *,
+        refresh_interval: float = 15.0,
+        max_age: float = 45.0,
+        idle_timeout: float = 300.0,
+        rpc: Any = None,
+    ) -> None:
+        if refresh_interval <= 0:
+            raise ValueError("'refresh_interval' must be positive.")
+        if max_age <= refresh_interval:
+            raise ValueError("'max_age' must be greater than 'refresh_interval'.")
+        self._refresh_interval = refresh_interval
+        self._max_age = max_age
+        self._idle_timeout = idle_timeout
+        self._rpc = rpc
+        self._clients: dict[str, Any] = {}
+        self._entries: dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def latest(self, endpoint: str) -> Any:
+        """Return a recent ``getLatestBlockhash`` response for *endpoint*."""
+        now = time.monotonic()
+        entry = self._entries.get(endpoint)
+        if entry is not None and now - entry.fetched_at < self._max_age:
+            entry.used_at = now
+            return entry.response
+
+        logger.debug("x402 svm: fetching blockhash inline from %s", endpoint)
+        response = self._fetch(endpoint)
+        with self._lock:
+            self._entries[endpoint] = _Entry(response, time.monotonic())
+            self._start()
+        return response
+
+    def close(self) -> None:
+        """Stop the background refresher."""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join()
+
+    def _start(self) -> None:
+        """Start the refresher thread if needed.  Caller holds the lock."""
+        if self._thread is None and not self._stop.is_set():
+            self._thread = threading.Thread(target=self._run, name="x402-blockhash", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._refresh_interval):
+            now = time.monotonic()
+            for endpoint, entry in list(self._entries.items()):
+                if now - entry.used_at > self._idle_timeout:
+                    with self._lock:
+                        self._entries.pop(endpoint, None)
+                    continue
+                try:
+                    response = self._fetch(endpoint)
+                except Exception:
+                    logger.warning("x402 svm: blockhash refresh failed for %s", endpoint)
+                    continue
+                fresh = _Entry(response, time.monotonic())
+                fresh.used_at = entry.used_at
+                with self._lock:
+                    self._entries[endpoint] = fresh
+
+    def _fetch(self, endpoint: str) -> Any:
+        client = self._clients.get(endpoint)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(endpoint)
+                if client is None:
+                    client = self._clients[endpoint] = self._connect(endpoint)
+        return client.get_latest_blockhash()
+
+    def _connect(self, endpoint: str) -> Any:
+        if self._rpc is not None:
+            return self._rpc(endpoint)
+        from solana.rpc.api import Client
+
+        return Client(endpoint)
@@ -0,0 +1,153 @@
+"""Minimal EIP-712 hashing for the flat typed data used by x402 payments.
+
+Covers the subset that ``TransferWithAuthorization`` (EIP-3009) needs:
+atomic field types (``address``, ``bool``, ``bytesN``, ``intN``/``uintN``)
+and the dynamic ``string``/``bytes`` types.  Nested structs and arrays are
+rejected with :class:`ValueError`; signers fall back to ``eth_account`` for
+those.
+
+The type hash and the domain separator are constant per (chain, asset,
+token name, version), so both are memoised; per payment only the message
+struct hash and the final digest are computed.  :func:`struct_hashes`
+goes one step further for batches of messages that differ in one member
+only (the nonce): the other members are encoded once per batch.
+
+Keccak-256 comes from ``pycryptodome`` (a dependency of ``eth-account``)
+when available, otherwise from ``eth_utils``.
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+Field = tuple[str, str]
+
+try:
+    from Crypto.Hash import keccak as _keccak
+
+    def _keccak256(data: bytes) -> bytes:
+        return _keccak.new(digest_bits=256, data=data).digest()
+
+except ImportError:  # pragma: no cover - pycryptodome ships with eth-account
+    from eth_utils.crypto import keccak as _eth_keccak
+
+    def _keccak256(data: bytes) -> bytes:
+        return bytes(_eth_keccak(data))
+
+
+def keccak256(data: bytes) -> bytes:
+    """Return the Keccak-256 digest of *data*."""
+    return _keccak256(data)
+
+
+def encode_type(primary_type: str, fields: Sequence[Field]) -> str:
+    """Return the EIP-712 type string, e.g. ``"Mail(address to,string body)"``."""
+    return f"{primary_type}({','.join(f'{t} {n}' for n, t in fields)})"
+
+
+@functools.lru_cache(maxsize=256)
+def type_hash(primary_type: str, fields: tuple[Field, ...]) -> bytes:
+    """Return ``keccak256(encodeType(primary_type))`` (memoised)."""
+    return keccak256(encode_type(primary_type, fields).encode())
+
+
+def encode_value(type_name: str, value: Any) -> bytes:
+    """Return the 32-byte EIP-712 encoding of one atomic or dynamic *value*."""
+    if type_name == "string":
+        return keccak256(value.encode())
+    if type_name == "bytes":
+        return keccak256(_to_bytes(value))
+    if type_name == "address":
+        raw = _to_bytes(value)
+        if len(raw) != 20:
+            raise ValueError(f"Invalid address: {value!r}")
+        return raw.rjust(32, b"\0")
+    if type_name == "bool":
+        return int(bool(value)).to_bytes(32, "big")
+    if type_name.startswith("uint"):
+        return _to_int(value).to_bytes(32, "big")
+    if type_name.startswith("int"):
+        return _to_int(value).to_bytes(32, "big", signed=True)
+    if type_name.startswith("bytes") and type_name[5:].isdigit():
+        raw = _to_bytes(value)
+        if len(raw) > int(type_name[5:]):
+            raise ValueError(f"Value too long for {type_name}: {value!r}")
+        return raw.ljust(32, b"\0")
+    raise ValueError(f"Unsupported EIP-712 type: {type_name}")
+
+
+def struct_hash(primary_type: str, fields: Sequence[Field], data: Mapping[str, Any]) -> bytes:
+    """Return ``hashStruct(data)`` for a flat struct."""
+    return keccak256(
+        type_hash(primary_type, tuple(fields))
+        + b"".join(encode_value(t, data[n]) for n, t in fields)
+    )
+
+
+def struct_hashes(
+    primary_type: str,
+    fields: Sequence[Field],
+    data: Mapping[str, Any],
+    member: str,
+    values: Sequence[Any],
+) -> list[bytes]:
+    """Return ``hashStruct`` of *data* once per value of its *member* field.
+
+    *data*'s own value for *member*, if any, is ignored.
+    """
+    index = [name for name, _ in fields].index(member)
+    head = type_hash(primary_type, tuple(fields)) + b"".join(
+        encode_value(t, data[n]) for n, t in fields[:index]
+    )
+    tail = b"".join(encode_value(t, data[n]) for n, t in fields[index + 1 :])
+    kind = fields[index][1]
+    return [keccak256(head + encode_value(kind, value) + tail) for value in values]
+
+
+@functools.lru_cache(maxsize=256)
+def domain_separator(
+    name: str | None,
+    version: str | None,
+    chain_id: int | None,
+    verifying_contract: str | None,
+) -> bytes:
+    """Return the EIP-712 domain separator (memoised); ``None`` members are omitted."""
+    fields: list[Field] = []
+    values: dict[str, Any] = {}
+    for field, type_name, value in (
+        ("name", "string", name),
+        ("version", "string", version),
+        ("chainId", "uint256", chain_id),
+        ("verifyingContract", "address", verifying_contract),
+    ):
+        if value is not None:
+            fields.append((field, type_name))
+            values[field] = value
+    return struct_hash("EIP712Domain", fields, values)
+
+
+def signing_digest(separator: bytes, message_hash: bytes) -> bytes:
+    """Return the final digest ``keccak256(0x1901 ‖ separator ‖ message_hash)``."""
+    return keccak256(b"\x19\x01" + separator + message_hash)
+
+
+def _to_bytes(value: Any) -> bytes:
+    if isinstance(value, bytes | bytearray):
+        return bytes(value)
+    if isinstance(value, str):
+        return bytes.fromhex(value.removeprefix("0x").removeprefix("0X"))
+    raise ValueError(f"Expected bytes or hex string, got {type(value).__name__}")
+
+
+def _to_int(value: Any) -> int:
+    if isinstance(value, bool):
+        raise ValueError("Expected an integer, got bool")
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        return int(value, 16) if value.lower().startswith("0x") else int(value)
+    raise ValueError(f"Expected an integer, got {type(value).__name__}")
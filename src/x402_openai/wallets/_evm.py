@@ -5,6 +5,10 @@ Supports two credential sources:
 - Raw hex private key (``"0x…"``).
 - BIP-39 mnemonic phrase with optional derivation parameters.
 
+Signing uses a selectable backend (see :mod:`._evm_signers`): ``coincurve``
+(libsecp256k1) when installed, otherwise ``eth_account``.  The registered
+V2 scheme (:mod:`._evm_schemes`) can also sign payments in batches.
+
 All heavy dependencies (``eth_account``, ``x402.mechanisms.evm``) are imported
 lazily so that users who only need SVM do not pay the import cost.
 """
@@ -12,7 +16,12 @@ lazily so that users who only need SVM do not pay the import cost.
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+from x402_openai.wallets._evm_signers import SIGNER_BACKENDS, create_signer, resolve_backend
+
+if TYPE_CHECKING:
+    from x402_openai.wallets._balance import BalanceMonitor
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +46,13 @@ class EvmWallet:
         Custom BIP-44 derivation path.  Overrides *account_index*.
     passphrase:
         Optional BIP-39 passphrase.
+    signer_backend:
+        ``"auto"`` (default), ``"coincurve"`` or ``"eth_account"``.  All
+        backends produce byte-identical signatures; ``coincurve`` is several
+        times faster.
+    balance_monitor:
+        Optional :class:`~x402_openai.wallets.BalanceMonitor`; payments this
+        wallet's token balance cannot cover are skipped before signing.
 
     Examples
     --------
@@ -45,9 +61,18 @@ class EvmWallet:
         wallet = EvmWallet(private_key="0x…")
         wallet = EvmWallet(mnemonic="word1 word2 … word12")
         wallet = EvmWallet(mnemonic="word1 …", account_index=2)
+        wallet = EvmWallet(private_key="0x…", signer_backend="coincurve")
     """
 
-    __slots__ = ("_account_index", "_derivation_path", "_mnemonic", "_passphrase", "_private_key")
+    __slots__ = (
+        "_account_index",
+        "_balance_monitor",
+        "_derivation_path",
+        "_mnemonic",
+        "_passphrase",
+        "_private_key",
+        "_signer_backend",
+    )
 
     def __init__(
         self,
@@ -57,6 +82,8 @@ class EvmWallet:
         account_index: int = 0,
         derivation_path: str | None = None,
         passphrase: str = "",
+        signer_backend: str = "auto",
+        balance_monitor: BalanceMonitor | None = None,
     ) -> None:
         sources = sum([private_key is not None, mnemonic is not None])
         if sources == 0:
@@ -65,12 +92,16 @@ class EvmWallet:
             raise ValueError("EvmWallet accepts only one of 'private_key' or 'mnemonic'.")
         if derivation_path is not None and mnemonic is None:
             raise ValueError("'derivation_path' requires 'mnemonic'.")
+        if signer_backend not in SIGNER_BACKENDS:
+            raise ValueError(f"'signer_backend' must be one of {', '.join(SIGNER_BACKENDS)}.")
 
         self._private_key = private_key
         self._mnemonic = mnemonic
         self._account_index = account_index
         self._derivation_path = derivation_path
         self._passphrase = passphrase
+        self._signer_backend = signer_backend
+        self._balance_monitor = balance_monitor
 
     def __repr__(self) -> str:
         source = "private_key" if self._private_key is not None else "mnemonic"
@@ -78,12 +109,14 @@ class EvmWallet:
 
     def register(self, client: Any) -> None:
         """Register the EVM exact payment scheme on *client*."""
-        from x402.mechanisms.evm import EthAccountSigner
-        from x402.mechanisms.evm.exact.register import register_exact_evm_client
+        from x402_openai.wallets._evm_schemes import register_evm_schemes
 
         account = self._resolve_account()
-        signer = EthAccountSigner(account)
-        register_exact_evm_client(client, signer)
+        signer = create_signer(account, self._signer_backend)
+        register_evm_schemes(client, signer)
+        if self._balance_monitor is not None:
+            self._balance_monitor.watch(client, "eip155", account.address)
+        logger.debug("x402 evm wallet: %s signer", resolve_backend(self._signer_backend))
 
     def _resolve_account(self) -> Any:
         """Lazily derive the ``eth_account.Account`` from stored credentials."""
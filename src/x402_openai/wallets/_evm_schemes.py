@@ -0,0 +1,119 @@
+"""``x402`` EVM exact scheme that can sign many payments in one call.
+
+:class:`EvmScheme` behaves like the upstream V2 scheme for single
+payments and adds :meth:`~EvmScheme.create_payment_payloads`: given one set
+of requirements, it returns *count* independent payloads.  Per batch, the
+nonces come from one ``os.urandom`` read, and the chain, token domain,
+validity window and typed-data layout are resolved once.  With a signer
+that offers ``sign_typed_data_batch`` (the ``coincurve`` backend), the
+members that do not vary are hashed once as well, so each payment costs
+one Keccak-256 of its struct, one of its digest and one ECDSA signature.
+
+Imports ``x402.mechanisms.evm`` at module level, so import this module
+lazily.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import os
+from datetime import timedelta
+from typing import Any
+
+from x402.mechanisms.evm.constants import V1_NETWORKS
+from x402.mechanisms.evm.eip712 import build_typed_data_for_signing
+from x402.mechanisms.evm.exact.client import ExactEvmScheme
+from x402.mechanisms.evm.exact.v1.client import ExactEvmSchemeV1
+from x402.mechanisms.evm.types import (
+    ExactEIP3009Authorization,
+    ExactEIP3009Payload,
+    TypedDataField,
+)
+from x402.mechanisms.evm.utils import create_validity_window, get_asset_info, get_evm_chain_id
+
+
+class EvmScheme(ExactEvmScheme):
+    """V2 exact scheme with a batch signing path."""
+
+    def create_payment_payloads(self, requirements: Any, count: int) -> list[dict[str, Any]]:
+        """Return *count* independent inner payloads for *requirements*.
+
+        The payloads share the validity window and differ in their nonces.
+        """
+        if count < 1:
+            raise ValueError("'count' must be at least 1.")
+        entropy = os.urandom(32 * count)
+        nonces = [entropy[i : i + 32] for i in range(0, len(entropy), 32)]
+        valid_after, valid_before = create_validity_window(
+            timedelta(seconds=requirements.max_timeout_seconds or 3600)
+        )
+        template = ExactEIP3009Authorization(
+            from_address=self._signer.address,
+            to=requirements.pay_to,
+            value=requirements.amount,
+            valid_after=str(valid_after),
+            valid_before=str(valid_before),
+            nonce="0x" + nonces[0].hex(),
+        )
+        domain, types, primary_type, message = self._typed_data(template, requirements)
+
+        sign_batch = getattr(self._signer, "sign_typed_data_batch", None)
+        if sign_batch is not None:
+            signatures = sign_batch(domain, types, primary_type, message, "nonce", nonces)
+        else:
+            signatures = [
+                self._signer.sign_typed_data(domain, types, primary_type, {**message, "nonce": n})
+                for n in nonces
+            ]
+        return [
+            ExactEIP3009Payload(
+                authorization=dataclasses.replace(template, nonce="0x" + nonce.hex()),
+                signature="0x" + signature.hex(),
+            ).to_dict()
+            for nonce, signature in zip(nonces, signatures, strict=True)
+        ]
+
+    def _sign_authorization(
+        self, authorization: ExactEIP3009Authorization, requirements: Any
+    ) -> str:
+        signature: bytes = self._signer.sign_typed_data(
+            *self._typed_data(authorization, requirements)
+        )
+        return "0x" + signature.hex()
+
+    def _typed_data(
+        self, authorization: ExactEIP3009Authorization, requirements: Any
+    ) -> tuple[Any, dict[str, list[TypedDataField]], str, dict[str, Any]]:
+        """Return the EIP-712 typed data for *authorization*, as upstream builds it."""
+        network = str(requirements.network)
+        extra = dict(requirements.extra or {})
+        if "name" not in extra:
+            try:
+                asset_info = get_asset_info(network, requirements.asset)
+            except ValueError:
+                raise ValueError(
+                    "EIP-712 domain parameters (name, version) required in extra"
+                ) from None
+            extra["name"] = asset_info["name"]
+            extra["version"] = asset_info.get("version", "1")
+
+        domain, types, primary_type, message = build_typed_data_for_signing(
+            authorization,
+            get_evm_chain_id(network),
+            requirements.asset,
+            extra["name"],
+            extra.get("version", "1"),
+        )
+        fields = {
+            name: [TypedDataField(name=f["name"], type=f["type"]) for f in members]
+            for name, members in types.items()
+        }
+        return domain, fields, primary_type, message
+
+
+def register_evm_schemes(client: Any, signer: Any) -> None:
+    """Register the schemes like ``register_exact_evm_client`` does."""
+    client.register("eip155:*", EvmScheme(signer))
+    v1_scheme = ExactEvmSchemeV1(signer)
+    for network in V1_NETWORKS:
+        client.register_v1(network, v1_scheme)
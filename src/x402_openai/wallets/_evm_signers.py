@@ -0,0 +1,141 @@
+"""Alternative EVM signer backends for :class:`~x402_openai.wallets.EvmWallet`.
+
+``x402``'s ``EthAccountSigner`` routes every payment through
+``eth_account.sign_typed_data``, whose EIP-712 encoding is mostly pure
+Python.  :class:`CoincurveSigner` hashes the flat ``TransferWithAuthorization``
+struct directly (:mod:`._eip712`, reusing memoised domain separators and
+type hashes) and signs with libsecp256k1 through
+``coincurve``.  Both use RFC 6979 nonces with low-*s* normalisation, so the
+signatures are byte-identical.
+
+Select a backend with ``EvmWallet(signer_backend=…)``:
+
+- ``"auto"`` (default) — ``"coincurve"`` when installed, else ``"eth_account"``.
+- ``"coincurve"`` — requires ``pip install x402-openai[evm-fast]``.
+- ``"eth_account"`` — ``x402``'s ``EthAccountSigner``.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from x402_openai.wallets import _eip712
+
+SIGNER_BACKENDS = ("auto", "coincurve", "eth_account")
+
+
+def resolve_backend(name: str) -> str:
+    """Map ``"auto"`` to the fastest installed backend."""
+    if name != "auto":
+        return name
+    return "coincurve" if importlib.util.find_spec("coincurve") is not None else "eth_account"
+
+
+def create_signer(account: Any, backend: str) -> Any:
+    """Return an x402 ``ClientEvmSigner`` for *account* using *backend*."""
+    backend = resolve_backend(backend)
+    if backend == "coincurve":
+        return CoincurveSigner(account)
+
+    from x402.mechanisms.evm import EthAccountSigner
+
+    return EthAccountSigner(account)
+
+
+class CoincurveSigner:
+    """``ClientEvmSigner`` that signs EIP-712 digests with libsecp256k1.
+
+    Parameters
+    ----------
+    account:
+        An ``eth_account`` ``LocalAccount``; only its key and address are used.
+    """
+
+    __slots__ = ("_account", "_key")
+
+    def __init__(self, account: Any) -> None:
+        try:
+            from coincurve import PrivateKey
+        except ImportError as exc:
+            raise ImportError(
+                "The 'coincurve' signer backend requires coincurve. "
+                "Install with: pip install x402-openai[evm-fast]"
+            ) from exc
+        self._account = account
+        self._key = PrivateKey(bytes(account.key))
+
+    @property
+    def address(self) -> str:
+        """The signer's checksummed address."""
+        return str(self._account.address)
+
+    def sign_typed_data(
+        self,
+        domain: Any,
+        types: dict[str, Any],
+        primary_type: str,
+        message: dict[str, Any],
+    ) -> bytes:
+        """Sign EIP-712 typed data and return the 65-byte ``r ‖ s ‖ v`` signature."""
+        try:
+            fields = tuple(_field(f) for f in types[primary_type])
+            message_hash = _eip712.struct_hash(primary_type, fields, message)
+        except (KeyError, ValueError):
+            # Nested or unsupported types: defer to eth_account.
+            from x402.mechanisms.evm import EthAccountSigner
+
+            signature: bytes = EthAccountSigner(self._account).sign_typed_data(
+                domain, types, primary_type, message
+            )
+            return signature
+        separator = _eip712.domain_separator(*_domain_values(domain))
+        return self.sign_digest(_eip712.signing_digest(separator, message_hash))
+
+    def sign_typed_data_batch(
+        self,
+        domain: Any,
+        types: dict[str, Any],
+        primary_type: str,
+        message: dict[str, Any],
+        member: str,
+        values: Sequence[Any],
+    ) -> list[bytes]:
+        """Sign *message* once per value of its *member* field (e.g. one per nonce).
+
+        The domain separator and the other members are hashed once for the
+        whole batch.
+        """
+        try:
+            fields = tuple(_field(f) for f in types[primary_type])
+            hashes = _eip712.struct_hashes(primary_type, fields, message, member, values)
+        except (KeyError, ValueError):
+            return [
+                self.sign_typed_data(domain, types, primary_type, {**message, member: value})
+                for value in values
+            ]
+        separator = _eip712.domain_separator(*_domain_values(domain))
+        return [self.sign_digest(_eip712.signing_digest(separator, h)) for h in hashes]
+
+    def sign_digest(self, digest: bytes) -> bytes:
+        """Sign a 32-byte *digest* and return ``r ‖ s ‖ v`` with ``v`` in {27, 28}."""
+        raw = self._key.sign_recoverable(digest, hasher=None)
+        return raw[:64] + bytes([raw[64] + 27])
+
+
+def _field(field: Any) -> _eip712.Field:
+    if isinstance(field, Mapping):
+        return str(field["name"]), str(field["type"])
+    return str(field.name), str(field.type)
+
+
+def _domain_values(domain: Any) -> tuple[Any, Any, Any, Any]:
+    if isinstance(domain, Mapping):
+        return (
+            domain.get("name"),
+            domain.get("version"),
+            domain.get("chainId"),
+            domain.get("verifyingContract"),
+        )
+    return domain.name, domain.version, domain.chain_id, domain.verifying_contract
@@ -0,0 +1,212 @@
+"""Wallet adapter that signs through a local signer daemon.
+
+:class:`RemoteWallet` holds no key.  On ``register`` it asks the daemon
+(:mod:`x402_openai.signer`) which schemes and networks its wallets cover and
+registers a stand-in scheme client for each; every payment is then signed by
+one request/response exchange over the daemon's Unix domain socket.
+
+x402's async client calls scheme clients synchronously, so on an async
+client the exchange would block the event loop.  There the wallet also
+registers a before-payment-creation hook that runs the exchange in a worker
+thread and hands the payload to the scheme client.
+
+Frames are a 4-byte big-endian length followed by a JSON object.  Requests
+carry an ``op`` (``"schemes"`` or ``"sign"``); answers carry the result or
+an ``error`` message.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import json
+import logging
+import os
+import socket
+import struct
+import threading
+from contextvars import ContextVar
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Length prefix of a frame.
+FRAME = struct.Struct(">I")
+
+# Largest frame either side accepts.
+MAX_FRAME = 1 << 20
+
+_Schemes = dict[int, dict[str, dict[str, "_RemoteScheme"]]]
+
+# Outcome of the hook's exchange for the payment being created in this task:
+# (requirements, payload or the error raised).
+_presigned: ContextVar[tuple[Any, Any] | None] = ContextVar("x402_presigned", default=None)
+
+
+def encode_frame(message: dict[str, Any]) -> bytes:
+    """Serialise *message* as one frame."""
+    data = json.dumps(message, separators=(",", ":")).encode()
+    return FRAME.pack(len(data)) + data
+
+
+def _receive(sock: socket.socket, size: int) -> bytes:
+    chunks = []
+    while size:
+        chunk = sock.recv(size)
+        if not chunk:
+            raise ConnectionError("signer daemon closed the connection")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+class _RemoteScheme:
+    """x402 scheme client whose payloads are created by the daemon."""
+
+    def __init__(self, wallet: RemoteWallet, version: int, scheme: str) -> None:
+        self.scheme = scheme
+        self._wallet = wallet
+        self._version = version
+
+    def request(self, requirements: Any) -> dict[str, Any]:
+        """Return the daemon request signing *requirements*."""
+        return {
+            "op": "sign",
+            "version": self._version,
+            "requirements": requirements.model_dump(by_alias=True, mode="json"),
+        }
+
+    def create_payment_payload(self, requirements: Any) -> dict[str, Any]:
+        presigned = _presigned.get()
+        if presigned is not None and presigned[0] is requirements:
+            _presigned.set(None)
+            if isinstance(presigned[1], BaseException):
+                raise presigned[1]
+            result: dict[str, Any] = presigned[1]
+            return result
+        result = self._wallet.call(self.request(requirements))
+        return result
+
+
+class RemoteWallet:
+    """Wallet adapter forwarding signing to a signer daemon.
+
+    Keys stay in the daemon; each payment costs one local IPC round trip.
+    Connections are pooled, so concurrent payments from several threads (or
+    tasks: async clients sign in worker threads) reach the daemon together
+    and are signed as a batch.  Safe to use across ``fork``: a child process
+    opens its own connections.
+
+    Parameters
+    ----------
+    path:
+        Unix socket of the daemon (``python -m x402_openai.signer``).
+    timeout:
+        Seconds to wait for the daemon per payment (default ``10``).
+
+    Examples
+    --------
+    ::
+
+        client = X402OpenAI(wallet=RemoteWallet("/run/x402/signer.sock"))
+    """
+
+    def __init__(self, path: str | os.PathLike[str], *, timeout: float = 10.0) -> None:
+        self._path = os.fspath(path)
+        self._timeout = timeout
+        self._idle: list[socket.socket] = []
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def __repr__(self) -> str:
+        return f"RemoteWallet({self._path!r})"
+
+    def register(self, client: Any) -> None:
+        """Register a forwarding scheme for every scheme the daemon signs."""
+        schemes: _Schemes = {1: {}, 2: {}}
+        for entry in self.call({"op": "schemes"}):
+            version = 1 if entry["version"] == 1 else 2
+            scheme = _RemoteScheme(self, entry["version"], entry["scheme"])
+            if version == 1:
+                client.register_v1(entry["network"], scheme)
+            else:
+                client.register(entry["network"], scheme)
+            schemes[version].setdefault(entry["network"], {})[scheme.scheme] = scheme
+        if _awaits_hooks(client):
+            client.on_before_payment_creation(functools.partial(self._presign, schemes))
+        logger.debug("x402 remote wallet: %s", self._path)
+
+    def call(self, request: dict[str, Any]) -> Any:
+        """Send *request* to the daemon and return its result.
+
+        Raises ``RuntimeError`` with the daemon's message if it failed.
+        """
+        sock = self._checkout()
+        try:
+            sock.sendall(encode_frame(request))
+            (size,) = FRAME.unpack(_receive(sock, FRAME.size))
+            if size > MAX_FRAME:
+                raise ConnectionError(f"signer daemon sent a {size}-byte frame")
+            answer = json.loads(_receive(sock, size))
+        except BaseException:
+            sock.close()
+            raise
+        self._checkin(sock)
+        if "error" in answer:
+            raise RuntimeError(f"signer daemon: {answer['error']}")
+        return answer["result"]
+
+    async def _presign(self, schemes: _Schemes, context: Any) -> None:
+        """Before-payment hook of async clients: sign in a worker thread."""
+        from x402 import find_schemes_by_network
+
+        requirements = context.selected_requirements
+        version = 1 if context.payment_required.x402_version == 1 else 2
+        by_scheme = find_schemes_by_network(schemes[version], requirements.network)
+        scheme = by_scheme.get(requirements.scheme) if by_scheme else None
+        if scheme is None:
+            return  # Paid by another wallet.
+        try:
+            result = await asyncio.to_thread(self.call, scheme.request(requirements))
+        except Exception as exc:
+            # Raised by the scheme client, where x402's failure hooks see it.
+            result = exc
+        _presigned.set((requirements, result))
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for sock in idle:
+            sock.close()
+
+    def _checkout(self) -> socket.socket:
+        with self._lock:
+            if self._pid != os.getpid():
+                # Forked: the pooled sockets belong to the parent.
+                self._idle, self._pid = [], os.getpid()
+            if self._idle:
+                return self._idle.pop()
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self._timeout)
+        try:
+            sock.connect(self._path)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    def _checkin(self, sock: socket.socket) -> None:
+        with self._lock:
+            if self._pid == os.getpid():
+                self._idle.append(sock)
+                return
+        sock.close()
+
+
+def _awaits_hooks(client: Any) -> bool:
+    """Return True if *client* is an async x402 client (or stands in for one)."""
+    if getattr(client, "awaits_hooks", False):
+        return True
+    return inspect.iscoroutinefunction(getattr(client, "create_payment_payload", None))
@@ -0,0 +1,263 @@
+"""Pooled, shareable Solana JSON-RPC clients for SVM payments.
+
+By default every ``x402`` SVM scheme instance creates its own ``solana``
+``Client`` (and with it its own ``httpx`` connection pool) per network, so a
+process with hundreds of :class:`~x402_openai.wallets.SvmWallet` instances
+holds hundreds of idle connections and repeats the same lookups.
+
+A :class:`SolanaRpcPool` hands out one :class:`SolanaRpc` per endpoint for
+all wallets that share it:
+
+- one keep-alive ``httpx`` connection pool per endpoint;
+- token mint accounts (owner program and decimals never change) are
+  cached after the first ``getAccountInfo``;
+- with ``batch_window > 0``, calls issued concurrently from several threads
+  within the window are sent as one JSON-RPC batch request.
+
+Imports ``solana`` at module level, so import this module lazily.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, get_args
+
+import httpx
+from solana.exceptions import SolanaRpcException
+from solana.rpc.api import Client
+from solana.rpc.core import RPCException
+from solana.rpc.providers.http import HTTPProvider
+from solders.rpc.responses import RPCError
+
+# Owners of SPL token mint accounts.
+_TOKEN_PROGRAMS = frozenset(
+    {
+        "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA",
+        "TokenzQdBNbLqP5VEhdkAS6EPFLC1PQnBqKtxZ8hLsXf",
+    }
+)
+
+# SPL mint layout: 82 bytes; Token-2022 mints with extensions store the
+# account type (1 = mint) right after the 165-byte base account.
+_MINT_SIZE = 82
+_ACCOUNT_TYPE_OFFSET = 165
+_ACCOUNT_TYPE_MINT = 1
+
+_RPC_ERRORS = get_args(RPCError)
+
+
+def _is_mint(account: Any) -> bool:
+    if account is None or str(account.owner) not in _TOKEN_PROGRAMS:
+        return False
+    data = bytes(account.data)
+    if len(data) == _MINT_SIZE:
+        return True
+    return len(data) > _ACCOUNT_TYPE_OFFSET and data[_ACCOUNT_TYPE_OFFSET] == _ACCOUNT_TYPE_MINT
+
+
+class _Call:
+    """One JSON-RPC call waiting in a batch."""
+
+    __slots__ = ("body", "done", "error", "parser", "result")
+
+    def __init__(self, body: Any, parser: Any) -> None:
+        self.body = body
+        self.parser = parser
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class _PooledProvider(HTTPProvider):
+    """HTTP provider with bounded keep-alive pooling and optional batching."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        *,
+        timeout: float,
+        max_connections: int,
+        batch_window: float,
+    ) -> None:
+        super().__init__(endpoint, timeout=timeout)
+        self.session.close()
+        self.session = httpx.Client(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+        self._batch_window = batch_window
+        self._lock = threading.Lock()
+        self._pending: list[_Call] = []
+
+    def make_request(self, body: Any, parser: Any) -> Any:
+        if self._batch_window <= 0:
+            return super().make_request(body, parser)
+
+        call = _Call(body, parser)
+        with self._lock:
+            self._pending.append(call)
+            leader = len(self._pending) == 1
+        if leader:
+            # The first caller waits for companions, then sends for everyone.
+            time.sleep(self._batch_window)
+            with self._lock:
+                calls, self._pending = self._pending, []
+            self._send(calls)
+        call.done.wait()
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def _send(self, calls: list[_Call]) -> None:
+        try:
+            if len(calls) == 1:
+                calls[0].result = super().make_request(calls[0].body, calls[0].parser)
+                return
+            results = self.make_batch_request(
+                tuple(c.body for c in calls), tuple(c.parser for c in calls)
+            )
+            for call, result in zip(calls, results, strict=True):
+                if isinstance(result, _RPC_ERRORS):
+                    call.error = RPCException(result)
+                else:
+                    call.result = result
+        except httpx.HTTPError as exc:
+            # Same wrapping the provider applies to unbatched requests.
+            error = SolanaRpcException(exc, self._send, self, calls[0].body)
+            error.__cause__ = exc
+            for call in calls:
+                call.error = error
+        except Exception as exc:
+            for call in calls:
+                call.error = exc
+        finally:
+            for call in calls:
+                call.done.set()
+
+
+class SolanaRpc(Client):
+    """``solana`` ``Client`` with pooled connections and mint caching.
+
+    Obtain instances from :meth:`SolanaRpcPool.client` rather than
+    constructing them directly.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        *,
+        timeout: float = 10.0,
+        max_connections: int = 32,
+        batch_window: float = 0.0,
+    ) -> None:
+        super().__init__(endpoint, timeout=timeout)
+        # Client builds a provider of its own; release its connection pool.
+        self._provider.session.close()
+        self._provider = _PooledProvider(
+            endpoint,
+            timeout=timeout,
+            max_connections=max_connections,
+            batch_window=batch_window,
+        )
+        self._mints: dict[tuple[str, str], Any] = {}
+
+    def get_account_info(
+        self,
+        pubkey: Any,
+        commitment: Any = None,
+        encoding: str = "base64",
+        data_slice: Any = None,
+    ) -> Any:
+        """``getAccountInfo``; token mint accounts are answered from cache."""
+        key = (str(pubkey), encoding)
+        if data_slice is None:
+            cached = self._mints.get(key)
+            if cached is not None:
+                return cached
+        response = super().get_account_info(pubkey, commitment, encoding, data_slice)
+        if data_slice is None and _is_mint(response.value):
+            self._mints[key] = response
+        return response
+
+    def close(self) -> None:
+        """Close the underlying connection pool."""
+        self._provider.session.close()
+
+
+class SolanaRpcPool:
+    """Registry of :class:`SolanaRpc` clients, one per endpoint.
+
+    Parameters
+    ----------
+    timeout:
+        Per-request timeout in seconds (default ``10``).
+    max_connections:
+        Keep-alive connections per endpoint (default ``32``).
+    batch_window:
+        Seconds to collect concurrent calls into one JSON-RPC batch request;
+        ``0`` (default) sends every call on its own.
+
+    Examples
+    --------
+    ::
+
+        pool = SolanaRpcPool.shared()
+        wallets = [SvmWallet(private_key=k, rpc_pool=pool) for k in keys]
+    """
+
+    __slots__ = ("_batch_window", "_clients", "_lock", "_max_connections", "_timeout")
+
+    _shared: SolanaRpcPool | None = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        *,
+        timeout: float = 10.0,
+        max_connections: int = 32,
+        batch_window: float = 0.0,
+    ) -> None:
+        if max_connections < 1:
+            raise ValueError("'max_connections' must be at least 1.")
+        if batch_window < 0:
+            raise ValueError("'batch_window' must not be negative.")
+        self._timeout = timeout
+        self._max_connections = max_connections
+        self._batch_window = batch_window
+        self._clients: dict[str, SolanaRpc] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> SolanaRpcPool:
+        """Return the process-wide pool, creating it with defaults on first use."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def client(self, endpoint: str) -> SolanaRpc:
+        """Return the client for *endpoint*, creating it on first use."""
+        rpc = self._clients.get(endpoint)
+        if rpc is None:
+            with self._lock:
+                rpc = self._clients.get(endpoint)
+                if rpc is None:
+                    rpc = SolanaRpc(
+                        endpoint,
+                        timeout=self._timeout,
+                        max_connections=self._max_connections,
+                        batch_window=self._batch_window,
+                    )
+                    self._clients[endpoint] = rpc
+        return rpc
+
+    def close(self) -> None:
+        """Close every client in the pool."""
+        with self._lock:
+            clients, self._clients = list(self._clients.values()), {}
+        for rpc in clients:
+            rpc.close()
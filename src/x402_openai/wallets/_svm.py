@@ -4,6 +4,11 @@ Supports a single credential source:
 
 - Base58-encoded private key (Solana keypair secret).
 
+An optional :class:`~x402_openai.wallets.BlockhashProvider` takes the
+``getLatestBlockhash`` round trip off the payment path, and an optional
+:class:`~x402_openai.wallets.SolanaRpcPool` shares RPC connections and mint
+lookups between wallets.
+
 All heavy dependencies (``solders``, ``x402.mechanisms.svm``) are imported
 lazily so that users who only need EVM do not pay the import cost.
 """
@@ -11,7 +16,12 @@ lazily so that users who only need EVM do not pay the import cost.
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from x402_openai.wallets._balance import BalanceMonitor
+    from x402_openai.wallets._blockhash import BlockhashProvider
+    from x402_openai.wallets._solana_rpc import SolanaRpcPool
 
 logger = logging.getLogger(__name__)
 
@@ -23,20 +33,47 @@ class SvmWallet:
     ----------
     private_key:
         Base58-encoded Solana keypair secret key.
+    rpc_url:
+        Custom Solana RPC endpoint.  Defaults to the public endpoint of the
+        network named in the payment requirements.
+    blockhash_provider:
+        Optional :class:`~x402_openai.wallets.BlockhashProvider` serving
+        recent blockhashes from a background-refreshed cache.
+    rpc_pool:
+        Optional :class:`~x402_openai.wallets.SolanaRpcPool` whose pooled,
+        mint-caching clients are used instead of a private client per
+        network.  Pass :meth:`SolanaRpcPool.shared` to share one process-wide.
+    balance_monitor:
+        Optional :class:`~x402_openai.wallets.BalanceMonitor`; payments this
+        wallet's token balance cannot cover are skipped before signing.
 
     Examples
     --------
     ::
 
         wallet = SvmWallet(private_key="base58…")
+        wallet = SvmWallet(private_key="base58…", blockhash_provider=BlockhashProvider())
+        wallet = SvmWallet(private_key="base58…", rpc_pool=SolanaRpcPool.shared())
     """
 
-    __slots__ = ("_private_key",)
-
-    def __init__(self, *, private_key: str) -> None:
+    __slots__ = ("_balance_monitor", "_blockhashes", "_private_key", "_rpc_pool", "_rpc_url")
+
+    def __init__(
+        self,
+        *,
+        private_key: str,
+        rpc_url: str | None = None,
+        blockhash_provider: BlockhashProvider | None = None,
+        rpc_pool: SolanaRpcPool | None = None,
+        balance_monitor: BalanceMonitor | None = None,
+    ) -> None:
         if not private_key:
             raise ValueError("SvmWallet requires a non-empty 'private_key'.")
         self._private_key = private_key
+        self._rpc_url = rpc_url
+        self._blockhashes = blockhash_provider
+        self._rpc_pool = rpc_pool
+        self._balance_monitor = balance_monitor
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}(private_key='***')"
@@ -45,9 +82,18 @@ class SvmWallet:
         """Register the SVM exact payment scheme on *client*."""
         from solders.keypair import Keypair
         from x402.mechanisms.svm import KeypairSigner
-        from x402.mechanisms.svm.exact.register import register_exact_svm_client
+
+        from x402_openai.wallets._svm_schemes import register_svm_schemes
 
         keypair = Keypair.from_base58_string(self._private_key)
         signer = KeypairSigner(keypair)
-        register_exact_svm_client(client, signer)
+        register_svm_schemes(
+            client,
+            signer,
+            rpc_url=self._rpc_url,
+            blockhashes=self._blockhashes,
+            rpc_pool=self._rpc_pool,
+        )
+        if self._balance_monitor is not None:
+            self._balance_monitor.watch(client, "solana", str(keypair.pubkey()))
         logger.debug("x402 svm wallet: %s", keypair.pubkey())
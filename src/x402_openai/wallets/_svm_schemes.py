@@ -0,0 +1,133 @@
+"""``x402`` SVM exact schemes: thread-safe, with shared RPC clients and blockhashes.
+
+The upstream schemes build a private Solana RPC client per network in
+``_get_client(network)`` and call ``get_account_info`` and
+``get_latest_blockhash`` on it while building each payment.  The subclasses
+here instead return:
+
+- the endpoint's client from a :class:`~x402_openai.wallets.SolanaRpcPool`,
+  when one is given, so many wallets share one connection pool and mint
+  cache;
+- otherwise the upstream per-network client, created under a lock;
+- wrapped in a thin proxy whose ``get_latest_blockhash`` is answered by a
+  :class:`~x402_openai.wallets.BlockhashProvider`, when one is given.
+
+Imports ``x402.mechanisms.svm`` at module level, so import this module
+lazily.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any
+
+from x402.mechanisms.svm.constants import NETWORK_CONFIGS, V1_NETWORKS
+from x402.mechanisms.svm.exact.client import ExactSvmScheme
+from x402.mechanisms.svm.exact.v1.client import ExactSvmSchemeV1
+from x402.mechanisms.svm.utils import normalize_network
+
+if TYPE_CHECKING:
+    from x402_openai.wallets._blockhash import BlockhashProvider
+    from x402_openai.wallets._solana_rpc import SolanaRpcPool
+
+
+def rpc_endpoint(network: str, rpc_url: str | None) -> str:
+    """Return the RPC endpoint the schemes use for *network*."""
+    if rpc_url:
+        return rpc_url
+    config = NETWORK_CONFIGS.get(normalize_network(network))
+    if not config:
+        raise ValueError(f"Unsupported network: {network}")
+    return config["rpc_url"]
+
+
+class _PrefetchingClient:
+    """Proxy a Solana RPC client, serving blockhashes from a provider."""
+
+    __slots__ = ("_blockhashes", "_client", "_endpoint")
+
+    def __init__(self, client: Any, blockhashes: BlockhashProvider, endpoint: str) -> None:
+        self._client = client
+        self._blockhashes = blockhashes
+        self._endpoint = endpoint
+
+    def get_latest_blockhash(self, commitment: Any = None) -> Any:
+        if commitment is not None:
+            return self._client.get_latest_blockhash(commitment)
+        return self._blockhashes.latest(self._endpoint)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+
+def _client_for(scheme: Any, network: str) -> Any:
+    endpoint = rpc_endpoint(network, scheme._custom_rpc_url)
+    if scheme._rpc_pool is not None:
+        client = scheme._rpc_pool.client(endpoint)
+    else:
+        # The upstream get-or-create is unsynchronised; without the GIL two
+        # first payments could each build (and leak) a client.
+        with scheme._client_lock:
+            client = scheme._upstream_client(network)
+    if scheme._blockhashes is not None:
+        client = _PrefetchingClient(client, scheme._blockhashes, endpoint)
+    return client
+
+
+class SvmScheme(ExactSvmScheme):
+    """V2 exact scheme using a shared RPC pool and/or blockhash provider."""
+
+    def __init__(
+        self,
+        signer: Any,
+        rpc_url: str | None,
+        blockhashes: BlockhashProvider | None = None,
+        rpc_pool: SolanaRpcPool | None = None,
+    ) -> None:
+        super().__init__(signer, rpc_url)
+        self._blockhashes = blockhashes
+        self._rpc_pool = rpc_pool
+        self._client_lock = threading.Lock()
+
+    def _upstream_client(self, network: str) -> Any:
+        return super()._get_client(network)
+
+    def _get_client(self, network: str) -> Any:
+        return _client_for(self, network)
+
+
+class SvmSchemeV1(ExactSvmSchemeV1):
+    """V1 exact scheme using a shared RPC pool and/or blockhash provider."""
+
+    def __init__(
+        self,
+        signer: Any,
+        rpc_url: str | None,
+        blockhashes: BlockhashProvider | None = None,
+        rpc_pool: SolanaRpcPool | None = None,
+    ) -> None:
+        super().__init__(signer, rpc_url)
+        self._blockhashes = blockhashes
+        self._rpc_pool = rpc_pool
+        self._client_lock = threading.Lock()
+
+    def _upstream_client(self, network: str) -> Any:
+        return super()._get_client(network)
+
+    def _get_client(self, network: str) -> Any:
+        return _client_for(self, network)
+
+
+def register_svm_schemes(
+    client: Any,
+    signer: Any,
+    *,
+    rpc_url: str | None = None,
+    blockhashes: BlockhashProvider | None = None,
+    rpc_pool: SolanaRpcPool | None = None,
+) -> None:
+    """Register the schemes like ``register_exact_svm_client`` does."""
+    client.register("solana:*", SvmScheme(signer, rpc_url, blockhashes, rpc_pool))
+    v1_scheme = SvmSchemeV1(signer, rpc_url, blockhashes, rpc_pool)
+    for network in V1_NETWORKS:
+        client.register_v1(network, v1_scheme)
@@ -0,0 +1,248 @@
+"""Shared test doubles for the x402 client and upstream gateways."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator
+
+SSE_CHUNKS = [b"data: {}\n\n", b"data: [DONE]\n\n"]
+
+
+class UnusedX402Client:
+    """An x402 client for tests in which no 402 is ever returned."""
+
+    def handle_402_response(
+        self,
+        headers: dict[str, str],
+        body: bytes,
+    ) -> tuple[dict[str, str], dict[str, str]]:
+        raise AssertionError("no 402 expected")
+
+
+def evm_payload(valid_for: float) -> Any:
+    """Return a stand-in EVM payment payload valid for *valid_for* seconds."""
+    valid_before = str(int(time.time() + valid_for))
+    return SimpleNamespace(payload={"authorization": {"validBefore": valid_before}})
+
+
+class CountingX402ClientSync:
+    """Sign every challenge with ``x-payment: signed`` and count calls."""
+
+    def __init__(self, payload: Any = None) -> None:
+        self.calls = 0
+        self.payload = payload if payload is not None else {}
+        self._lock = threading.Lock()
+
+    def handle_402_response(
+        self,
+        headers: dict[str, str],
+        body: bytes,
+    ) -> tuple[dict[str, str], Any]:
+        with self._lock:
+            self.calls += 1
+        return {"x-payment": "signed"}, self.payload
+
+
+class CountingX402ClientAsync:
+    """Async counterpart of :class:`CountingX402ClientSync`."""
+
+    def __init__(self, payload: Any = None) -> None:
+        self.calls = 0
+        self.payload = payload if payload is not None else {}
+
+    async def handle_402_response(
+        self,
+        headers: dict[str, str],
+        body: bytes,
+    ) -> tuple[dict[str, str], Any]:
+        self.calls += 1
+        return {"x-payment": "signed"}, self.payload
+
+
+def _sse_stream() -> Iterator[bytes]:
+    yield from SSE_CHUNKS
+
+
+async def _sse_astream() -> AsyncIterator[bytes]:
+    for chunk in SSE_CHUNKS:
+        yield chunk
+
+
+class PaywallTransport(httpx.BaseTransport):
+    """Answer 402 without an ``x-payment`` header and 200 with one.
+
+    Parameters
+    ----------
+    delay:
+        Seconds to sleep before answering.
+    fail:
+        Raise ``httpx.ConnectError`` instead of answering.
+    stream:
+        Return the paid body as an unread SSE stream instead of JSON.
+    """
+
+    def __init__(self, *, delay: float = 0.0, fail: bool = False, stream: bool = False) -> None:
+        self.calls = 0
+        self.delay = delay
+        self.fail = fail
+        self.stream = stream
+        self._lock = threading.Lock()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            self.calls += 1
+        if self.delay:
+            time.sleep(self.delay)
+        if self.fail:
+            raise httpx.ConnectError("boom")
+        if "x-payment" not in request.headers:
+            return httpx.Response(402, content=b"challenge")
+        if not self.stream:
+            return httpx.Response(200, json={"ok": True})
+        return httpx.Response(
+            200, headers={"content-type": "text/event-stream"}, content=_sse_stream()
+        )
+
+
+class PaywallAsyncTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of :class:`PaywallTransport`."""
+
+    def __init__(self, *, delay: float = 0.0, stream: bool = False) -> None:
+        self.calls = 0
+        self.delay = delay
+        self.stream = stream
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if "x-payment" not in request.headers:
+            return httpx.Response(402, content=b"challenge")
+        if not self.stream:
+            return httpx.Response(200, json={"ok": True})
+        return httpx.Response(
+            200, headers={"content-type": "text/event-stream"}, content=_sse_astream()
+        )
+
+
+class StandInSolanaRpc:
+    """Local JSON-RPC server answering the calls SVM payments make.
+
+    ``getLatestBlockhash`` returns a new blockhash on every call and
+    ``getAccountInfo`` describes an SPL token mint with 6 decimals.  Batched
+    requests are supported.  Use as a context manager; :attr:`url` is the
+    endpoint and :attr:`calls` lists the methods received.
+    """
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.requests = 0
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def __enter__(self) -> StandInSolanaRpc:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def count(self, method: str) -> int:
+        return self.calls.count(method)
+
+    def _answer(self, call: dict[str, Any]) -> dict[str, Any]:
+        from solders.hash import Hash
+
+        method = call["method"]
+        self.calls.append(method)
+        context = {"slot": len(self.calls), "apiVersion": "2.0.0"}
+        if method == "getLatestBlockhash":
+            value: Any = {"blockhash": str(Hash.new_unique()), "lastValidBlockHeight": 1000}
+        elif method == "getAccountInfo":
+            mint = bytearray(82)
+            mint[44] = 6
+            mint[45] = 1
+            value = {
+                "data": [base64.b64encode(bytes(mint)).decode(), "base64"],
+                "executable": False,
+                "lamports": 1_461_600,
+                "owner": "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA",
+                "rentEpoch": 0,
+                "space": 82,
+            }
+        else:
+            return {
+                "jsonrpc": "2.0",
+                "id": call["id"],
+                "error": {"code": -32601, "message": method},
+            }
+        return {"jsonrpc": "2.0", "id": call["id"], "result": {"context": context, "value": value}}
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        rpc = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self) -> None:
+                body = json.loads(self.rfile.read(int(self.headers["content-length"])))
+                rpc.requests += 1
+                if isinstance(body, list):
+                    answer: Any = [rpc._answer(call) for call in body]
+                else:
+                    answer = rpc._answer(body)
+                data = json.dumps(answer).encode()
+                self.send_response(200)
+                self.send_header("content-type", "application/json")
+                self.send_header("content-length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        return Handler
+
+
+class StandInBalanceRpc(StandInSolanaRpc):
+    """JSON-RPC server reporting a token balance of :attr:`balance` atomic units.
+
+    Answers ERC-20 ``balanceOf`` through ``eth_call`` and Solana
+    ``getTokenAccountsByOwner`` (split across two token accounts).
+    """
+
+    def __init__(self, balance: int) -> None:
+        super().__init__()
+        self.balance = balance
+
+    def _answer(self, call: dict[str, Any]) -> dict[str, Any]:
+        method = call["method"]
+        if method == "eth_call":
+            self.calls.append(method)
+            return {"jsonrpc": "2.0", "id": call["id"], "result": hex(self.balance)}
+        if method != "getTokenAccountsByOwner":
+            return super()._answer(call)
+        self.calls.append(method)
+        half = self.balance // 2
+        accounts = [
+            {"account": {"data": {"parsed": {"info": {"tokenAmount": {"amount": str(amount)}}}}}}
+            for amount in (half, self.balance - half)
+        ]
+        return {
+            "jsonrpc": "2.0",
+            "id": call["id"],
+            "result": {"context": {"slot": 1}, "value": accounts},
+        }
@@ -0,0 +1,160 @@
+"""Unit tests for the cached wallet balance pre-check (_balance.py)."""
+
+from __future__ import annotations
+
+import os
+from typing import Any
+
+import httpx
+import pytest
+
+pytest.importorskip("eth_account")
+
+from eth_account import Account
+from x402 import x402ClientSync
+from x402.http.utils import encode_payment_required_header
+from x402.schemas import NoMatchingRequirementsError, PaymentRequired, PaymentRequirements
+
+from tests._fakes import StandInBalanceRpc
+from x402_openai._transport import X402Transport
+from x402_openai._wallet import create_x402_http_client
+from x402_openai.wallets import BalanceMonitor, EvmWallet
+
+_BASE = "eip155:8453"
+_USDC = "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913"
+_SOLANA = "solana:EtWTRABZaYq6iMfeYKouRu166VU2xqa1"
+
+
+def _required(amount: int, network: str = _BASE, asset: str = _USDC) -> PaymentRequired:
+    return PaymentRequired(
+        accepts=[
+            PaymentRequirements(
+                scheme="exact",
+                network=network,
+                asset=asset,
+                amount=str(amount),
+                pay_to="0x" + os.urandom(20).hex(),
+                max_timeout_seconds=300,
+                extra={"name": "USD Coin", "version": "2"},
+            )
+        ]
+    )
+
+
+def _client(monitor: BalanceMonitor, address: list[str] | None = None) -> x402ClientSync:
+    account = Account.create()
+    client = x402ClientSync()
+    EvmWallet(private_key=account.key.hex(), balance_monitor=monitor).register(client)
+    if address is not None:
+        address.append(account.address)
+    return client
+
+
+class _PolicyClient:
+    """Keeps the policy a monitor registers so tests can call it directly."""
+
+    def __init__(self) -> None:
+        self.policies: list[Any] = []
+
+    def register_policy(self, policy: Any) -> None:
+        self.policies.append(policy)
+
+    def on_after_payment_creation(self, hook: Any) -> None:
+        pass
+
+
+class TestBalanceMonitor:
+    """Verify polling, pending spend and skipping unaffordable payments."""
+
+    def test_skips_payments_the_balance_cannot_cover(self) -> None:
+        with StandInBalanceRpc(balance=2500) as rpc:
+            monitor = BalanceMonitor(rpc_urls={_BASE: rpc.url}, interval=60)
+            address: list[str] = []
+            client = _client(monitor, address)
+
+            client.create_payment_payload(_required(1000))  # Balance not known yet.
+            monitor.refresh()
+            assert monitor.available(address[0], _BASE, _USDC) == 1500
+
+            client.create_payment_payload(_required(1000))
+            with pytest.raises(NoMatchingRequirementsError):
+                client.create_payment_payload(_required(1000))
+            monitor.close()
+
+        assert rpc.count("eth_call") >= 1
+
+    def test_settled_payments_leave_the_pending_spend(self) -> None:
+        with StandInBalanceRpc(balance=2500) as rpc:
+            monitor = BalanceMonitor(rpc_urls={_BASE: rpc.url}, interval=60, settle_time=0)
+            address: list[str] = []
+            client = _client(monitor, address)
+
+            client.create_payment_payload(_required(1000))
+            rpc.balance = 1500
+            monitor.refresh()
+            monitor.close()
+
+        assert monitor.available(address[0], _BASE, _USDC) == 1500
+
+    def test_wallets_of_one_family_are_checked_separately(self) -> None:
+        with StandInBalanceRpc(balance=2500) as rpc:
+            monitor = BalanceMonitor(rpc_urls={_BASE: rpc.url}, interval=60)
+            addresses: list[str] = []
+            first = _client(monitor, addresses)
+            second = _client(monitor, addresses)
+
+            first.create_payment_payload(_required(1000))
+            second.create_payment_payload(_required(1000))
+            monitor.refresh()
+            first.create_payment_payload(_required(1000))
+            with pytest.raises(NoMatchingRequirementsError):
+                first.create_payment_payload(_required(1000))
+            second.create_payment_payload(_required(1000))
+            monitor.close()
+
+        assert [monitor.available(a, _BASE, _USDC) for a in addresses] == [500, 500]
+
+    def test_networks_without_rpc_are_not_checked(self) -> None:
+        monitor = BalanceMonitor(rpc_urls={})
+        address: list[str] = []
+        client = _client(monitor, address)
+
+        client.create_payment_payload(_required(10**30))
+
+        assert monitor.available(address[0], _BASE, _USDC) is None
+        monitor.close()
+
+    def test_reads_solana_token_accounts(self) -> None:
+        with StandInBalanceRpc(balance=777) as rpc:
+            monitor = BalanceMonitor(rpc_urls={_SOLANA: rpc.url}, interval=60)
+            client = _PolicyClient()
+            monitor.watch(client, "solana", "owner")
+            client.policies[0](2, _required(1, network=_SOLANA, asset="mint").accepts)
+            monitor.refresh()
+            monitor.close()
+
+        assert monitor.available("owner", _SOLANA, "mint") == 777
+
+    def test_transport_returns_402_without_signing(self) -> None:
+        challenge = encode_payment_required_header(_required(1000))
+        attempts: list[httpx.Request] = []
+
+        def gateway(request: httpx.Request) -> httpx.Response:
+            attempts.append(request)
+            return httpx.Response(402, headers={"payment-required": challenge})
+
+        with StandInBalanceRpc(balance=10) as rpc:
+            monitor = BalanceMonitor(rpc_urls={_BASE: rpc.url}, interval=60)
+            account = Account.create()
+            wallet = EvmWallet(private_key=account.key.hex(), balance_monitor=monitor)
+            x402_http: Any = create_x402_http_client(wallet=wallet)
+            probe = _PolicyClient()
+            monitor.watch(probe, "eip155", account.address)
+            probe.policies[0](2, _required(1000).accepts)  # Learn the asset.
+            monitor.refresh()
+            transport = X402Transport(x402_http, inner=httpx.MockTransport(gateway))
+            response = httpx.Client(transport=transport).post("https://gw.example/v1/x")
+            monitor.close()
+
+        assert response.status_code == 402
+        assert len(attempts) == 1
@@ -0,0 +1,130 @@
+"""Unit tests for batch payment signing (wallets/_batch.py, wallets/_evm_schemes.py)."""
+
+from __future__ import annotations
+
+import os
+from typing import Any
+
+import pytest
+
+pytest.importorskip("eth_account")
+
+from eth_account import Account
+from eth_account.messages import encode_typed_data
+from x402.mechanisms.evm.types import ExactEIP3009Payload
+from x402.schemas import PaymentRequirements
+
+from x402_openai.wallets import BatchSigner, EvmWallet
+from x402_openai.wallets._evm_schemes import EvmScheme
+from x402_openai.wallets._evm_signers import create_signer
+
+_USDC_BASE = "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913"
+
+
+def _requirements(network: str = "eip155:8453") -> PaymentRequirements:
+    return PaymentRequirements(
+        scheme="exact",
+        network=network,
+        asset=_USDC_BASE,
+        amount="1000",
+        pay_to="0x" + os.urandom(20).hex(),
+        max_timeout_seconds=300,
+        extra={"name": "USD Coin", "version": "2"},
+    )
+
+
+def _recover(payload: dict[str, Any]) -> str:
+    authorization = payload["authorization"]
+    signable = encode_typed_data(
+        domain_data={
+            "name": "USD Coin",
+            "version": "2",
+            "chainId": 8453,
+            "verifyingContract": _USDC_BASE,
+        },
+        message_types={
+            "TransferWithAuthorization": [
+                {"name": "from", "type": "address"},
+                {"name": "to", "type": "address"},
+                {"name": "value", "type": "uint256"},
+                {"name": "validAfter", "type": "uint256"},
+                {"name": "validBefore", "type": "uint256"},
+                {"name": "nonce", "type": "bytes32"},
+            ]
+        },
+        message_data={
+            "from": authorization["from"],
+            "to": authorization["to"],
+            "value": int(authorization["value"]),
+            "validAfter": int(authorization["validAfter"]),
+            "validBefore": int(authorization["validBefore"]),
+            "nonce": bytes.fromhex(authorization["nonce"][2:]),
+        },
+    )
+    return str(Account.recover_message(signable, signature=payload["signature"]))
+
+
+class _LoopScheme:
+    scheme = "exact"
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def create_payment_payload(self, requirements: Any) -> dict[str, Any]:
+        self.calls += 1
+        return {"call": self.calls}
+
+
+class _LoopWallet:
+    def __init__(self, scheme: _LoopScheme) -> None:
+        self.scheme = scheme
+
+    def register(self, client: Any) -> None:
+        client.register("solana:*", self.scheme)
+
+
+class TestBatchSigning:
+    """Verify that batches hold independent, valid payments."""
+
+    @pytest.mark.parametrize("backend", ["coincurve", "eth_account"])
+    def test_batch_payloads_are_signed_by_the_wallet(self, backend: str) -> None:
+        if backend == "coincurve":
+            pytest.importorskip("coincurve")
+        account = Account.create()
+        signer = BatchSigner([EvmWallet(private_key=account.key.hex(), signer_backend=backend)])
+
+        payloads = signer.sign(_requirements(), 16)
+
+        assert len({p["authorization"]["nonce"] for p in payloads}) == 16
+        assert all(_recover(p) == account.address for p in payloads)
+
+    def test_batch_matches_single_signatures(self) -> None:
+        pytest.importorskip("coincurve")
+        account = Account.create()
+        scheme = EvmScheme(create_signer(account, "coincurve"))
+        requirements = _requirements()
+
+        payloads = scheme.create_payment_payloads(requirements, 4)
+
+        single = EvmScheme(create_signer(account, "eth_account"))
+        for payload in payloads:
+            authorization = ExactEIP3009Payload.from_dict(payload).authorization
+            signature = single._sign_authorization(authorization, requirements)
+            assert signature == payload["signature"]
+
+    def test_schemes_without_batch_support_are_called_per_payment(self) -> None:
+        scheme = _LoopScheme()
+        signer = BatchSigner([_LoopWallet(scheme)])
+
+        payloads = signer.sign(_requirements("solana:mainnet").model_dump(by_alias=True), 3)
+
+        assert payloads == [{"call": 1}, {"call": 2}, {"call": 3}]
+        assert signer.describe() == [{"version": 2, "network": "solana:*", "scheme": "exact"}]
+
+    def test_uncovered_requirements_and_empty_batches_are_rejected(self) -> None:
+        signer = BatchSigner([EvmWallet(private_key=Account.create().key.hex())])
+
+        with pytest.raises(LookupError, match="no wallet for exact payments on solana"):
+            signer.sign(_requirements("solana:mainnet"))
+        with pytest.raises(ValueError, match="count"):
+            signer.sign(_requirements(), 0)
@@ -0,0 +1,162 @@
+"""Unit tests for cross-caller embedding micro-batching (_batching.py)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from tests._fakes import UnusedX402Client
+from x402_openai._batching import EmbeddingBatcher
+from x402_openai._transport import AsyncX402Transport
+
+_URL = "https://example.com/v1/embeddings"
+
+
+class _EmbeddingTransport(httpx.AsyncBaseTransport):
+    """Echo one embedding per input; the vector encodes the input text."""
+
+    def __init__(self, status_code: int = 200, *, drop: int = 0) -> None:
+        self.status_code = status_code
+        self.drop = drop
+        self.bodies: list[dict[str, object]] = []
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(await request.aread())
+        self.bodies.append(body)
+        if self.status_code != 200:
+            return httpx.Response(self.status_code, json={"error": "boom"})
+        inputs = body["input"] if isinstance(body["input"], list) else [body["input"]]
+        data = [
+            {"object": "embedding", "index": i, "embedding": [float(len(text))]}
+            for i, text in enumerate(inputs)
+        ]
+        data = data[: len(data) - self.drop]
+        return httpx.Response(200, json={"object": "list", "data": data, "model": body["model"]})
+
+
+def _embed(
+    text: str | list[str],
+    model: str = "m",
+    *,
+    headers: dict[str, str] | None = None,
+    extensions: dict[str, object] | None = None,
+) -> httpx.Request:
+    return httpx.Request(
+        "POST",
+        _URL,
+        json={"input": text, "model": model},
+        headers=headers,
+        extensions=extensions,
+    )
+
+
+def _transport(inner: httpx.AsyncBaseTransport, **kwargs: object) -> AsyncX402Transport:
+    batcher = EmbeddingBatcher(**kwargs)  # type: ignore[arg-type]
+    return AsyncX402Transport(UnusedX402Client(), inner=inner, embedding_batcher=batcher)
+
+
+class TestEmbeddingBatcher:
+    """Verify merging, splitting and pass-through behaviour."""
+
+    async def test_concurrent_calls_share_one_upstream_request(self) -> None:
+        inner = _EmbeddingTransport()
+        transport = _transport(inner, max_wait=0.05)
+
+        responses = await asyncio.gather(
+            transport.handle_async_request(_embed("a")),
+            transport.handle_async_request(_embed(["bb", "ccc"])),
+            transport.handle_async_request(_embed("dddd")),
+        )
+
+        assert len(inner.bodies) == 1
+        assert inner.bodies[0]["input"] == ["a", "bb", "ccc", "dddd"]
+        shares = [json.loads(await r.aread())["data"] for r in responses]
+        assert [[e["embedding"] for e in share] for share in shares] == [
+            [[1.0]],
+            [[2.0], [3.0]],
+            [[4.0]],
+        ]
+        assert [[e["index"] for e in share] for share in shares] == [[0], [0, 1], [0]]
+
+    async def test_different_models_are_not_merged(self) -> None:
+        inner = _EmbeddingTransport()
+        transport = _transport(inner, max_wait=0.01)
+
+        await asyncio.gather(
+            transport.handle_async_request(_embed("a", model="m1")),
+            transport.handle_async_request(_embed("b", model="m2")),
+        )
+
+        assert sorted(b["model"] for b in inner.bodies) == ["m1", "m2"]
+
+    async def test_different_callers_are_not_merged(self) -> None:
+        inner = _EmbeddingTransport()
+        transport = _transport(inner, max_wait=0.01)
+
+        await asyncio.gather(
+            transport.handle_async_request(_embed("a", headers={"Authorization": "Bearer a"})),
+            transport.handle_async_request(_embed("b", headers={"Authorization": "Bearer b"})),
+            transport.handle_async_request(_embed("c", extensions={"x402_wallet": "tenant-c"})),
+            transport.handle_async_request(_embed("d", extensions={"x402_wallet": "tenant-d"})),
+        )
+
+        assert sorted(b["input"] for b in inner.bodies) == ["a", "b", "c", "d"]
+
+    async def test_full_batch_flushes_without_waiting(self) -> None:
+        inner = _EmbeddingTransport()
+        transport = _transport(inner, max_batch_size=2, max_wait=60.0)
+
+        await asyncio.wait_for(
+            asyncio.gather(
+                transport.handle_async_request(_embed("a")),
+                transport.handle_async_request(_embed("b")),
+            ),
+            timeout=1.0,
+        )
+
+        assert inner.bodies == [{"input": ["a", "b"], "model": "m"}]
+
+    async def test_error_response_is_replicated_to_every_caller(self) -> None:
+        inner = _EmbeddingTransport(status_code=500)
+        transport = _transport(inner, max_wait=0.01)
+
+        responses = await asyncio.gather(
+            transport.handle_async_request(_embed("a")),
+            transport.handle_async_request(_embed("b")),
+        )
+
+        assert len(inner.bodies) == 1
+        assert [r.status_code for r in responses] == [500, 500]
+
+    async def test_short_upstream_data_fails_every_caller(self) -> None:
+        inner = _EmbeddingTransport(drop=1)
+        transport = _transport(inner, max_wait=0.01)
+
+        results = await asyncio.gather(
+            transport.handle_async_request(_embed("a")),
+            transport.handle_async_request(_embed("b")),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, httpx.DecodingError) for r in results)
+
+    async def test_non_embedding_requests_bypass_batcher(self) -> None:
+        inner = _EmbeddingTransport()
+        transport = _transport(inner)
+        request = httpx.Request(
+            "POST", "https://example.com/v1/chat/completions", json={"input": "a", "model": "m"}
+        )
+
+        response = await transport.handle_async_request(request)
+
+        assert response.status_code == 200
+        assert inner.bodies == [{"input": "a", "model": "m"}]
+
+    def test_rejects_invalid_limits(self) -> None:
+        with pytest.raises(ValueError, match="max_batch_size"):
+            EmbeddingBatcher(max_batch_size=0)
+        with pytest.raises(ValueError, match="max_wait"):
+            EmbeddingBatcher(max_wait=-1)
@@ -0,0 +1,116 @@
+"""Unit tests for SVM blockhash prefetching (_blockhash.py, _svm_schemes.py)."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("solana")
+
+from solders.keypair import Keypair
+from x402 import x402ClientSync
+from x402.mechanisms.svm import KeypairSigner
+from x402.schemas import PaymentRequirements
+
+from tests._fakes import StandInSolanaRpc
+from x402_openai.wallets import BlockhashProvider, SvmWallet
+from x402_openai.wallets._svm_schemes import SvmScheme
+
+
+def _requirements() -> PaymentRequirements:
+    return PaymentRequirements(
+        scheme="exact",
+        network="solana:EtWTRABZaYq6iMfeYKouRu166VU2xqa1",
+        asset=str(Keypair().pubkey()),
+        amount="1000",
+        pay_to=str(Keypair().pubkey()),
+        max_timeout_seconds=60,
+        extra={"feePayer": str(Keypair().pubkey())},
+    )
+
+
+class TestBlockhashProvider:
+    """Verify caching, background refresh and expiry."""
+
+    def test_second_read_is_served_from_cache(self) -> None:
+        with StandInSolanaRpc() as rpc:
+            provider = BlockhashProvider(refresh_interval=30, max_age=60)
+            first = provider.latest(rpc.url)
+            second = provider.latest(rpc.url)
+            provider.close()
+
+        assert first.value.blockhash == second.value.blockhash
+        assert rpc.count("getLatestBlockhash") == 1
+
+    def test_background_refresh_replaces_the_blockhash(self) -> None:
+        with StandInSolanaRpc() as rpc:
+            provider = BlockhashProvider(refresh_interval=0.05, max_age=60)
+            first = provider.latest(rpc.url)
+            time.sleep(0.3)
+            fetched = rpc.count("getLatestBlockhash")
+            latest = provider.latest(rpc.url)
+            provider.close()
+
+        assert fetched >= 2
+        assert rpc.count("getLatestBlockhash") == fetched
+        assert latest.value.blockhash != first.value.blockhash
+
+    def test_stale_blockhash_is_fetched_inline(self) -> None:
+        with StandInSolanaRpc() as rpc:
+            provider = BlockhashProvider(refresh_interval=0.01, max_age=0.02)
+            provider.latest(rpc.url)
+            provider.close()
+            time.sleep(0.05)
+            provider.latest(rpc.url)
+
+        assert rpc.count("getLatestBlockhash") >= 2
+
+    def test_rejects_max_age_below_refresh_interval(self) -> None:
+        with pytest.raises(ValueError, match="max_age"):
+            BlockhashProvider(refresh_interval=10, max_age=5)
+
+
+class TestPrefetchingScheme:
+    """Verify that payments no longer fetch the blockhash inline."""
+
+    def test_payments_reuse_the_prefetched_blockhash(self) -> None:
+        with StandInSolanaRpc() as rpc:
+            provider = BlockhashProvider(refresh_interval=30, max_age=60)
+            scheme = SvmScheme(KeypairSigner(Keypair()), rpc.url, provider)
+            for _ in range(3):
+                payload = scheme.create_payment_payload(_requirements())
+            provider.close()
+
+        assert payload["transaction"]
+        assert rpc.count("getLatestBlockhash") == 1
+
+    def test_wallet_registers_prefetching_schemes(self) -> None:
+        client = x402ClientSync()
+        wallet = SvmWallet(
+            private_key=str(Keypair()),
+            rpc_url="http://127.0.0.1:1",
+            blockhash_provider=BlockhashProvider(),
+        )
+
+        wallet.register(client)
+
+        assert isinstance(client._schemes["solana:*"]["exact"], SvmScheme)
+
+    def test_concurrent_first_payments_share_one_upstream_client(self) -> None:
+        scheme = SvmScheme(KeypairSigner(Keypair()), "http://127.0.0.1:1")
+        clients: list[object] = []
+        barrier = threading.Barrier(8)
+
+        def first_payment() -> None:
+            barrier.wait()
+            clients.append(scheme._get_client("solana:EtWTRABZaYq6iMfeYKouRu166VU2xqa1"))
+
+        threads = [threading.Thread(target=first_payment) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len({id(c) for c in clients}) == 1
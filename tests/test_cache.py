@@ -0,0 +1,222 @@
+"""Unit tests for the paid-response cache (_cache.py)."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+
+from tests._fakes import (
+    SSE_CHUNKS,
+    CountingX402ClientAsync,
+    CountingX402ClientSync,
+    PaywallAsyncTransport,
+    PaywallTransport,
+)
+from x402_openai._cache import (
+    CachedResponse,
+    DiskCache,
+    MemoryCache,
+    ResponseCache,
+    is_deterministic,
+    request_key,
+)
+from x402_openai._transport import AsyncX402Transport, X402Transport
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_URL = "https://example.com/v1/chat/completions"
+_DETERMINISTIC = {"model": "m", "messages": [{"role": "user", "content": "hi"}], "temperature": 0}
+
+
+class TestKeys:
+    """Verify canonical keys and the determinism check."""
+
+    def test_key_ignores_json_key_order_and_whitespace(self) -> None:
+        a = request_key("POST", _URL, b'{"a": 1, "b": 2}')
+        b = request_key("post", _URL, b'{"b":2,"a":1}')
+        assert a == b
+
+    def test_key_depends_on_url_and_body(self) -> None:
+        base = request_key("POST", _URL, b'{"a":1}')
+        assert base != request_key("POST", _URL + "x", b'{"a":1}')
+        assert base != request_key("POST", _URL, b'{"a":2}')
+
+    def test_generation_requires_zero_temperature(self) -> None:
+        path = "/v1/chat/completions"
+        assert is_deterministic(path, b'{"messages": [], "temperature": 0}')
+        assert not is_deterministic(path, b'{"messages": []}')
+        assert not is_deterministic(path, b'{"messages": [], "temperature": 0.7}')
+        assert not is_deterministic(path, b'{"messages": [], "temperature": 0, "n": 2}')
+        assert not is_deterministic("/v1/responses", b'{"input": "hi", "temperature": 1}')
+
+    def test_embeddings_are_deterministic(self) -> None:
+        assert is_deterministic("/v1/embeddings", b'{"input": "hi", "model": "m"}')
+        assert not is_deterministic("/v1/embeddings", b"not json")
+
+    def test_other_endpoints_are_never_cached(self) -> None:
+        assert not is_deterministic("/v1/batches", b'{"input_file_id": "f"}')
+        assert not is_deterministic("/v1/threads", b"{}")
+
+    def test_get_requires_opt_in(self) -> None:
+        request = httpx.Request("GET", "https://example.com/v1/batches/b1")
+
+        assert MemoryCache().key_for(request) is None
+        assert MemoryCache(cache_get=True).key_for(request) is not None
+
+
+class TestMemoryCache:
+    """Verify LRU, size and TTL behaviour."""
+
+    def test_lru_eviction_by_entry_count(self) -> None:
+        cache = MemoryCache(max_entries=2)
+        for key in ("a", "b"):
+            cache.set(key, CachedResponse(200, [], b"x"))
+        cache.get("a")
+        cache.set("c", CachedResponse(200, [], b"x"))
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert len(cache) == 2
+
+    def test_eviction_by_size(self) -> None:
+        cache = MemoryCache(max_bytes=10)
+        cache.set("a", CachedResponse(200, [], b"123456"))
+        cache.set("b", CachedResponse(200, [], b"123456"))
+
+        assert cache.get("a") is None
+        assert cache.get("b") is not None
+
+    def test_expired_entries_are_misses(self) -> None:
+        cache = MemoryCache(ttl=10)
+        cache.set("a", CachedResponse(200, [], b"x", stored_at=time.time() - 60))
+
+        assert cache.get("a") is None
+        assert cache.stats() == {"hits": 0, "misses": 1}
+        assert len(cache) == 0
+
+    def test_rejects_non_positive_ttl(self) -> None:
+        with pytest.raises(ValueError, match="ttl"):
+            MemoryCache(ttl=0)
+
+    def test_backend_without_delete_cannot_be_constructed(self) -> None:
+        class _NoDelete(ResponseCache):
+            def _load(self, key: str) -> CachedResponse | None:
+                return None
+
+            def _store(self, key: str, entry: CachedResponse) -> None:
+                pass
+
+        with pytest.raises(TypeError, match="_delete"):
+            _NoDelete(ttl=1)  # type: ignore[abstract]
+
+
+class TestDiskCache:
+    """Verify persistence and size-based eviction."""
+
+    def test_round_trip_across_instances(self, tmp_path: Path) -> None:
+        DiskCache(tmp_path).set("k", CachedResponse(201, [("x-a", "1")], b"body"))
+
+        entry = DiskCache(tmp_path).get("k")
+
+        assert entry is not None
+        assert entry.status_code == 201
+        assert entry.headers == [("x-a", "1")]
+        assert entry.content == b"body"
+
+    def test_eviction_keeps_total_under_limit(self, tmp_path: Path) -> None:
+        cache = DiskCache(tmp_path, max_bytes=300)
+        for i in range(5):
+            cache.set(f"k{i}", CachedResponse(200, [], b"x" * 100))
+
+        total = sum(p.stat().st_size for p in tmp_path.glob("*.entry"))
+        assert total <= 300
+        assert cache.get("k4") is not None
+
+    def test_overwriting_an_entry_keeps_size_exact(self, tmp_path: Path) -> None:
+        cache = DiskCache(tmp_path)
+        cache.set("k", CachedResponse(200, [], b"x" * 100))
+        cache.set("k", CachedResponse(200, [], b"x" * 50))
+
+        assert cache._size == (tmp_path / "k.entry").stat().st_size
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path: Path) -> None:
+        cache = DiskCache(tmp_path)
+        (tmp_path / "bad.entry").write_bytes(b"\xff\xff")
+
+        assert cache.get("bad") is None
+        assert not (tmp_path / "bad.entry").exists()
+
+    def test_entry_with_incomplete_metadata_is_a_miss(self, tmp_path: Path) -> None:
+        cache = DiskCache(tmp_path)
+        meta = b'{"headers": []}'
+        (tmp_path / "k.entry").write_bytes(len(meta).to_bytes(4, "big") + meta + b"body")
+
+        assert cache.get("k") is None
+
+    def test_expired_entry_is_deleted(self, tmp_path: Path) -> None:
+        cache = DiskCache(tmp_path, ttl=10)
+        cache.set("k", CachedResponse(200, [], b"x", stored_at=time.time() - 60))
+
+        assert cache.get("k") is None
+        assert not list(tmp_path.glob("*.entry"))
+
+
+class TestTransportCache:
+    """Verify that cache hits skip the network and the wallet."""
+
+    def test_sync_hit_skips_network_and_signing_and_replays_stream(self) -> None:
+        inner = PaywallTransport(stream=True)
+        x402 = CountingX402ClientSync()
+        cache = MemoryCache()
+        client = httpx.Client(transport=X402Transport(x402, inner=inner, cache=cache))
+
+        first = client.post(_URL, json=_DETERMINISTIC)
+        second = client.post(_URL, json=_DETERMINISTIC)
+
+        assert first.content == second.content == b"".join(SSE_CHUNKS)
+        assert second.headers["content-type"] == "text/event-stream"
+        assert inner.calls == 2
+        assert x402.calls == 1
+        assert cache.stats() == {"hits": 1, "misses": 1}
+
+    def test_sync_non_deterministic_requests_are_not_cached(self) -> None:
+        inner = PaywallTransport(stream=True)
+        x402 = CountingX402ClientSync()
+        cache = MemoryCache()
+        client = httpx.Client(transport=X402Transport(x402, inner=inner, cache=cache))
+        body = {**_DETERMINISTIC, "temperature": 1}
+
+        client.post(_URL, json=body)
+        client.post(_URL, json=body)
+
+        assert x402.calls == 2
+        assert len(cache) == 0
+
+    def test_sync_partially_read_stream_is_not_cached(self) -> None:
+        inner = PaywallTransport(stream=True)
+        cache = MemoryCache()
+        client = httpx.Client(
+            transport=X402Transport(CountingX402ClientSync(), inner=inner, cache=cache)
+        )
+
+        with client.stream("POST", _URL, json=_DETERMINISTIC) as response:
+            next(response.iter_raw())
+
+        assert len(cache) == 0
+
+    async def test_async_hit_skips_network_and_signing(self) -> None:
+        inner = PaywallAsyncTransport(stream=True)
+        x402 = CountingX402ClientAsync()
+        cache = MemoryCache()
+        client = httpx.AsyncClient(transport=AsyncX402Transport(x402, inner=inner, cache=cache))
+
+        first = await client.post(_URL, json=_DETERMINISTIC)
+        second = await client.post(_URL, json=_DETERMINISTIC)
+
+        assert first.content == second.content == b"".join(SSE_CHUNKS)
+        assert inner.calls == 2
+        assert x402.calls == 1
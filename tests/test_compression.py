@@ -0,0 +1,106 @@
+"""Unit tests for request body compression (_compression.py)."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+
+import httpx
+import pytest
+
+from tests._fakes import CountingX402ClientAsync, CountingX402ClientSync
+from x402_openai._compression import RequestCompressor
+from x402_openai._transport import AsyncX402Transport, X402Transport
+
+_URL = "https://example.com/v1/chat/completions"
+_BODY = {"model": "m", "messages": [{"role": "user", "content": "lorem ipsum " * 4096}]}
+
+
+class _EncodingGateway(httpx.BaseTransport):
+    """Paywall that records bodies on the wire and optionally rejects encodings."""
+
+    def __init__(self, *, accept: bool = True) -> None:
+        self.accept = accept
+        self.sent: list[tuple[bool, str | None, bytes]] = []
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        encoding = request.headers.get("content-encoding")
+        paid = "x-payment" in request.headers
+        self.sent.append((paid, encoding, request.content))
+        if encoding and not self.accept:
+            return httpx.Response(415)
+        if not paid:
+            return httpx.Response(402, content=b"challenge")
+        body = gzip.decompress(request.content) if encoding == "gzip" else request.content
+        return httpx.Response(200, json=json.loads(body))
+
+
+class _AsyncEncodingGateway(httpx.AsyncBaseTransport):
+    def __init__(self, *, accept: bool = True) -> None:
+        self._sync = _EncodingGateway(accept=accept)
+
+    @property
+    def sent(self) -> list[tuple[bool, str | None, bytes]]:
+        return self._sync.sent
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return self._sync.handle_request(request)
+
+
+def _client(gateway: httpx.BaseTransport) -> httpx.Client:
+    compressor = RequestCompressor(encoding="gzip")
+    transport = X402Transport(CountingX402ClientSync(), inner=gateway, compressor=compressor)
+    return httpx.Client(transport=transport)
+
+
+class TestRequestCompressor:
+    """Verify thresholds, reuse for the paid retry and the 415 fallback."""
+
+    def test_paid_retry_reuses_the_compressed_body(self) -> None:
+        gateway = _EncodingGateway()
+
+        response = _client(gateway).post(_URL, json=_BODY)
+
+        assert response.json() == _BODY
+        (_, enc1, body1), (paid, enc2, body2) = gateway.sent
+        assert enc1 == enc2 == "gzip"
+        assert paid
+        assert body1 == body2
+        assert len(body1) < len(json.dumps(_BODY)) // 10
+
+    def test_small_bodies_are_sent_uncompressed(self) -> None:
+        gateway = _EncodingGateway()
+
+        _client(gateway).post(_URL, json={"model": "m"})
+
+        assert [enc for _, enc, _ in gateway.sent] == [None, None]
+
+    def test_rejecting_host_is_sent_plain_bodies_from_then_on(self) -> None:
+        gateway = _EncodingGateway(accept=False)
+        client = _client(gateway)
+
+        first = client.post(_URL, json=_BODY)
+        second = client.post(_URL, json=_BODY)
+
+        assert first.status_code == second.status_code == 200
+        assert [enc for _, enc, _ in gateway.sent] == ["gzip", None, None, None, None]
+
+    def test_rejects_unknown_encoding(self) -> None:
+        with pytest.raises(ValueError, match="encoding"):
+            RequestCompressor(encoding="brotli")
+
+    def test_async_paid_retry_reuses_the_compressed_body(self) -> None:
+        gateway = _AsyncEncodingGateway()
+        transport = AsyncX402Transport(
+            CountingX402ClientAsync(),
+            inner=gateway,
+            compressor=RequestCompressor(encoding="gzip"),
+        )
+
+        async def run() -> httpx.Response:
+            async with httpx.AsyncClient(transport=transport) as client:
+                return await client.post(_URL, json=_BODY)
+
+        assert asyncio.run(run()).json() == _BODY
+        assert [enc for _, enc, _ in gateway.sent] == ["gzip", "gzip"]
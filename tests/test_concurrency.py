@@ -0,0 +1,192 @@
+"""Unit tests for the adaptive (AIMD) concurrency limiters (_concurrency.py)."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from tests._fakes import UnusedX402Client
+from x402_openai._concurrency import AdaptiveLimiter, AsyncAdaptiveLimiter
+from x402_openai._transport import AsyncX402Transport, X402Transport
+
+_HOST = "example.com"
+_URL = f"https://{_HOST}/v1/models"
+
+
+class _ConcurrencyProbe(httpx.BaseTransport):
+    """Record the highest number of overlapping requests."""
+
+    def __init__(self, status_code: int = 200, *, streamed: bool = False) -> None:
+        self.status_code = status_code
+        self.streamed = streamed
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.02)
+        with self._lock:
+            self.active -= 1
+        if self.streamed:
+            return httpx.Response(self.status_code, content=iter([b"ok"]))
+        return httpx.Response(self.status_code, content=b"ok")
+
+
+class _AsyncConcurrencyProbe(httpx.AsyncBaseTransport):
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return httpx.Response(200, content=b"ok")
+
+
+class TestAimdPolicy:
+    """Verify additive increase, multiplicative decrease and host isolation."""
+
+    def test_stable_latency_increases_limit(self) -> None:
+        limiter = AdaptiveLimiter(initial_limit=4)
+        for _ in range(40):
+            limiter.acquire(_HOST)
+            limiter.release(_HOST, latency=0.1)
+
+        assert limiter.limit(_HOST) > 4
+
+    def test_overload_halves_limit(self) -> None:
+        limiter = AdaptiveLimiter(initial_limit=8)
+        limiter.acquire(_HOST)
+        limiter.release(_HOST, overload=True)
+
+        assert limiter.limit(_HOST) == 4
+
+    def test_slow_responses_do_not_cut(self) -> None:
+        limiter = AdaptiveLimiter(initial_limit=8)
+        limiter.acquire(_HOST)
+        limiter.release(_HOST, latency=0.001)
+        limiter.acquire(_HOST)
+        limiter.release(_HOST, latency=30.0)
+
+        assert limiter.limit(_HOST) >= 8
+
+    def test_burst_of_rejections_cuts_once_per_round_trip(self) -> None:
+        limiter = AdaptiveLimiter(initial_limit=16)
+        limiter.acquire(_HOST)
+        limiter.release(_HOST, latency=60.0)
+        for _ in range(5):
+            limiter.acquire(_HOST)
+            limiter.release(_HOST, overload=True)
+
+        assert limiter.limit(_HOST) == 8
+
+    def test_limit_never_drops_below_minimum(self) -> None:
+        limiter = AdaptiveLimiter(initial_limit=2, min_limit=2)
+        limiter.acquire(_HOST)
+        limiter.release(_HOST, overload=True)
+
+        assert limiter.limit(_HOST) == 2
+
+    def test_hosts_are_independent(self) -> None:
+        limiter = AdaptiveLimiter(initial_limit=8)
+        limiter.acquire("a")
+        limiter.release("a", overload=True)
+
+        assert limiter.limit("a") == 4
+        assert limiter.limit("b") == 8
+
+    def test_rejects_inconsistent_bounds(self) -> None:
+        with pytest.raises(ValueError, match="min_limit"):
+            AdaptiveLimiter(initial_limit=1, min_limit=2)
+
+
+class TestSyncTransportLimiter:
+    """Verify that X402Transport respects the limiter."""
+
+    def test_concurrency_is_bounded(self) -> None:
+        inner = _ConcurrencyProbe()
+        limiter = AdaptiveLimiter(initial_limit=2, max_limit=2)
+        client = httpx.Client(
+            transport=X402Transport(UnusedX402Client(), inner=inner, limiter=limiter)
+        )
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda _: client.get(_URL), range(16)))
+
+        assert inner.peak == 2
+        assert limiter.snapshot()[_HOST]["in_flight"] == 0
+
+    def test_streamed_responses_release_on_close(self) -> None:
+        inner = _ConcurrencyProbe(streamed=True)
+        limiter = AdaptiveLimiter(initial_limit=2, max_limit=2)
+        client = httpx.Client(
+            transport=X402Transport(UnusedX402Client(), inner=inner, limiter=limiter)
+        )
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda _: client.get(_URL), range(16)))
+
+        assert inner.peak <= 2
+        assert limiter.snapshot()[_HOST]["in_flight"] == 0
+
+    def test_429_cuts_the_host_limit(self) -> None:
+        limiter = AdaptiveLimiter(initial_limit=8)
+        client = httpx.Client(
+            transport=X402Transport(
+                UnusedX402Client(), inner=_ConcurrencyProbe(429), limiter=limiter
+            )
+        )
+
+        client.get(_URL)
+
+        assert limiter.limit(_HOST) == 4
+
+    def test_slot_is_held_until_stream_is_closed(self) -> None:
+        limiter = AdaptiveLimiter(initial_limit=1)
+        client = httpx.Client(
+            transport=X402Transport(
+                UnusedX402Client(), inner=_ConcurrencyProbe(streamed=True), limiter=limiter
+            )
+        )
+
+        with client.stream("GET", _URL):
+            assert limiter.snapshot()[_HOST]["in_flight"] == 1
+        assert limiter.snapshot()[_HOST]["in_flight"] == 0
+
+
+class TestAsyncTransportLimiter:
+    """Verify that AsyncX402Transport respects the limiter."""
+
+    async def test_concurrency_is_bounded(self) -> None:
+        inner = _AsyncConcurrencyProbe()
+        limiter = AsyncAdaptiveLimiter(initial_limit=3, max_limit=3)
+        client = httpx.AsyncClient(
+            transport=AsyncX402Transport(UnusedX402Client(), inner=inner, limiter=limiter)
+        )
+
+        await asyncio.gather(*(client.get(_URL) for _ in range(12)))
+
+        assert inner.peak == 3
+        assert limiter.snapshot()[_HOST]["in_flight"] == 0
+
+    async def test_cancelled_waiter_does_not_leak_a_slot(self) -> None:
+        limiter = AsyncAdaptiveLimiter(initial_limit=1)
+        await limiter.acquire(_HOST)
+        waiter = asyncio.ensure_future(limiter.acquire(_HOST))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.sleep(0)
+        limiter.release(_HOST)
+
+        await asyncio.wait_for(limiter.acquire(_HOST), timeout=1.0)
+        assert limiter.snapshot()[_HOST]["in_flight"] == 1
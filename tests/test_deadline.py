@@ -0,0 +1,110 @@
+"""Unit tests for end-to-end deadlines of paid calls (_deadline.py)."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from tests._fakes import (
+    CountingX402ClientAsync,
+    CountingX402ClientSync,
+    PaywallAsyncTransport,
+    PaywallTransport,
+    evm_payload,
+)
+from x402_openai._deadline import DEADLINE_EXTENSION, X402DeadlineExceeded
+from x402_openai._transport import AsyncX402Transport, X402Transport
+
+_URL = "https://example.com/v1/chat/completions"
+
+
+class _UnsettledTransport(httpx.BaseTransport):
+    """Answer 402 without payment and 503 (not settled) with it."""
+
+    def __init__(self) -> None:
+        self.paid = 0
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if "x-payment" not in request.headers:
+            return httpx.Response(402, content=b"challenge")
+        self.paid += 1
+        return httpx.Response(503)
+
+
+class TestDeadline:
+    """Verify that one budget bounds the unpaid attempt, signing and the paid retry."""
+
+    def test_slow_paywall_fails_before_signing(self) -> None:
+        signer = CountingX402ClientSync()
+        gateway = PaywallTransport(delay=0.3)
+        client = httpx.Client(transport=X402Transport(signer, inner=gateway, deadline=0.5))
+
+        with pytest.raises(X402DeadlineExceeded):
+            client.post(_URL, json={})
+
+        assert signer.calls == 0
+        assert gateway.calls == 1
+
+    def test_extension_overrides_the_transport_default(self) -> None:
+        signer = CountingX402ClientSync()
+        transport = X402Transport(signer, inner=PaywallTransport(delay=0.05), deadline=0.01)
+        client = httpx.Client(transport=transport)
+
+        response = client.post(_URL, json={}, extensions={DEADLINE_EXTENSION: 5.0})
+
+        assert response.json() == {"ok": True}
+        assert signer.calls == 1
+
+    def test_timeouts_are_clamped_to_the_time_left(self) -> None:
+        seen: list[dict[str, float]] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.extensions["timeout"])
+            return httpx.Response(200)
+
+        transport = X402Transport(
+            CountingX402ClientSync(), inner=httpx.MockTransport(handler), deadline=2.0
+        )
+        httpx.Client(transport=transport, timeout=30.0).get(_URL)
+
+        assert all(0 < value <= 2.0 for value in seen[0].values())
+
+    def test_paid_retry_backoff_stops_at_the_deadline(self) -> None:
+        gateway = _UnsettledTransport()
+        transport = X402Transport(
+            CountingX402ClientSync(evm_payload(300)),
+            inner=gateway,
+            paid_retries=5,
+            deadline=0.25,
+        )
+
+        start = time.monotonic()
+        response = httpx.Client(transport=transport).post(_URL, json={})
+
+        assert response.status_code == 503
+        assert time.monotonic() - start < 0.25
+        assert gateway.paid == 2
+
+    def test_async_slow_upstream_is_cancelled(self) -> None:
+        signer = CountingX402ClientAsync()
+        transport = AsyncX402Transport(
+            signer, inner=PaywallAsyncTransport(delay=2.0), deadline=0.2
+        )
+
+        async def run() -> None:
+            async with httpx.AsyncClient(transport=transport) as client:
+                await client.post(_URL, json={})
+
+        start = time.monotonic()
+        with pytest.raises(X402DeadlineExceeded):
+            asyncio.run(run())
+
+        assert time.monotonic() - start < 1.0
+        assert signer.calls == 0
+
+    def test_rejects_non_positive_deadline(self) -> None:
+        with pytest.raises(ValueError, match="deadline"):
+            X402Transport(CountingX402ClientSync(), deadline=0)
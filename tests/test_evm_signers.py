@@ -0,0 +1,112 @@
+"""Unit tests for the EVM signer backends (_evm_signers.py, _eip712.py)."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+pytest.importorskip("eth_account")
+
+from eth_account import Account
+from x402.mechanisms.evm import EthAccountSigner
+from x402.mechanisms.evm.eip712 import build_typed_data_for_signing
+from x402.mechanisms.evm.types import ExactEIP3009Authorization, TypedDataField
+
+from x402_openai.wallets._eip712 import domain_separator, encode_value, type_hash
+from x402_openai.wallets._evm import EvmWallet
+from x402_openai.wallets._evm_signers import create_signer, resolve_backend
+
+_USDC_BASE = "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913"
+
+
+def _typed_data(
+    account: object, value: int
+) -> tuple[object, dict[str, object], str, dict[str, object]]:
+    authorization = ExactEIP3009Authorization(
+        from_address=account.address,  # type: ignore[attr-defined]
+        to="0x" + os.urandom(20).hex(),
+        value=str(value),
+        valid_after="0",
+        valid_before="1999999999",
+        nonce="0x" + os.urandom(32).hex(),
+    )
+    domain, types, primary, message = build_typed_data_for_signing(
+        authorization, 8453, _USDC_BASE, "USD Coin", "2"
+    )
+    fields = {
+        k: [TypedDataField(name=f["name"], type=f["type"]) for f in v] for k, v in types.items()
+    }
+    return domain, fields, primary, message
+
+
+class TestBackendSelection:
+    """Verify backend validation and resolution."""
+
+    def test_rejects_unknown_backend(self) -> None:
+        with pytest.raises(ValueError, match="signer_backend"):
+            EvmWallet(private_key="0xdead", signer_backend="openssl")
+
+    def test_explicit_backend_is_kept(self) -> None:
+        assert resolve_backend("eth_account") == "eth_account"
+
+    def test_eth_account_backend_uses_x402_signer(self) -> None:
+        signer = create_signer(Account.create(), "eth_account")
+        assert isinstance(signer, EthAccountSigner)
+
+
+class TestCoincurveSigner:
+    """Verify that the coincurve backend matches eth_account byte for byte."""
+
+    @pytest.fixture(autouse=True)
+    def _require_coincurve(self) -> None:
+        pytest.importorskip("coincurve")
+
+    def test_signatures_are_byte_identical(self) -> None:
+        for value in (1, 10_000, 2**200):
+            account = Account.create()
+            typed = _typed_data(account, value)
+            fast = create_signer(account, "coincurve")
+
+            assert fast.sign_typed_data(*typed) == EthAccountSigner(account).sign_typed_data(
+                *typed
+            )
+            assert fast.address == account.address
+
+    def test_domain_and_type_hashes_are_reused(self) -> None:
+        account = Account.create()
+        signer = create_signer(account, "coincurve")
+        signer.sign_typed_data(*_typed_data(account, 1))
+        domain_hits = domain_separator.cache_info().hits
+        type_hits = type_hash.cache_info().hits
+
+        signer.sign_typed_data(*_typed_data(account, 2))
+
+        assert domain_separator.cache_info().hits == domain_hits + 1
+        assert type_hash.cache_info().hits == type_hits + 1
+
+    def test_nested_types_fall_back_to_eth_account(self) -> None:
+        account = Account.create()
+        domain = {"name": "Mail", "version": "1", "chainId": 1}
+        types = {
+            "Person": [{"name": "wallet", "type": "address"}],
+            "Mail": [{"name": "from", "type": "Person"}, {"name": "body", "type": "string"}],
+        }
+        message = {"from": {"wallet": account.address}, "body": "hi"}
+
+        fast = create_signer(account, "coincurve").sign_typed_data(domain, types, "Mail", message)
+        slow = account.sign_typed_data(domain, types, message).signature
+
+        assert fast == bytes(slow)
+
+
+class TestEncoding:
+    """Verify EIP-712 value encoding edge cases."""
+
+    def test_rejects_oversized_fixed_bytes(self) -> None:
+        with pytest.raises(ValueError, match="too long"):
+            encode_value("bytes4", b"12345")
+
+    def test_rejects_short_address(self) -> None:
+        with pytest.raises(ValueError, match="address"):
+            encode_value("address", "0x1234")
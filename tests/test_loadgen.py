@@ -0,0 +1,78 @@
+"""Unit tests for the load generator CLI (loadgen.py)."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import socket
+
+import pytest
+
+pytest.importorskip("eth_account")
+
+from eth_account import Account
+
+from x402_openai._metrics import PaymentMetrics
+from x402_openai.loadgen import Sample, main, percentile, report, weighted
+
+
+def _closed_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+class TestLoadgen:
+    """Verify the mix parsing, the report and runs against local gateways."""
+
+    def test_stand_in_run_reports_payments_and_ttft(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        main(
+            [
+                "--requests", "24",
+                "--concurrency", "4",
+                "--stream-ratio", "0.5",
+                "--model", "a=3",
+                "--model", "b",
+                "--prompt-words", "10",
+                "--seed", "1",
+                "--json",
+            ]
+        )  # fmt: skip
+
+        summary = json.loads(capsys.readouterr().out)
+        assert summary["requests"] == summary["succeeded"] == 24
+        assert summary["payments"] == 24
+        assert 0 < summary["streamed"] < 24
+        assert summary["ttft_s"]["p50"] <= summary["latency_s"]["p99"]
+        assert summary["errors"] == {}
+
+    def test_errors_are_broken_down_by_kind(
+        self, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("EVM_PRIVATE_KEY", Account.create().key.hex())
+        base_url = f"http://127.0.0.1:{_closed_port()}/v1"
+
+        main(["--requests", "3", "--concurrency", "1", "--base-url", base_url, "--json"])
+
+        summary = json.loads(capsys.readouterr().out)
+        assert summary["errors"] == {"connection": 3}
+        assert summary["latency_s"]["p50"] is None
+
+    def test_report_percentiles(self) -> None:
+        samples = [Sample(i / 100, stream=False) for i in range(1, 101)]
+        samples.append(Sample(5.0, stream=True, error="HTTP 402"))
+
+        summary = report(samples, 2.0, PaymentMetrics())
+
+        assert summary["requests_per_s"] == 101 / 2
+        assert summary["latency_s"] == {"p50": 0.5, "p95": 0.95, "p99": 0.99}
+        assert summary["errors"] == {"HTTP 402": 1}
+        assert percentile([], 0.5) is None
+
+    def test_weighted_mix_entries(self) -> None:
+        assert weighted("gpt-4o=3") == ("gpt-4o", 3.0)
+        assert weighted("gpt-4o-mini") == ("gpt-4o-mini", 1.0)
+        with pytest.raises(argparse.ArgumentTypeError):
+            weighted("gpt-4o=0")
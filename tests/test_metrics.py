@@ -0,0 +1,125 @@
+"""Unit tests for the payment metrics registry (_metrics.py)."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from types import SimpleNamespace
+from typing import Any
+
+import httpx
+
+from tests._fakes import (
+    CountingX402ClientAsync,
+    CountingX402ClientSync,
+    PaywallAsyncTransport,
+    PaywallTransport,
+)
+from x402_openai._metrics import PaymentMetrics
+from x402_openai._transport import AsyncX402Transport, X402Transport
+
+_URL = "https://example.com/v1/chat/completions"
+
+
+def _v2_payload(amount: int = 1000) -> Any:
+    accepted = SimpleNamespace(network="eip155:8453", asset="0xUSDC", amount=str(amount))
+    return SimpleNamespace(accepted=accepted, payload={})
+
+
+class _FailingX402Client:
+    def handle_402_response(self, headers: dict[str, str], body: bytes) -> Any:
+        raise RuntimeError("no wallet for this network")
+
+
+class TestPaymentMetrics:
+    """Verify what the transports record and how it is exported."""
+
+    def test_paid_flow_counts_and_times_each_phase(self) -> None:
+        metrics = PaymentMetrics()
+        signer = CountingX402ClientSync(payload=_v2_payload())
+        transport = X402Transport(signer, inner=PaywallTransport(), metrics=metrics)
+        client = httpx.Client(transport=transport)
+
+        for _ in range(3):
+            assert client.post(_URL, json={}).json() == {"ok": True}
+
+        snapshot = metrics.snapshot()
+        assert snapshot["x402_requests_total"][()] == 3
+        assert snapshot["x402_challenges_total"][()] == 3
+        assert snapshot["x402_signings_total"][(("outcome", "ok"),)] == 3
+        assert snapshot["x402_payments_in_flight"][()] == 0
+        assert snapshot["x402_signing_seconds"][()]["count"] == 3
+        assert snapshot["x402_payment_seconds"][()]["count"] == 3
+        amounts = snapshot["x402_amount_paid"][(("network", "eip155:8453"), ("asset", "0xUSDC"))]
+        assert amounts["sum"] == 3000
+        assert amounts["buckets"][1000.0] == 3
+
+    def test_signing_failure_is_counted_as_an_error(self) -> None:
+        metrics = PaymentMetrics()
+        transport = X402Transport(_FailingX402Client(), inner=PaywallTransport(), metrics=metrics)
+
+        response = httpx.Client(transport=transport).post(_URL, json={})
+
+        snapshot = metrics.snapshot()
+        assert response.status_code == 402
+        assert snapshot["x402_signings_total"] == {(("outcome", "error"),): 1}
+        assert snapshot["x402_payments_in_flight"][()] == 0
+        assert "x402_payment_seconds" not in snapshot
+        assert "x402_amount_paid" not in snapshot
+
+    def test_async_transport_records_the_same_metrics(self) -> None:
+        metrics = PaymentMetrics()
+        signer = CountingX402ClientAsync(payload=_v2_payload())
+        transport = AsyncX402Transport(signer, inner=PaywallAsyncTransport(), metrics=metrics)
+
+        async def run() -> None:
+            async with httpx.AsyncClient(transport=transport) as client:
+                await asyncio.gather(*(client.post(_URL, json={}) for _ in range(4)))
+
+        asyncio.run(run())
+
+        snapshot = metrics.snapshot()
+        assert snapshot["x402_challenges_total"][()] == 4
+        assert snapshot["x402_payment_seconds"][()]["count"] == 4
+        assert snapshot["x402_payments_in_flight"][()] == 0
+
+    def test_prometheus_text_format(self) -> None:
+        metrics = PaymentMetrics(latency_buckets=(0.1, 1.0), amount_buckets=(100.0,))
+        metrics.request()
+        metrics.challenge()
+        metrics.signed(0.05, ok=True)
+        metrics.payment_done(0.5)
+        metrics.paid(_v2_payload(amount=50))
+
+        text = metrics.prometheus()
+
+        assert "# TYPE x402_requests_total counter\nx402_requests_total 1\n" in text
+        assert "# TYPE x402_payments_in_flight gauge\nx402_payments_in_flight 0\n" in text
+        assert 'x402_signings_total{outcome="ok"} 1\n' in text
+        assert 'x402_payment_seconds_bucket{le="0.1"} 0\n' in text
+        assert 'x402_payment_seconds_bucket{le="1.0"} 1\n' in text
+        assert 'x402_payment_seconds_bucket{le="+Inf"} 1\n' in text
+        assert "x402_payment_seconds_count 1\n" in text
+        labels = 'network="eip155:8453",asset="0xUSDC"'
+        assert f'x402_amount_paid_bucket{{{labels},le="100.0"}} 1\n' in text
+        assert f"x402_amount_paid_sum{{{labels}}} 50.0\n" in text
+
+    def test_concurrent_updates_are_not_lost(self) -> None:
+        metrics = PaymentMetrics()
+
+        def work() -> None:
+            for _ in range(1000):
+                metrics.challenge()
+                metrics.signed(0.001, ok=True)
+                metrics.payment_done(0.01)
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        snapshot = metrics.snapshot()
+        assert snapshot["x402_challenges_total"][()] == 8000
+        assert snapshot["x402_signing_seconds"][()]["count"] == 8000
+        assert snapshot["x402_payments_in_flight"][()] == 0
@@ -0,0 +1,151 @@
+"""Unit tests for resending the paid request with the same payment (_paid_retry.py)."""
+
+from __future__ import annotations
+
+import time
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from tests._fakes import CountingX402ClientAsync, CountingX402ClientSync, evm_payload
+from x402_openai._paid_retry import is_unsettled_failure, retry_delay, valid_until
+from x402_openai._transport import AsyncX402Transport, X402Transport
+
+_URL = "https://example.com/v1/chat/completions"
+
+
+def _flaky(failures: list[object]) -> list[object]:
+    """Return the outcomes of successive paid attempts, ending in success."""
+    return [*failures, httpx.Response(200, json={"ok": True})]
+
+
+class _FlakyPaidTransport(httpx.BaseTransport):
+    """Answer 402 without payment, then replay *outcomes* for paid attempts."""
+
+    def __init__(self, outcomes: list[object]) -> None:
+        self.outcomes = outcomes
+        self.paid_headers: list[str] = []
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if "x-payment" not in request.headers:
+            return httpx.Response(402, content=b"challenge")
+        self.paid_headers.append(request.headers["x-payment"])
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        assert isinstance(outcome, httpx.Response)
+        return outcome
+
+
+class _FlakyPaidAsyncTransport(httpx.AsyncBaseTransport):
+    def __init__(self, outcomes: list[object]) -> None:
+        self._sync = _FlakyPaidTransport(outcomes)
+
+    @property
+    def paid_headers(self) -> list[str]:
+        return self._sync.paid_headers
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return self._sync.handle_request(request)
+
+
+class TestPolicy:
+    """Verify settlement detection and the validity window."""
+
+    def test_5xx_without_settlement_header_is_retryable(self) -> None:
+        assert is_unsettled_failure(httpx.Response(502))
+        assert not is_unsettled_failure(httpx.Response(502, headers={"payment-response": "x"}))
+        assert not is_unsettled_failure(httpx.Response(400))
+
+    def test_validity_uses_earliest_deadline(self) -> None:
+        now = time.time()
+        payload = SimpleNamespace(
+            payload={"authorization": {"validBefore": str(int(now + 600))}},
+            accepted=SimpleNamespace(max_timeout_seconds=60),
+        )
+
+        assert valid_until(payload, now) == now + 60
+
+    def test_unknown_payload_allows_no_retry(self) -> None:
+        now = time.time()
+        assert retry_delay(0, 2, valid_until({}, now)) is None
+
+    def test_retry_budget_is_bounded(self) -> None:
+        deadline = time.time() + 600
+        assert retry_delay(0, 2, deadline) is not None
+        assert retry_delay(2, 2, deadline) is None
+
+
+class TestSyncTransport:
+    """Verify that X402Transport resends with the same payment."""
+
+    def test_connection_reset_is_retried_without_resigning(self) -> None:
+        inner = _FlakyPaidTransport(_flaky([httpx.ReadError("reset")]))
+        x402 = CountingX402ClientSync(evm_payload(600))
+        client = httpx.Client(transport=X402Transport(x402, inner=inner))
+
+        response = client.get(_URL)
+
+        assert response.json() == {"ok": True}
+        assert x402.calls == 1
+        assert inner.paid_headers == ["signed", "signed"]
+
+    def test_settled_5xx_is_returned_as_is(self) -> None:
+        settled = httpx.Response(500, headers={"payment-response": "x"})
+        inner = _FlakyPaidTransport(_flaky([settled]))
+        client = httpx.Client(
+            transport=X402Transport(CountingX402ClientSync(evm_payload(600)), inner=inner)
+        )
+
+        assert client.get(_URL).status_code == 500
+        assert len(inner.paid_headers) == 1
+
+    def test_expiring_payment_is_not_resent(self) -> None:
+        inner = _FlakyPaidTransport(_flaky([httpx.Response(503)]))
+        client = httpx.Client(
+            transport=X402Transport(CountingX402ClientSync(evm_payload(0)), inner=inner)
+        )
+
+        assert client.get(_URL).status_code == 503
+        assert len(inner.paid_headers) == 1
+
+    def test_errors_propagate_once_retries_are_spent(self) -> None:
+        inner = _FlakyPaidTransport([httpx.ConnectError("down")] * 3)
+        client = httpx.Client(
+            transport=X402Transport(
+                CountingX402ClientSync(evm_payload(600)), inner=inner, paid_retries=2
+            )
+        )
+
+        with pytest.raises(httpx.ConnectError):
+            client.get(_URL)
+        assert len(inner.paid_headers) == 3
+
+    def test_timeouts_are_not_retried(self) -> None:
+        inner = _FlakyPaidTransport(_flaky([httpx.ReadTimeout("slow")]))
+        client = httpx.Client(
+            transport=X402Transport(CountingX402ClientSync(evm_payload(600)), inner=inner)
+        )
+
+        with pytest.raises(httpx.ReadTimeout):
+            client.get(_URL)
+
+    def test_rejects_negative_retries(self) -> None:
+        with pytest.raises(ValueError, match="paid_retries"):
+            X402Transport(CountingX402ClientSync(), paid_retries=-1)
+
+
+class TestAsyncTransport:
+    """Verify that AsyncX402Transport resends with the same payment."""
+
+    async def test_5xx_is_retried_without_resigning(self) -> None:
+        inner = _FlakyPaidAsyncTransport(_flaky([httpx.Response(502)]))
+        x402 = CountingX402ClientAsync(evm_payload(600))
+        client = httpx.AsyncClient(transport=AsyncX402Transport(x402, inner=inner))
+
+        response = await client.get(_URL)
+
+        assert response.json() == {"ok": True}
+        assert x402.calls == 1
+        assert inner.paid_headers == ["signed", "signed"]
@@ -0,0 +1,202 @@
+"""Unit tests for the local paying proxy (proxy.py)."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from tests._fakes import SSE_CHUNKS, CountingX402ClientAsync, PaywallAsyncTransport
+from x402_openai._cache import MemoryCache
+from x402_openai.proxy import PayingProxy
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable
+
+_UPSTREAM = "https://gateway.example/v1"
+
+
+def _run(
+    inner: httpx.AsyncBaseTransport,
+    scenario: Callable[[httpx.AsyncClient], Awaitable[Any]],
+    **options: Any,
+) -> tuple[Any, CountingX402ClientAsync]:
+    """Run *scenario* with a client pointed at a proxy in front of *inner*."""
+    signer = CountingX402ClientAsync()
+
+    async def main() -> Any:
+        proxy = PayingProxy(signer, upstream=_UPSTREAM, port=0, inner=inner, **options)
+        async with proxy, httpx.AsyncClient(base_url=proxy.url) as client:
+            return await scenario(client)
+
+    return asyncio.run(main()), signer
+
+
+class _HeldStream(httpx.AsyncBaseTransport):
+    """Paid responses send one SSE event, then wait for :attr:`release`."""
+
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+        self.urls: list[str] = []
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.urls.append(str(request.url))
+        if "x-payment" not in request.headers:
+            return httpx.Response(402, content=b"challenge")
+
+        async def events() -> AsyncIterator[bytes]:
+            yield SSE_CHUNKS[0]
+            await self.release.wait()
+            yield SSE_CHUNKS[1]
+
+        return httpx.Response(200, headers={"content-type": "text/event-stream"}, content=events())
+
+
+class _Recording(httpx.AsyncBaseTransport):
+    """Answer 200 to every request and keep it for inspection."""
+
+    def __init__(self) -> None:
+        self.requests: list[httpx.Request] = []
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        self.requests.append(request)
+        return httpx.Response(200, json={"ok": True})
+
+
+def _exchange(
+    inner: httpx.AsyncBaseTransport, *messages: bytes, **options: Any
+) -> tuple[list[bytes], bytes]:
+    """Send raw *messages* to a proxy; return the interim lines and the final response."""
+
+    async def main() -> tuple[list[bytes], bytes]:
+        proxy = PayingProxy(
+            CountingX402ClientAsync(), upstream=_UPSTREAM, port=0, inner=inner, **options
+        )
+        async with proxy:
+            port = int(proxy.url.split(":")[-1].removesuffix("/v1"))
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            interim = []
+            for message in messages[:-1]:
+                writer.write(message)
+                interim.append(await reader.readuntil(b"\r\n\r\n"))
+            writer.write(messages[-1])
+            response = await reader.read()
+            writer.close()
+            return interim, response
+
+    return asyncio.run(main())
+
+
+class TestPayingProxy:
+    """Verify payment, streaming passthrough and sharing across callers."""
+
+    def test_pays_and_forwards_json(self) -> None:
+        async def scenario(client: httpx.AsyncClient) -> httpx.Response:
+            return await client.post("/chat/completions", json={"model": "m"})
+
+        response, signer = _run(PaywallAsyncTransport(), scenario)
+
+        assert response.status_code == 200
+        assert response.json() == {"ok": True}
+        assert signer.calls == 1
+
+    def test_streams_sse_without_buffering(self) -> None:
+        inner = _HeldStream()
+
+        async def scenario(client: httpx.AsyncClient) -> list[bytes]:
+            received = []
+            async with client.stream("POST", "/chat/completions?x=1", json={}) as response:
+                async for chunk in response.aiter_bytes():
+                    received.append(chunk)
+                    inner.release.set()  # Only reachable if the first event arrived alone.
+            return received
+
+        received, _ = _run(inner, scenario)
+
+        assert b"".join(received) == b"".join(SSE_CHUNKS)
+        assert inner.urls[-1] == _UPSTREAM + "/chat/completions?x=1"
+
+    def test_shares_the_response_cache_across_connections(self) -> None:
+        body = {"model": "m", "input": "hello"}
+
+        async def scenario(client: httpx.AsyncClient) -> list[int]:
+            first = await client.post("/embeddings", json=body)
+            async with httpx.AsyncClient(base_url=str(client.base_url)) as other:
+                second = await other.post("/embeddings", json=body)
+            return [first.status_code, second.status_code]
+
+        statuses, signer = _run(PaywallAsyncTransport(stream=True), scenario, cache=MemoryCache())
+
+        assert statuses == [200, 200]
+        assert signer.calls == 1
+
+    def test_unknown_path_is_not_forwarded(self) -> None:
+        inner = PaywallAsyncTransport()
+
+        async def scenario(client: httpx.AsyncClient) -> httpx.Response:
+            return await client.get(str(client.base_url).removesuffix("/v1/") + "/admin")
+
+        response, _ = _run(inner, scenario)
+
+        assert response.status_code == 404
+        assert inner.calls == 0
+
+    def test_upstream_failure_is_a_bad_gateway(self) -> None:
+        class Failing(httpx.AsyncBaseTransport):
+            async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+                raise httpx.ConnectError("down")
+
+        async def scenario(client: httpx.AsyncClient) -> httpx.Response:
+            return await client.get("/models")
+
+        response, _ = _run(Failing(), scenario)
+
+        assert response.status_code == 502
+        assert response.json()["error"]["type"] == "x402_proxy_error"
+
+
+class TestRequestParsing:
+    """Verify handling of client request framing."""
+
+    def test_expect_continue_is_answered_and_not_forwarded(self) -> None:
+        inner = _Recording()
+        head = (
+            b"POST /v1/embeddings HTTP/1.1\r\nhost: x\r\nconnection: close\r\n"
+            b"expect: 100-continue\r\ncontent-length: 2\r\n\r\n"
+        )
+
+        interim, response = _exchange(inner, head, b"{}")
+
+        assert interim == [b"HTTP/1.1 100 Continue\r\n\r\n"]
+        assert response.startswith(b"HTTP/1.1 200")
+        assert inner.requests[0].content == b"{}"
+        assert "expect" not in inner.requests[0].headers
+
+    def test_oversized_bodies_are_refused(self) -> None:
+        inner = _Recording()
+        sized = b"POST /v1/files HTTP/1.1\r\ncontent-length: 11\r\n\r\n"
+        chunked = (
+            b"POST /v1/files HTTP/1.1\r\ntransfer-encoding: chunked\r\n\r\n"
+            b"6\r\nabcdef\r\n6\r\nghijkl\r\n0\r\n\r\n"
+        )
+
+        _, first = _exchange(inner, sized, max_body_size=10)
+        _, second = _exchange(inner, chunked, max_body_size=10)
+
+        assert first.startswith(b"HTTP/1.1 413")
+        assert second.startswith(b"HTTP/1.1 413")
+        assert inner.requests == []
+
+    def test_invalid_lengths_are_bad_requests(self) -> None:
+        inner = _Recording()
+        for message in (
+            b"POST /v1/files HTTP/1.1\r\ncontent-length: -1\r\n\r\n",
+            b"POST /v1/files HTTP/1.1\r\ntransfer-encoding: chunked\r\n\r\nzz\r\n",
+        ):
+            _, response = _exchange(inner, message)
+
+            assert response.startswith(b"HTTP/1.1 400")
+            assert b"x402_proxy_error" in response
+        assert inner.requests == []
@@ -0,0 +1,98 @@
+"""Unit tests for x402 payment of realtime sessions (_realtime.py)."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+pytest.importorskip("eth_account")
+pytest.importorskip("websockets")
+
+from eth_account import Account
+from websockets.exceptions import InvalidStatus
+
+from x402_openai import AsyncX402OpenAI, X402OpenAI
+from x402_openai._realtime import _renewal
+from x402_openai._standin import RealtimeStandIn
+from x402_openai.wallets import EvmWallet
+
+
+def _wallet() -> EvmWallet:
+    return EvmWallet(private_key=Account.create().key.hex())
+
+
+class TestRealtime:
+    """Verify paid upgrades and in-session renewals against the stand-in gateway."""
+
+    def test_sync_session_is_paid_and_renewed(self) -> None:
+        gateway = RealtimeStandIn(renew_every=2)
+        with gateway as url:
+            client = X402OpenAI(
+                wallet=_wallet(), base_url="http://gateway/v1", websocket_base_url=url
+            )
+            with client.realtime.connect(model="gpt-realtime") as connection:
+                assert connection.recv().type == "session.created"
+                events = []
+                for _ in range(5):
+                    connection.response.create()
+                    events.append(connection.recv().type)
+
+        assert events == ["response.done"] * 5
+        # One payment at the upgrade, one after every second answer.
+        assert len(gateway.payments) == 3
+        assert len(set(gateway.payments)) == 3
+
+    async def test_async_session_is_paid_and_renewed(self) -> None:
+        gateway = RealtimeStandIn(renew_every=1)
+        with gateway as url:
+            client = AsyncX402OpenAI(
+                wallet=_wallet(), base_url="http://gateway/v1", websocket_base_url=url
+            )
+            async with client.realtime.connect(model="gpt-realtime") as connection:
+                await connection.recv()
+                for _ in range(3):
+                    await connection.response.create()
+                    assert (await connection.recv()).type == "response.done"
+            await client.close()
+
+        # The renewal following the last answer is never received, so never paid.
+        assert len(gateway.payments) == 3
+
+    def test_beta_realtime_is_paid(self) -> None:
+        gateway = RealtimeStandIn()
+        with gateway as url:
+            client = X402OpenAI(
+                wallet=_wallet(), base_url="http://gateway/v1", websocket_base_url=url
+            )
+            with client.beta.realtime.connect(model="gpt-4o-realtime-preview") as connection:
+                message = json.loads(connection.recv_bytes())
+
+        assert message["type"] == "session.created"
+        assert len(gateway.payments) == 1
+
+    def test_upgrade_refusal_is_raised_when_signing_fails(self) -> None:
+        with RealtimeStandIn() as url:
+            client = X402OpenAI(
+                wallet=_wallet(),
+                policies=[lambda version, requirements: []],
+                base_url="http://gateway/v1",
+                websocket_base_url=url,
+            )
+            with pytest.raises(InvalidStatus) as refused:
+                client.realtime.connect(model="gpt-realtime").enter()
+
+        assert refused.value.response.status_code == 402
+
+    def test_malformed_renewal_events_are_not_answered(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        malformed = b'{"type": "x402.payment_required"}'
+
+        assert _renewal(malformed) is None
+        assert _renewal(b"x402.payment_required, not JSON") is None
+        assert _renewal(b'{"type": "x402.payment_required", "payment_required": "h"}') == (
+            {"payment-required": "h"},
+            b"",
+        )
+        assert "without a payment_required header" in caplog.text
@@ -0,0 +1,103 @@
+"""Unit tests for traffic recording and replay (_recording.py, replay.py)."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import TYPE_CHECKING
+
+import httpx
+
+from tests._fakes import CountingX402ClientSync, PaywallTransport
+from x402_openai._recording import TrafficRecorder, load_trace
+from x402_openai._transport import X402Transport
+from x402_openai.replay import exchanges, replay, stand_in
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_URL = "https://example.com/v1/chat/completions?api-key=secret"
+
+
+def _record(path: Path, *, stream: bool = False) -> None:
+    recorder = TrafficRecorder(path)
+    transport = X402Transport(
+        CountingX402ClientSync(), inner=PaywallTransport(stream=stream), recorder=recorder
+    )
+    with httpx.Client(transport=transport) as client:
+        client.post(_URL, json={"model": "m"}, headers={"authorization": "Bearer secret"})
+        client.post(_URL, json={"model": "m", "stream": True})
+    recorder.close()
+
+
+class TestRecorder:
+    """Verify trace contents and redaction."""
+
+    def test_unpaid_and_paid_attempts_share_an_id(self, tmp_path: Path) -> None:
+        _record(tmp_path / "trace.jsonl")
+
+        records = load_trace(tmp_path / "trace.jsonl")
+
+        assert [(r["id"], r["paid"], r["status"]) for r in records] == [
+            (0, False, 402),
+            (0, True, 200),
+            (1, False, 402),
+            (1, True, 200),
+        ]
+        assert records[0]["challenge"]["body"] == "challenge"
+        assert records[1]["response_bytes"] == len(b'{"ok":true}')
+
+    def test_exchange_ids_are_unique_across_threads(self, tmp_path: Path) -> None:
+        recorder = TrafficRecorder(tmp_path / "trace.jsonl")
+        ids: list[int] = []
+
+        def assign() -> None:
+            for _ in range(200):
+                ids.append(recorder.exchange_id(httpx.Request("GET", _URL)))
+
+        threads = [threading.Thread(target=assign) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        recorder.close()
+
+        assert len(set(ids)) == len(ids)
+
+    def test_secrets_and_signatures_are_not_written(self, tmp_path: Path) -> None:
+        _record(tmp_path / "trace.jsonl")
+
+        text = (tmp_path / "trace.jsonl").read_text()
+
+        assert "secret" not in text
+        assert "signed" not in text
+        assert '"path":"/v1/chat/completions"' in text
+
+
+class TestReplay:
+    """Verify playback against the stand-in gateway."""
+
+    def test_replay_pays_and_completes_every_exchange(self, tmp_path: Path) -> None:
+        _record(tmp_path / "trace.jsonl", stream=True)
+        recorded = exchanges(load_trace(tmp_path / "trace.jsonl"))
+
+        with stand_in(recorded) as base_url:
+            report = asyncio.run(replay(recorded, base_url=base_url, speed=10))
+
+        assert report.errors == 0
+        assert len(report.replayed) == 2
+        assert "p95" in report.summary()
+
+    def test_gateway_reproduces_challenge_and_body_size(self, tmp_path: Path) -> None:
+        _record(tmp_path / "trace.jsonl")
+        recorded = exchanges(load_trace(tmp_path / "trace.jsonl"))
+
+        with stand_in(recorded) as base_url:
+            url = base_url + recorded[0].path
+            unpaid = httpx.post(url, headers={"x-x402-replay": "0"})
+            paid = httpx.post(url, headers={"x-x402-replay": "0", "x-payment": "p"})
+
+        assert unpaid.status_code == 402
+        assert unpaid.text == "challenge"
+        assert paid.status_code == 200
+        assert len(paid.content) == recorded[0].final["response_bytes"]
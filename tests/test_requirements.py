@@ -0,0 +1,174 @@
+"""Unit tests for the cross-process payment requirements cache (_requirements.py)."""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import time
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+
+from tests._fakes import (
+    CountingX402ClientAsync,
+    CountingX402ClientSync,
+    PaywallAsyncTransport,
+    PaywallTransport,
+)
+from x402_openai._requirements import RequirementsCache, requirements_key
+from x402_openai._transport import AsyncX402Transport, X402Transport
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_URL = "https://example.com/v1/chat/completions"
+
+
+class _RepricingTransport(httpx.BaseTransport):
+    """Accept only payments signed for the current price."""
+
+    def __init__(self, price: str) -> None:
+        self.price = price
+        self.calls = 0
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        if request.headers.get("x-payment") == self.price:
+            return httpx.Response(200, json={"ok": True})
+        return httpx.Response(402, headers={"payment-required": self.price})
+
+
+class _PriceSigner:
+    """Sign by echoing the price of the challenge."""
+
+    def handle_402_response(
+        self, headers: dict[str, str], body: bytes
+    ) -> tuple[dict[str, str], dict[str, str]]:
+        return {"x-payment": headers["payment-required"]}, {}
+
+
+def _write_from_child(path: str) -> None:
+    RequirementsCache(path).set("key", {"payment-required": "from-child"}, b"body")
+
+
+class TestRequirementsCache:
+    """Verify sharing, expiry and the pay-up-front path of the transports."""
+
+    def test_known_requirements_skip_the_unpaid_attempt(self, tmp_path: Path) -> None:
+        path = tmp_path / "requirements"
+        first, second = PaywallTransport(), PaywallTransport()
+        for gateway in (first, second):
+            # One transport per worker process, sharing the cache file.
+            transport = X402Transport(
+                CountingX402ClientSync(), inner=gateway, requirements=RequirementsCache(path)
+            )
+            response = httpx.Client(transport=transport).post(_URL, json={"model": "m"})
+            assert response.json() == {"ok": True}
+
+        assert first.calls == 2
+        assert second.calls == 1
+
+    def test_changed_requirements_are_rediscovered(self) -> None:
+        requirements = RequirementsCache()
+        gateway = _RepricingTransport("10")
+        transport = X402Transport(_PriceSigner(), inner=gateway, requirements=requirements)
+        client = httpx.Client(transport=transport)
+        client.post(_URL, json={"model": "m"})
+
+        gateway.price = "20"
+        gateway.calls = 0
+        response = client.post(_URL, json={"model": "m"})
+
+        assert response.json() == {"ok": True}
+        assert gateway.calls == 2  # Stale payment rejected, then paid at the new price.
+        key = requirements_key(httpx.Request("POST", _URL, json={"model": "m"}))
+        assert requirements.get(key) == ({"payment-required": "20"}, b"")
+
+    def test_entries_are_keyed_on_endpoint_and_model(self) -> None:
+        requirements = RequirementsCache()
+        gateway = PaywallTransport()
+        transport = X402Transport(
+            CountingX402ClientSync(), inner=gateway, requirements=requirements
+        )
+        client = httpx.Client(transport=transport)
+
+        client.post(_URL, json={"model": "a", "messages": ["x"]})
+        client.post(_URL, json={"model": "a", "messages": ["y"]})
+        client.post(_URL, json={"model": "b"})
+
+        assert gateway.calls == 2 + 1 + 2
+
+    def test_expiry_oversized_entries_and_other_processes(self, tmp_path: Path) -> None:
+        path = tmp_path / "requirements"
+        requirements = RequirementsCache(path, ttl=0.05, slot_size=256)
+
+        requirements.set("big", {}, b"x" * 256)
+        requirements.set("short", {}, b"lived")
+        assert requirements.get("big") is None
+        assert requirements.get("short") == ({}, b"lived")
+        time.sleep(0.1)
+        assert requirements.get("short") is None
+
+        if hasattr(os, "fork"):
+            child = multiprocessing.get_context("fork").Process(
+                target=_write_from_child, args=(str(path),)
+            )
+            child.start()
+            child.join()
+            assert requirements.get("key") == ({"payment-required": "from-child"}, b"body")
+
+    def test_undecodable_slot_is_a_miss(self) -> None:
+        requirements = RequirementsCache()
+        key = requirements_key(httpx.Request("POST", _URL, json={"model": "m"}))
+        # A torn or foreign write: the metadata length points at invalid JSON.
+        requirements._write(key, time.time() + 60, b"\x05\x00\x00\x00{not json")
+        gateway = PaywallTransport()
+        transport = X402Transport(
+            CountingX402ClientSync(), inner=gateway, requirements=requirements
+        )
+
+        response = httpx.Client(transport=transport).post(_URL, json={"model": "m"})
+
+        assert response.json() == {"ok": True}
+        assert gateway.calls == 2
+
+    def test_local_signing_failure_keeps_the_entry(self) -> None:
+        class Refusing:
+            def handle_402_response(self, headers: dict[str, str], body: bytes) -> None:
+                raise LookupError("no wallet for this network")
+
+        requirements = RequirementsCache()
+        key = requirements_key(httpx.Request("POST", _URL, json={"model": "m"}))
+        requirements.set(key, {"payment-required": "10"}, b"")
+        transport = X402Transport(
+            Refusing(), inner=_RepricingTransport("10"), requirements=requirements
+        )
+
+        response = httpx.Client(transport=transport).post(_URL, json={"model": "m"})
+
+        assert response.status_code == 402
+        assert requirements.get(key) == ({"payment-required": "10"}, b"")
+
+    def test_async_transport_pays_up_front(self) -> None:
+        requirements = RequirementsCache()
+        gateway = PaywallAsyncTransport()
+        transport = AsyncX402Transport(
+            CountingX402ClientAsync(), inner=gateway, requirements=requirements
+        )
+
+        async def run() -> None:
+            async with httpx.AsyncClient(transport=transport) as client:
+                for _ in range(3):
+                    response = await client.post(_URL, json={"model": "m"})
+                    assert response.json() == {"ok": True}
+
+        asyncio.run(run())
+
+        assert gateway.calls == 2 + 1 + 1
+        assert requirements.stats() == {"hits": 2, "misses": 1}
+
+    def test_rejects_invalid_geometry(self) -> None:
+        with pytest.raises(ValueError, match="slot_size"):
+            RequirementsCache(slot_size=8)
@@ -0,0 +1,160 @@
+"""Unit tests for per-request wallet routing (_routing.py)."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from tests._fakes import (
+    CountingX402ClientAsync,
+    CountingX402ClientSync,
+    PaywallAsyncTransport,
+    PaywallTransport,
+)
+from x402_openai._batching import EmbeddingBatcher
+from x402_openai._cache import MemoryCache
+from x402_openai._routing import AsyncWalletRegistry, WalletRegistry, use_wallet
+from x402_openai._transport import AsyncX402Transport, X402Transport
+
+_URL = "https://example.com/v1/chat/completions"
+
+
+class _Tenants:
+    """Loader handing out one counting x402 client per tenant."""
+
+    def __init__(self, factory: type = CountingX402ClientSync) -> None:
+        self.factory = factory
+        self.clients: dict[str, object] = {}
+        self.loads: list[str] = []
+
+    def __call__(self, key: str) -> object:
+        self.loads.append(key)
+        self.clients[key] = self.factory()
+        return self.clients[key]
+
+
+class TestWalletRegistry:
+    """Verify lazy loading, LRU eviction and wallet selection."""
+
+    def test_context_selects_the_paying_wallet(self) -> None:
+        tenants = _Tenants()
+        registry = WalletRegistry(tenants)
+        client = httpx.Client(transport=X402Transport(registry, inner=PaywallTransport()))
+
+        with use_wallet("a"):
+            client.get(_URL)
+            client.get(_URL)
+        with use_wallet("b"):
+            client.get(_URL)
+
+        assert tenants.loads == ["a", "b"]
+        assert tenants.clients["a"].calls == 2  # type: ignore[attr-defined]
+        assert tenants.clients["b"].calls == 1  # type: ignore[attr-defined]
+
+    def test_request_extension_overrides_context(self) -> None:
+        tenants = _Tenants()
+        client = httpx.Client(
+            transport=X402Transport(WalletRegistry(tenants), inner=PaywallTransport())
+        )
+
+        with use_wallet("a"):
+            response = client.get(_URL, extensions={"x402_wallet": "b"})
+
+        assert response.status_code == 200
+        assert tenants.loads == ["b"]
+
+    def test_unselected_wallet_returns_the_402(self) -> None:
+        client = httpx.Client(
+            transport=X402Transport(WalletRegistry(_Tenants()), inner=PaywallTransport())
+        )
+
+        assert client.get(_URL).status_code == 402
+
+    def test_cached_responses_are_not_shared_between_tenants(self) -> None:
+        tenants = _Tenants()
+        transport = X402Transport(
+            WalletRegistry(tenants), inner=PaywallTransport(), cache=MemoryCache(), coalesce=True
+        )
+        client = httpx.Client(transport=transport)
+        body = {"input": "same", "model": "m"}
+        url = "https://example.com/v1/embeddings"
+
+        with use_wallet("a"):
+            client.post(url, json=body)
+            client.post(url, json=body)
+        with use_wallet("b"):
+            client.post(url, json=body)
+
+        assert tenants.clients["a"].calls == 1  # type: ignore[attr-defined]
+        assert tenants.clients["b"].calls == 1  # type: ignore[attr-defined]
+
+    def test_least_recently_used_wallet_is_evicted(self) -> None:
+        tenants = _Tenants()
+        registry = WalletRegistry(tenants, max_wallets=2)
+
+        for key in ("a", "b", "a", "c", "a", "b"):
+            registry.client_for(key)
+
+        assert len(registry) == 2
+        assert tenants.loads == ["a", "b", "c", "b"]
+
+    def test_rejects_empty_capacity(self) -> None:
+        with pytest.raises(ValueError, match="max_wallets"):
+            WalletRegistry(_Tenants(), max_wallets=0)
+
+
+class TestAsyncWalletRegistry:
+    """Verify that concurrent tasks keep their own wallet."""
+
+    def test_tasks_pay_with_their_own_wallet(self) -> None:
+        tenants = _Tenants(CountingX402ClientAsync)
+        registry = AsyncWalletRegistry(tenants)
+
+        async def run() -> None:
+            async with httpx.AsyncClient(
+                transport=AsyncX402Transport(registry, inner=PaywallAsyncTransport(delay=0.01))
+            ) as client:
+
+                async def call(key: str) -> None:
+                    with use_wallet(key):
+                        await client.get(_URL)
+
+                await asyncio.gather(call("a"), call("b"), call("a"))
+
+        asyncio.run(run())
+
+        assert sorted(tenants.loads) == ["a", "b"]
+        assert tenants.clients["a"].calls == 2  # type: ignore[attr-defined]
+        assert tenants.clients["b"].calls == 1  # type: ignore[attr-defined]
+
+    def test_identical_requests_are_not_coalesced_across_tenants(self) -> None:
+        tenants = _Tenants(CountingX402ClientAsync)
+        transport = AsyncX402Transport(
+            AsyncWalletRegistry(tenants),
+            inner=PaywallAsyncTransport(delay=0.05),
+            coalesce=True,
+            embedding_batcher=EmbeddingBatcher(max_wait=0.01),
+        )
+        body = {"input": "same", "model": "m"}
+
+        async def run() -> None:
+            async with httpx.AsyncClient(transport=transport) as client:
+
+                async def call(key: str, url: str) -> None:
+                    with use_wallet(key):
+                        await client.post(url, json=body)
+
+                await asyncio.gather(
+                    *(
+                        call(key, url)
+                        for key in ("a", "b")
+                        for url in (_URL, "https://example.com/v1/embeddings")
+                    )
+                )
+
+        asyncio.run(run())
+
+        assert tenants.clients["a"].calls == 2  # type: ignore[attr-defined]
+        assert tenants.clients["b"].calls == 2  # type: ignore[attr-defined]
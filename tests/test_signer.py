@@ -0,0 +1,173 @@
+"""Unit tests for the signer daemon and RemoteWallet (signer.py, wallets/_remote.py)."""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import contextlib
+import os
+import stat
+import threading
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+pytest.importorskip("eth_account")
+
+from eth_account import Account
+from x402 import x402ClientSync
+from x402.http.utils import encode_payment_required_header
+from x402.schemas import PaymentRequired, PaymentRequirements
+
+from x402_openai._wallet import acreate_x402_http_client
+from x402_openai.signer import SignerDaemon
+from x402_openai.wallets import EvmWallet, RemoteWallet
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+_USDC = "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913"
+
+
+def _required(network: str = "eip155:8453") -> PaymentRequired:
+    return PaymentRequired(
+        accepts=[
+            PaymentRequirements(
+                scheme="exact",
+                network=network,
+                asset=_USDC,
+                amount="1000",
+                pay_to="0x" + os.urandom(20).hex(),
+                max_timeout_seconds=300,
+                extra={"name": "USD Coin", "version": "2"},
+            )
+        ]
+    )
+
+
+@contextlib.contextmanager
+def _running(daemon: SignerDaemon) -> Iterator[SignerDaemon]:
+    """Run *daemon* on an event loop in a background thread."""
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    asyncio.run_coroutine_threadsafe(daemon.start(), loop).result(timeout=30)
+    try:
+        yield daemon
+    finally:
+        asyncio.run_coroutine_threadsafe(daemon.aclose(), loop).result(timeout=30)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+class TestSignerDaemon:
+    """Verify that remote payments are signed by the daemon's keys, in batches."""
+
+    def test_remote_wallet_signs_with_the_daemon_key(self, tmp_path: Path) -> None:
+        account = Account.create()
+        path = tmp_path / "signer.sock"
+        daemon = SignerDaemon([EvmWallet(private_key=account.key.hex())], path, processes=1)
+        with _running(daemon):
+            client = x402ClientSync()
+            RemoteWallet(path).register(client)
+            payload = client.create_payment_payload(_required())
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+
+        assert payload.payload["authorization"]["from"] == account.address
+        assert mode == 0o600
+        assert not path.exists()
+
+    def test_concurrent_requests_are_batched(self, tmp_path: Path) -> None:
+        path = tmp_path / "signer.sock"
+        daemon = SignerDaemon(
+            [EvmWallet(private_key=Account.create().key.hex())], path, processes=1
+        )
+        with _running(daemon):
+            client = x402ClientSync()
+            RemoteWallet(path).register(client)
+            with concurrent.futures.ThreadPoolExecutor(16) as pool:
+                payloads = list(pool.map(client.create_payment_payload, [_required()] * 64))
+
+        assert len({p.payload["signature"] for p in payloads}) == 64
+        assert daemon.signed == 64
+        assert daemon.batches < 64
+
+    def test_signing_processes(self, tmp_path: Path) -> None:
+        path = tmp_path / "signer.sock"
+        daemon = SignerDaemon(
+            [EvmWallet(private_key=Account.create().key.hex())], path, processes=2
+        )
+        with _running(daemon):
+            client = x402ClientSync()
+            RemoteWallet(path).register(client)
+            payload = client.create_payment_payload(_required())
+
+        assert payload.payload["signature"].startswith("0x")
+
+    def test_daemon_errors_reach_the_worker(self, tmp_path: Path) -> None:
+        path = tmp_path / "signer.sock"
+        path.touch()  # Not a socket: must not be replaced.
+        with pytest.raises(OSError), _running(SignerDaemon([], path, processes=1)):
+            pass
+
+        path.unlink()
+        daemon = SignerDaemon(
+            [EvmWallet(private_key=Account.create().key.hex())], path, processes=1
+        )
+        with _running(daemon):
+            wallet = RemoteWallet(path)
+            with pytest.raises(RuntimeError, match="no wallet for exact payments"):
+                wallet.call(
+                    {
+                        "op": "sign",
+                        "version": 2,
+                        "requirements": _required("solana:mainnet")
+                        .accepts[0]
+                        .model_dump(by_alias=True, mode="json"),
+                    }
+                )
+
+    def test_malformed_requests_are_answered_with_an_error(self, tmp_path: Path) -> None:
+        path = tmp_path / "signer.sock"
+        daemon = SignerDaemon(
+            [EvmWallet(private_key=Account.create().key.hex())], path, processes=1
+        )
+        with _running(daemon):
+            wallet = RemoteWallet(path)
+            for request in (
+                {"op": "sign", "requirements": {}},
+                {"op": "sign", "version": 2, "requirements": None},
+                {"op": "sign", "version": "two", "requirements": {}},
+                ["op", "sign"],
+            ):
+                with pytest.raises(RuntimeError, match="malformed request"):
+                    wallet.call(request)  # type: ignore[arg-type]
+            schemes = wallet.call({"op": "schemes"})
+
+        assert schemes
+
+    async def test_async_clients_sign_off_the_event_loop(self, tmp_path: Path) -> None:
+        path = tmp_path / "signer.sock"
+        daemon = SignerDaemon(
+            [EvmWallet(private_key=Account.create().key.hex())], path, processes=1
+        )
+        threads: list[threading.Thread] = []
+
+        class Recording(RemoteWallet):
+            def call(self, request: dict[str, Any]) -> Any:
+                if request["op"] == "sign":
+                    threads.append(threading.current_thread())
+                return super().call(request)
+
+        challenge = {"payment-required": encode_payment_required_header(_required())}
+        with _running(daemon):
+            x402_http = await acreate_x402_http_client(wallet=Recording(path))
+            answers = await asyncio.gather(
+                *(x402_http.handle_402_response(challenge, b"") for _ in range(16))
+            )
+
+        assert len({payload.payload["signature"] for _, payload in answers}) == 16
+        assert threading.current_thread() not in threads
+        assert daemon.batches < 16
@@ -0,0 +1,128 @@
+"""Unit tests for single-flight request coalescing (_singleflight.py)."""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from tests._fakes import (
+    CountingX402ClientAsync,
+    CountingX402ClientSync,
+    PaywallAsyncTransport,
+    PaywallTransport,
+)
+from x402_openai._singleflight import coalesce_key
+from x402_openai._transport import AsyncX402Transport, X402Transport
+
+_URL = "https://example.com/v1/chat/completions"
+_BODY = {"model": "m", "messages": [{"role": "user", "content": "warmup"}]}
+
+
+class TestCoalesceKey:
+    """Verify which requests may be coalesced."""
+
+    def test_streaming_requests_are_excluded(self) -> None:
+        request = httpx.Request("POST", _URL, json={**_BODY, "stream": True})
+        assert coalesce_key(request) is None
+
+    def test_identical_bodies_share_a_key(self) -> None:
+        a = httpx.Request("POST", _URL, content=b'{"a":1,"b":2}')
+        b = httpx.Request("POST", _URL, content=b'{"b": 2, "a": 1}')
+        assert coalesce_key(a) == coalesce_key(b)
+
+    def test_different_credentials_do_not_share_a_key(self) -> None:
+        a = httpx.Request("POST", _URL, json=_BODY, headers={"Authorization": "Bearer a"})
+        b = httpx.Request("POST", _URL, json=_BODY, headers={"Authorization": "Bearer b"})
+        c = httpx.Request("POST", _URL, json=_BODY, extensions={"x402_wallet": "tenant-c"})
+        assert len({coalesce_key(a), coalesce_key(b), coalesce_key(c)}) == 3
+
+    def test_other_methods_are_excluded(self) -> None:
+        assert coalesce_key(httpx.Request("DELETE", _URL)) is None
+
+
+class TestSyncCoalescing:
+    """Verify thread-based coalescing in X402Transport."""
+
+    def test_concurrent_identical_requests_pay_once(self) -> None:
+        inner = PaywallTransport(delay=0.1)
+        x402 = CountingX402ClientSync()
+        client = httpx.Client(transport=X402Transport(x402, inner=inner, coalesce=True))
+
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            responses = list(pool.map(lambda _: client.post(_URL, json=_BODY), range(5)))
+
+        assert [r.json() for r in responses] == [{"ok": True}] * 5
+        assert x402.calls == 1
+        assert inner.calls == 2
+
+    def test_different_credentials_are_not_coalesced(self) -> None:
+        inner = PaywallTransport(delay=0.1)
+        x402 = CountingX402ClientSync()
+        client = httpx.Client(transport=X402Transport(x402, inner=inner, coalesce=True))
+
+        def post(token: str) -> httpx.Response:
+            return client.post(_URL, json=_BODY, headers={"Authorization": f"Bearer {token}"})
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            responses = list(pool.map(post, ["a", "b"]))
+
+        assert [r.status_code for r in responses] == [200, 200]
+        assert x402.calls == 2
+
+    def test_errors_propagate_to_every_waiter(self) -> None:
+        inner = PaywallTransport(delay=0.1, fail=True)
+        client = httpx.Client(
+            transport=X402Transport(CountingX402ClientSync(), inner=inner, coalesce=True)
+        )
+
+        def call() -> None:
+            with pytest.raises(httpx.ConnectError):
+                client.post(_URL, json=_BODY)
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            for future in [pool.submit(call) for _ in range(3)]:
+                future.result()
+        assert inner.calls == 1
+
+    def test_disabled_by_default(self) -> None:
+        inner = PaywallTransport(delay=0.1)
+        x402 = CountingX402ClientSync()
+        client = httpx.Client(transport=X402Transport(x402, inner=inner))
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            list(pool.map(lambda _: client.post(_URL, json=_BODY), range(3)))
+
+        assert x402.calls == 3
+
+
+class TestAsyncCoalescing:
+    """Verify task-based coalescing in AsyncX402Transport."""
+
+    async def test_concurrent_identical_requests_pay_once(self) -> None:
+        inner = PaywallAsyncTransport(delay=0.05)
+        x402 = CountingX402ClientAsync()
+        client = httpx.AsyncClient(transport=AsyncX402Transport(x402, inner=inner, coalesce=True))
+
+        responses = await asyncio.gather(*(client.post(_URL, json=_BODY) for _ in range(5)))
+
+        assert [r.json() for r in responses] == [{"ok": True}] * 5
+        assert x402.calls == 1
+        assert inner.calls == 2
+
+    async def test_cancelled_leader_does_not_cancel_waiters(self) -> None:
+        inner = PaywallAsyncTransport(delay=0.05)
+        client = httpx.AsyncClient(
+            transport=AsyncX402Transport(CountingX402ClientAsync(), inner=inner, coalesce=True)
+        )
+
+        leader = asyncio.ensure_future(client.post(_URL, json=_BODY))
+        await asyncio.sleep(0.01)
+        follower = asyncio.ensure_future(client.post(_URL, json=_BODY))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        response = await follower
+        assert response.json() == {"ok": True}
@@ -0,0 +1,112 @@
+"""Unit tests for the pooled Solana RPC client (_solana_rpc.py)."""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+import httpx
+import pytest
+
+pytest.importorskip("solana")
+
+from solders.keypair import Keypair
+from solders.pubkey import Pubkey
+from x402 import x402ClientSync
+from x402.mechanisms.svm import KeypairSigner
+
+from tests._fakes import StandInSolanaRpc
+from tests.test_blockhash import _requirements
+from x402_openai.wallets import BlockhashProvider, SolanaRpcPool, SvmWallet
+from x402_openai.wallets._svm_schemes import SvmScheme
+
+
+class TestSolanaRpcPool:
+    """Verify client sharing, mint caching and batching."""
+
+    def test_one_client_per_endpoint(self) -> None:
+        pool = SolanaRpcPool()
+
+        assert pool.client("http://a") is pool.client("http://a")
+        assert pool.client("http://a") is not pool.client("http://b")
+        pool.close()
+
+    def test_only_the_pooled_session_stays_open(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        sessions: list[httpx.Client] = []
+        init = httpx.Client.__init__
+
+        def record(self: httpx.Client, *args: Any, **kwargs: Any) -> None:
+            init(self, *args, **kwargs)
+            sessions.append(self)
+
+        monkeypatch.setattr(httpx.Client, "__init__", record)
+        client = SolanaRpcPool().client("http://a")
+
+        assert [s for s in sessions if not s.is_closed] == [client._provider.session]
+        client.close()
+
+    def test_shared_pool_is_process_wide(self) -> None:
+        assert SolanaRpcPool.shared() is SolanaRpcPool.shared()
+
+    def test_mint_info_is_fetched_once(self) -> None:
+        mint = Pubkey.from_string(str(Keypair().pubkey()))
+        with StandInSolanaRpc() as rpc:
+            pool = SolanaRpcPool()
+            first = pool.client(rpc.url).get_account_info(mint)
+            second = pool.client(rpc.url).get_account_info(mint)
+            pool.close()
+
+        assert first is second
+        assert rpc.count("getAccountInfo") == 1
+
+    def test_concurrent_calls_share_one_batch_request(self) -> None:
+        with StandInSolanaRpc() as rpc:
+            client = SolanaRpcPool(batch_window=0.1).client(rpc.url)
+            results: list[str] = []
+            threads = [
+                threading.Thread(
+                    target=lambda: results.append(
+                        str(client.get_latest_blockhash().value.blockhash)
+                    )
+                )
+                for _ in range(4)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            client.close()
+
+        assert len(set(results)) == 4
+        assert rpc.count("getLatestBlockhash") == 4
+        assert rpc.requests == 1
+
+    def test_rejects_negative_batch_window(self) -> None:
+        with pytest.raises(ValueError, match="batch_window"):
+            SolanaRpcPool(batch_window=-1)
+
+
+class TestPooledScheme:
+    """Verify that wallets sharing a pool share its clients."""
+
+    def test_wallets_share_mint_lookups(self) -> None:
+        requirements = _requirements()
+        with StandInSolanaRpc() as rpc:
+            pool = SolanaRpcPool()
+            blockhashes = BlockhashProvider(rpc=pool.client)
+            for _ in range(3):
+                scheme = SvmScheme(KeypairSigner(Keypair()), rpc.url, blockhashes, pool)
+                scheme.create_payment_payload(requirements)
+            blockhashes.close()
+            pool.close()
+
+        assert rpc.count("getAccountInfo") == 1
+        assert rpc.count("getLatestBlockhash") == 1
+
+    def test_wallet_registers_pooled_schemes(self) -> None:
+        client = x402ClientSync()
+        wallet = SvmWallet(private_key=str(Keypair()), rpc_pool=SolanaRpcPool())
+
+        wallet.register(client)
+
+        assert isinstance(client._schemes["solana:*"]["exact"], SvmScheme)
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
+from types import SimpleNamespace
 from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from x402_openai._wallet import _resolve_wallets
+from x402_openai._wallet import _resolve_wallets, acreate_x402_http_client
 from x402_openai.wallets._evm import EvmWallet
 from x402_openai.wallets._svm import SvmWallet
 
@@ -116,3 +119,55 @@ class TestBuildClient:
             )
         assert result is sentinel
         assert "policies" in caplog.text.lower()
+
+
+class _SlowWallet:
+    """Wallet whose registration blocks until every wallet has started it."""
+
+    def __init__(self, scheme: str, started: threading.Barrier, hook: Any) -> None:
+        self.scheme = SimpleNamespace(scheme=scheme)
+        self._started = started
+        self._hook = hook
+
+    def register(self, client: Any) -> None:
+        self._started.wait()  # Deadlocks unless the wallets register concurrently.
+        client.register("eip155:*", self.scheme)
+        client.on_after_payment_creation(self._hook)
+
+
+class TestAsyncCreate:
+    """Test that async construction registers wallets off the event loop."""
+
+    async def test_wallets_register_concurrently_in_order(self) -> None:
+        started = threading.Barrier(2, timeout=5)
+        hook = MagicMock()
+        first, second = _SlowWallet("a", started, hook), _SlowWallet("a", started, hook)
+        ticks = 0
+
+        async def tick() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        ticker = asyncio.create_task(tick())
+        x402_http = await acreate_x402_http_client(wallets=[first, second])
+        ticker.cancel()
+
+        client = x402_http._client
+        assert client._schemes["eip155:*"]["a"] is second.scheme
+        assert client._after_payment_creation_hooks == [hook]
+        assert ticks > 1
+
+    async def test_create_returns_a_wired_client(self) -> None:
+        from x402_openai import AsyncX402OpenAI
+        from x402_openai._transport import AsyncX402Transport
+
+        wallet = _SlowWallet("a", threading.Barrier(1), MagicMock())
+        client = await AsyncX402OpenAI.create(wallet=wallet, base_url="http://gateway/v1")
+        try:
+            transport = client._client._transport
+            assert isinstance(transport, AsyncX402Transport)
+            assert str(client.base_url) == "http://gateway/v1/"
+        finally:
+            await client.close()